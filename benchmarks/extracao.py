@@ -0,0 +1,205 @@
+"""
+Benchmark da extração de séries do BCB contra o servidor simulado.
+
+Mede o tempo total, séries por segundo e bytes por segundo dos modos de
+extração sequencial, concorrente, incremental e assíncrono, sem acesso à
+API real. O resultado é emitido em JSON para acompanhar regressões.
+
+Uso:
+    python -m benchmarks.extracao --series 20 --latencia 0.05 --saida resultado.json
+"""
+
+import argparse
+import asyncio
+import datetime
+import json
+import logging
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Any, Optional
+
+from benchmarks.servidor_simulado import ServidorSimulado
+from src.utils.configuracao import obter_configuracao
+from src.dados.extratores.bcb import ExtratorBCB
+from src.dados.extratores.cliente_http import ClienteHTTP, aiohttp
+
+MODOS = ["sequencial", "concorrente", "incremental", "assincrono"]
+
+
+def criar_extrator(modo: str, diretorio: str, servidor: ServidorSimulado, num_series: int,
+                   cliente_http: ClienteHTTP) -> ExtratorBCB:
+    """
+    Cria um extrator apontado para o servidor simulado, com séries sintéticas.
+
+    Args:
+        modo: Modo de extração.
+        diretorio: Diretório de saída dos arquivos.
+        servidor: Servidor simulado em execução.
+        num_series: Número de séries sintéticas.
+        cliente_http: Cliente HTTP compartilhado pelas execuções.
+
+    Returns:
+        Extrator configurado.
+    """
+    if modo == "assincrono":
+        from src.dados.extratores.bcb_assincrono import ExtratorBCBAssincrono
+        extrator = ExtratorBCBAssincrono(diretorio)
+        extrator.cliente_http = cliente_http
+    else:
+        extrator = ExtratorBCB(diretorio, cliente_http=cliente_http)
+    extrator.url_base = servidor.url_sgs
+    extrator.series = {str(1000 + indice): f"serie_{indice:03d}" for indice in range(num_series)}
+    return extrator
+
+
+def executar_modo(modo: str, extrator: ExtratorBCB, dias_retroativos: int, max_concorrencia: int) -> Dict[str, bool]:
+    """
+    Executa uma extração no modo indicado.
+
+    Args:
+        modo: Modo de extração.
+        extrator: Extrator configurado.
+        dias_retroativos: Janela de extração, em dias.
+        max_concorrencia: Concorrência dos modos paralelos.
+
+    Returns:
+        Status de extração de cada série.
+    """
+    if modo == "sequencial":
+        return extrator.extrair_todas_series(dias_retroativos, max_concorrencia=1, incremental=False)
+    if modo == "concorrente":
+        return extrator.extrair_todas_series(dias_retroativos, max_concorrencia=max_concorrencia, incremental=False)
+    if modo == "incremental":
+        return extrator.extrair_todas_series(dias_retroativos, max_concorrencia=max_concorrencia, incremental=True)
+    return asyncio.run(extrator.extrair_todas_series_async(
+        dias_retroativos, max_concorrencia=max_concorrencia, incremental=False
+    ))
+
+
+def medir_modo(modo: str, servidor: ServidorSimulado, parametros: Dict[str, Any],
+               cliente_http: ClienteHTTP) -> Dict[str, Any]:
+    """
+    Mede um modo de extração ao longo de várias repetições.
+
+    Cada repetição usa um diretório vazio; no modo incremental, uma extração
+    completa (não medida) prepara os dados armazenados antes da medição.
+
+    Args:
+        modo: Modo de extração.
+        servidor: Servidor simulado em execução.
+        parametros: Parâmetros do benchmark.
+        cliente_http: Cliente HTTP compartilhado pelas execuções.
+
+    Returns:
+        Dicionário com as medições de cada repetição e os valores medianos.
+    """
+    repeticoes = []
+    for _ in range(parametros["repeticoes"]):
+        with tempfile.TemporaryDirectory(prefix=f"benchmark_{modo}_") as diretorio:
+            extrator = criar_extrator(modo, diretorio, servidor, parametros["series"], cliente_http)
+            if modo == "incremental":
+                executar_modo("concorrente", extrator, parametros["dias_retroativos"], parametros["max_concorrencia"])
+
+            servidor.zerar_estatisticas()
+            inicio = time.perf_counter()
+            resultados = executar_modo(modo, extrator, parametros["dias_retroativos"], parametros["max_concorrencia"])
+            tempo = time.perf_counter() - inicio
+            estatisticas = dict(servidor.estatisticas)
+
+        series_com_sucesso = sum(1 for sucesso in resultados.values() if sucesso)
+        repeticoes.append({
+            "tempo_s": round(tempo, 4),
+            "series_com_sucesso": series_com_sucesso,
+            "series_por_segundo": round(series_com_sucesso / tempo, 3) if tempo > 0 else None,
+            "bytes_por_segundo": round(estatisticas["bytes_enviados"] / tempo, 1) if tempo > 0 else None,
+            **estatisticas
+        })
+
+    return {
+        "modo": modo,
+        "tempo_mediano_s": statistics.median(r["tempo_s"] for r in repeticoes),
+        "series_por_segundo": statistics.median(r["series_por_segundo"] or 0 for r in repeticoes),
+        "bytes_por_segundo": statistics.median(r["bytes_por_segundo"] or 0 for r in repeticoes),
+        "repeticoes": repeticoes
+    }
+
+
+def obter_commit() -> Optional[str]:
+    """Retorna o commit atual do repositório, se disponível."""
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip() or None
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def executar(argumentos: List[str] = None) -> Dict[str, Any]:
+    """Função principal para execução direta do benchmark."""
+    config = obter_configuracao()["extracao"]
+    parser = argparse.ArgumentParser(description="Benchmark da extração de séries do BCB contra um servidor simulado.")
+    parser.add_argument("--modos", nargs="+", choices=MODOS, default=MODOS)
+    parser.add_argument("--series", type=int, default=len(config["bcb"]["series"]), help="Número de séries sintéticas.")
+    parser.add_argument("--dias-retroativos", type=int, default=config["bcb"]["dias_retroativos"])
+    parser.add_argument("--repeticoes", type=int, default=3)
+    parser.add_argument("--max-concorrencia", type=int, default=config["bcb"]["max_concorrencia"])
+    parser.add_argument("--latencia", type=float, default=0.05, help="Atraso de cada resposta do servidor, em segundos.")
+    parser.add_argument("--taxa-erro", type=float, default=0.0, help="Probabilidade de o servidor responder HTTP 503.")
+    parser.add_argument("--dias-por-observacao", type=int, default=1, help="Intervalo, em dias, entre observações.")
+    parser.add_argument("--max-dias-por-consulta", type=int, default=10 * 365)
+    parser.add_argument("--requisicoes-por-segundo", type=float, default=0,
+                        help="Limite de requisições por segundo do cliente (0 desabilita).")
+    parser.add_argument("--saida", help="Arquivo JSON de saída (padrão: saída padrão).")
+    args = parser.parse_args(argumentos)
+
+    # Mantém a saída limpa; erros da extração continuam visíveis
+    logging.basicConfig(level=logging.ERROR, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    modos = [modo for modo in args.modos if modo != "assincrono" or aiohttp is not None]
+    if len(modos) < len(args.modos):
+        print("Modo assíncrono ignorado: aiohttp não instalado.", file=sys.stderr)
+
+    parametros = {
+        "series": args.series,
+        "dias_retroativos": args.dias_retroativos,
+        "repeticoes": max(1, args.repeticoes),
+        "max_concorrencia": args.max_concorrencia,
+        "latencia_s": args.latencia,
+        "taxa_erro": args.taxa_erro,
+        "dias_por_observacao": args.dias_por_observacao,
+        "max_dias_por_consulta": args.max_dias_por_consulta,
+        "requisicoes_por_segundo": args.requisicoes_por_segundo
+    }
+
+    resultados = []
+    with ServidorSimulado(args.latencia, args.taxa_erro, args.dias_por_observacao, args.max_dias_por_consulta) as servidor:
+        with ClienteHTTP(requisicoes_por_segundo=args.requisicoes_por_segundo) as cliente_http:
+            for modo in modos:
+                resultados.append(medir_modo(modo, servidor, parametros, cliente_http))
+
+    relatorio = {
+        "benchmark": "extracao",
+        "data_execucao": datetime.datetime.now().isoformat(timespec="seconds"),
+        "ambiente": {
+            "python": platform.python_version(),
+            "plataforma": platform.platform(),
+            "commit": obter_commit()
+        },
+        "parametros": parametros,
+        "resultados": resultados
+    }
+
+    saida = json.dumps(relatorio, indent=4, ensure_ascii=False)
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as arquivo:
+            arquivo.write(saida + "\n")
+    else:
+        print(saida)
+    return relatorio
+
+
+if __name__ == "__main__":
+    executar()
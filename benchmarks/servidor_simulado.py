@@ -0,0 +1,284 @@
+"""
+Servidor HTTP local que simula as APIs do SGS (BCB) e do SIDRA (IBGE).
+
+Este módulo contém um servidor para testes e benchmarks de extração sem
+acesso à internet. Os extratores são apontados para ele trocando o atributo
+url_base (ver ServidorSimulado.url_sgs e ServidorSimulado.url_sidra).
+
+Os valores gerados são determinísticos (dependem apenas do código da série
+e da data), de modo que extrações repetidas produzem o mesmo conteúdo.
+São configuráveis a latência de cada resposta, a taxa de erros transitórios
+(HTTP 503), o tamanho da resposta (frequência das observações) e o limite de
+dias por consulta do SGS.
+"""
+
+import datetime
+import json
+import random
+import re
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Any, Optional
+from urllib.parse import urlparse, parse_qs
+
+# Rotas reconhecidas pelo servidor
+ROTA_SGS = re.compile(r"^/dados/serie/bcdata\.sgs\.(\d+)/dados$")
+ROTA_SIDRA = re.compile(r"^/api/v3/agregados/(\d+)/periodos/(\d{6})-(\d{6})/variaveis/(\d+)$")
+
+
+def gerar_valor(codigo: str, ordinal: int) -> float:
+    """
+    Gera um valor determinístico para uma série em uma data.
+
+    Args:
+        codigo: Código da série.
+        ordinal: Data como ordinal (datetime.date.toordinal) ou índice do período.
+
+    Returns:
+        Valor com duas casas decimais.
+    """
+    semente = zlib.crc32(f"{codigo}:{ordinal}".encode())
+    return round(10 + (semente % 100000) / 1000, 2)
+
+
+class ServidorSimulado:
+    """
+    Servidor local que responde como o SGS e o SIDRA, executado em uma thread.
+
+    Attributes:
+        latencia (float): Atraso de cada resposta, em segundos.
+        taxa_erro (float): Probabilidade (0 a 1) de responder HTTP 503.
+        dias_por_observacao (int): Intervalo entre observações das séries do SGS
+            (1 para séries diárias, 30 para aproximadamente mensais).
+        max_dias_por_consulta (int): Maior intervalo aceito por consulta ao SGS
+            (consultas maiores recebem HTTP 400, como no SGS para séries diárias).
+        agregados_trimestrais (set): Agregados do SIDRA com períodos trimestrais.
+        estatisticas (Dict[str, int]): Contadores de requisições, erros e bytes enviados.
+    """
+
+    def __init__(self, latencia: float = 0.05, taxa_erro: float = 0.0, dias_por_observacao: int = 1,
+                 max_dias_por_consulta: int = 10 * 365, agregados_trimestrais: Optional[List[int]] = None,
+                 porta: int = 0, semente: int = 0):
+        """
+        Inicializa o servidor simulado (sem iniciá-lo).
+
+        Args:
+            latencia: Atraso de cada resposta, em segundos.
+            taxa_erro: Probabilidade de responder HTTP 503.
+            dias_por_observacao: Intervalo, em dias, entre observações do SGS.
+            max_dias_por_consulta: Maior intervalo de datas aceito por consulta ao SGS.
+            agregados_trimestrais: Agregados do SIDRA com períodos trimestrais
+                (os demais são mensais).
+            porta: Porta TCP (0 escolhe uma porta livre).
+            semente: Semente do sorteio de erros.
+        """
+        self.latencia = latencia
+        self.taxa_erro = taxa_erro
+        self.dias_por_observacao = max(1, dias_por_observacao)
+        self.max_dias_por_consulta = max_dias_por_consulta
+        self.agregados_trimestrais = set(agregados_trimestrais if agregados_trimestrais is not None else [1846])
+        self.estatisticas: Dict[str, int] = {}
+        self._sorteio = random.Random(semente)
+        self._trava = threading.Lock()
+        self._servidor = ThreadingHTTPServer(("127.0.0.1", porta), self._criar_manipulador())
+        self._servidor.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+        self.zerar_estatisticas()
+
+    @property
+    def endereco(self) -> str:
+        """Endereço base do servidor (http://host:porta)."""
+        host, porta = self._servidor.server_address[:2]
+        return f"http://{host}:{porta}"
+
+    @property
+    def url_sgs(self) -> str:
+        """Valor de ExtratorBCB.url_base para usar este servidor."""
+        return self.endereco + "/dados/serie/bcdata.sgs.{}/dados"
+
+    @property
+    def url_sidra(self) -> str:
+        """Valor de ExtratorIBGE.url_base para usar este servidor."""
+        return self.endereco + "/api/v3/agregados/{agregado}/periodos/{periodos}/variaveis/{variavel}"
+
+    def iniciar(self) -> "ServidorSimulado":
+        """Inicia o servidor em uma thread de segundo plano."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._servidor.serve_forever, name="servidor_simulado", daemon=True)
+            self._thread.start()
+        return self
+
+    def parar(self) -> None:
+        """Encerra o servidor e libera a porta."""
+        if self._thread is not None:
+            self._servidor.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._servidor.server_close()
+
+    def __enter__(self):
+        return self.iniciar()
+
+    def __exit__(self, *args):
+        self.parar()
+
+    def zerar_estatisticas(self) -> None:
+        """Zera os contadores de requisições, erros e bytes enviados."""
+        with self._trava:
+            self.estatisticas = {"requisicoes": 0, "erros_simulados": 0, "bytes_enviados": 0}
+
+    def _contabilizar(self, bytes_enviados: int, erro: bool) -> None:
+        with self._trava:
+            self.estatisticas["requisicoes"] += 1
+            self.estatisticas["bytes_enviados"] += bytes_enviados
+            if erro:
+                self.estatisticas["erros_simulados"] += 1
+
+    def _sortear_erro(self) -> bool:
+        if self.taxa_erro <= 0:
+            return False
+        with self._trava:
+            return self._sorteio.random() < self.taxa_erro
+
+    def gerar_dados_sgs(self, codigo: str, data_inicial: datetime.date, data_final: datetime.date) -> List[Dict[str, str]]:
+        """
+        Gera a resposta do SGS para uma série e um intervalo de datas.
+
+        Args:
+            codigo: Código da série.
+            data_inicial: Data inicial.
+            data_final: Data final (inclusive).
+
+        Returns:
+            Lista de observações no formato do SGS (data DD/MM/AAAA, valor com vírgula).
+        """
+        # Observações alinhadas a datas fixas, para que janelas e extrações incrementais coincidam
+        primeiro = data_inicial.toordinal()
+        primeiro += -primeiro % self.dias_por_observacao
+        return [
+            {
+                "data": datetime.date.fromordinal(ordinal).strftime("%d/%m/%Y"),
+                "valor": f"{gerar_valor(codigo, ordinal):.2f}".replace(".", ",")
+            }
+            for ordinal in range(primeiro, data_final.toordinal() + 1, self.dias_por_observacao)
+        ]
+
+    def gerar_dados_sidra(self, agregado: int, variavel: str, periodo_inicio: str, periodo_fim: str) -> List[Dict[str, Any]]:
+        """
+        Gera a resposta da API de agregados do IBGE para um intervalo de períodos.
+
+        Args:
+            agregado: Identificador do agregado.
+            variavel: Identificador da variável.
+            periodo_inicio: Código do período inicial (AAAAMM ou AAAATT).
+            periodo_fim: Código do período final (AAAAMM ou AAAATT).
+
+        Returns:
+            Resposta no formato da API (lista de variáveis com resultados e séries).
+        """
+        subperiodos = 4 if agregado in self.agregados_trimestrais else 12
+        serie = {}
+        for ano in range(int(periodo_inicio[:4]), int(periodo_fim[:4]) + 1):
+            for subperiodo in range(1, subperiodos + 1):
+                codigo = f"{ano}{subperiodo:02d}"
+                if periodo_inicio <= codigo <= periodo_fim:
+                    serie[codigo] = f"{gerar_valor(str(agregado), ano * 100 + subperiodo):.1f}"
+        return [{
+            "id": variavel,
+            "resultados": [{
+                "classificacoes": [],
+                "series": [{"localidade": {"id": "1", "nome": "Brasil"}, "serie": serie}]
+            }]
+        }]
+
+    def _criar_manipulador(self):
+        servidor = self
+
+        class Manipulador(BaseHTTPRequestHandler):
+            # HTTP/1.1 para permitir conexões persistentes (keep-alive) do cliente
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                if servidor.latencia > 0:
+                    time.sleep(servidor.latencia)
+
+                if servidor._sortear_erro():
+                    self._responder(503, {"erro": "Serviço indisponível (simulado)"}, erro=True)
+                    return
+
+                url = urlparse(self.path)
+                parametros = {chave: valores[0] for chave, valores in parse_qs(url.query).items()}
+
+                rota = ROTA_SGS.match(url.path)
+                if rota:
+                    self._responder_sgs(rota.group(1), parametros)
+                    return
+
+                rota = ROTA_SIDRA.match(url.path)
+                if rota:
+                    agregado, inicio, fim, variavel = rota.groups()
+                    self._responder(200, servidor.gerar_dados_sidra(int(agregado), variavel, inicio, fim))
+                    return
+
+                self._responder(404, {"erro": "Rota não encontrada"})
+
+            def _responder_sgs(self, codigo: str, parametros: Dict[str, str]) -> None:
+                try:
+                    inicio = datetime.datetime.strptime(parametros["dataInicial"], "%d/%m/%Y").date()
+                    fim = datetime.datetime.strptime(parametros["dataFinal"], "%d/%m/%Y").date()
+                except (KeyError, ValueError):
+                    self._responder(400, {"erro": "Parâmetros dataInicial e dataFinal obrigatórios (DD/MM/AAAA)"})
+                    return
+
+                if (fim - inicio).days + 1 > servidor.max_dias_por_consulta:
+                    self._responder(400, {"erro": f"Intervalo maior que {servidor.max_dias_por_consulta} dias"})
+                    return
+
+                dados = servidor.gerar_dados_sgs(codigo, inicio, fim)
+                if not dados:
+                    # O SGS responde 404 quando não há observações no período
+                    self._responder(404, {"erro": "Sem dados no período"})
+                    return
+                self._responder(200, dados)
+
+            def _responder(self, status: int, corpo: Any, erro: bool = False) -> None:
+                conteudo = json.dumps(corpo).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(conteudo)))
+                self.end_headers()
+                self.wfile.write(conteudo)
+                servidor._contabilizar(len(conteudo), erro)
+
+            def log_message(self, formato, *args):
+                # Silencia o log de acesso padrão do http.server
+                pass
+
+        return Manipulador
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Servidor local que simula as APIs do SGS e do SIDRA.")
+    parser.add_argument("--porta", type=int, default=8080)
+    parser.add_argument("--latencia", type=float, default=0.05, help="Atraso de cada resposta, em segundos.")
+    parser.add_argument("--taxa-erro", type=float, default=0.0, help="Probabilidade de responder HTTP 503.")
+    parser.add_argument("--dias-por-observacao", type=int, default=1, help="Intervalo, em dias, entre observações do SGS.")
+    parser.add_argument("--max-dias-por-consulta", type=int, default=10 * 365,
+                        help="Maior intervalo de datas aceito por consulta ao SGS.")
+    args = parser.parse_args()
+
+    servidor = ServidorSimulado(args.latencia, args.taxa_erro, args.dias_por_observacao,
+                                args.max_dias_por_consulta, porta=args.porta)
+    print(f"SGS:   {servidor.url_sgs}")
+    print(f"SIDRA: {servidor.url_sidra}")
+    try:
+        servidor.iniciar()
+        servidor._thread.join()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.parar()
@@ -0,0 +1,603 @@
+"""
+Módulo de armazenamento das séries temporais extraídas.
+
+Este módulo define formatos intercambiáveis de persistência para as séries
+(data, valor) usadas pelos extratores, pelo pipeline de previsão e pelo
+dashboard:
+- JSON: lista de objetos {"data", "valor"}, legível e versionada no git
+- Parquet: formato colunar compacto (data como date32, valor como float64)
+- Binário: arrays de largura fixa mapeados em memória (leitura sem cópia)
+"""
+
+import os
+import json
+import struct
+import hashlib
+import logging
+import tempfile
+import datetime
+import threading
+from typing import Callable, Dict, List, Optional, Tuple, Type, Any
+
+import numpy as np
+import pandas as pd
+
+from src.utils.configuracao import obter_configuracao
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Dependência opcional: sem ela, apenas JSON fica disponível
+    pa = None
+    pq = None
+
+# Configurar logger
+logger = logging.getLogger(__name__)
+
+
+def escrever_atomico(caminho_arquivo: str, escritor: Callable[[str], None]) -> None:
+    """
+    Escreve um arquivo de forma atômica (arquivo temporário + renomeação).
+
+    Args:
+        caminho_arquivo: Caminho final do arquivo.
+        escritor: Função que recebe o caminho temporário e escreve o conteúdo nele.
+
+    Raises:
+        OSError: Se a escrita ou a renomeação falhar (o destino não é alterado).
+    """
+    diretorio, nome_arquivo = os.path.split(caminho_arquivo)
+    _, extensao = os.path.splitext(nome_arquivo)
+    descritor, caminho_temporario = tempfile.mkstemp(dir=diretorio or ".", prefix=f".{nome_arquivo}.", suffix=f".tmp{extensao}")
+    os.close(descritor)
+    try:
+        escritor(caminho_temporario)
+        os.chmod(caminho_temporario, 0o644)  # mkstemp cria o arquivo com permissão 0600
+        with open(caminho_temporario, 'rb') as f:
+            os.fsync(f.fileno())
+        os.replace(caminho_temporario, caminho_arquivo)
+    except BaseException:
+        if os.path.exists(caminho_temporario):
+            os.remove(caminho_temporario)
+        raise
+
+
+def calcular_hash_serie(df: pd.DataFrame) -> str:
+    """
+    Calcula o hash do conteúdo de uma série, independente do formato de arquivo.
+
+    Args:
+        df: DataFrame com as colunas 'data' e 'valor'.
+
+    Returns:
+        Hash SHA-256 (hexadecimal) das datas e valores.
+    """
+    datas = np.ascontiguousarray(df['data'].to_numpy().astype('datetime64[ns]').view('<i8'))
+    valores = np.ascontiguousarray(df['valor'].to_numpy(dtype='<f8'))
+    resumo = hashlib.sha256()
+    resumo.update(struct.pack('<Q', len(datas)))
+    resumo.update(datas.tobytes())
+    resumo.update(valores.tobytes())
+    return resumo.hexdigest()
+
+
+def criar_serie_vazia() -> pd.DataFrame:
+    """Retorna um DataFrame vazio com as colunas padrão de uma série."""
+    return pd.DataFrame({'data': pd.Series(dtype='datetime64[ns]'), 'valor': pd.Series(dtype='float64')})
+
+
+class ArmazenamentoSeries:
+    """
+    Classe base para formatos de armazenamento de séries.
+
+    Cada série é um arquivo <nome><extensao> no diretório configurado, com as
+    colunas 'data' (datetime64) e 'valor' (float64).
+
+    Attributes:
+        formato (str): Identificador do formato.
+        extensao (str): Extensão dos arquivos gerados.
+        diretorio (str): Diretório onde as séries são armazenadas.
+    """
+
+    formato: str = None
+    extensao: str = None
+
+    def __init__(self, diretorio: str):
+        """
+        Inicializa o armazenamento.
+
+        Args:
+            diretorio: Diretório onde as séries são armazenadas.
+        """
+        self.diretorio = diretorio
+
+    def caminho(self, nome_serie: str) -> str:
+        """Retorna o caminho do arquivo de uma série."""
+        return os.path.join(self.diretorio, f"{nome_serie}{self.extensao}")
+
+    def existe(self, nome_serie: str) -> bool:
+        """Verifica se a série está armazenada neste formato."""
+        return os.path.exists(self.caminho(nome_serie))
+
+    def salvar(self, nome_serie: str, df: pd.DataFrame) -> bool:
+        """
+        Salva uma série de forma atômica.
+
+        O arquivo é escrito em um temporário no mesmo diretório e só então
+        renomeado sobre o destino, de modo que uma falha no meio da escrita
+        nunca deixa um arquivo truncado.
+
+        Args:
+            nome_serie: Nome da série.
+            df: DataFrame com as colunas 'data' e 'valor'.
+
+        Returns:
+            True se a série foi salva com sucesso, False caso contrário.
+        """
+        caminho_arquivo = self.caminho(nome_serie)
+        try:
+            os.makedirs(self.diretorio, exist_ok=True)
+            escrever_atomico(caminho_arquivo, lambda caminho_temporario: self._escrever(caminho_temporario, df))
+            logger.info(f"Dados de {nome_serie} salvos em {caminho_arquivo}")
+            return True
+        except (IOError, OSError, ValueError) as e:
+            logger.error(f"Erro ao salvar o arquivo {caminho_arquivo}: {e}")
+            return False
+
+    def carregar(self, nome_serie: str) -> pd.DataFrame:
+        """
+        Carrega uma série.
+
+        Args:
+            nome_serie: Nome da série.
+
+        Returns:
+            DataFrame com as colunas 'data' e 'valor' ou DataFrame vazio se o
+            arquivo não existir ou não puder ser lido.
+        """
+        caminho_arquivo = self.caminho(nome_serie)
+        if not os.path.exists(caminho_arquivo):
+            return criar_serie_vazia()
+
+        try:
+            return self._ler(caminho_arquivo)
+        except Exception as e:
+            logger.warning(f"Erro ao carregar arquivo {caminho_arquivo}: {e}")
+            return criar_serie_vazia()
+
+    def _escrever(self, caminho_arquivo: str, df: pd.DataFrame) -> None:
+        raise NotImplementedError
+
+    def _ler(self, caminho_arquivo: str) -> pd.DataFrame:
+        raise NotImplementedError
+
+
+class ArmazenamentoJSON(ArmazenamentoSeries):
+    """Armazenamento em JSON (lista de objetos {"data": "YYYY-MM-DD", "valor": float})."""
+
+    formato = "json"
+    extensao = ".json"
+
+    def _escrever(self, caminho_arquivo: str, df: pd.DataFrame) -> None:
+        datas_iso = df['data'].to_numpy().astype('datetime64[D]').astype(str).tolist()
+        valores = df['valor'].astype('float64').tolist()
+        dados = [{'data': data, 'valor': valor} for data, valor in zip(datas_iso, valores)]
+
+        with open(caminho_arquivo, 'w', encoding='utf-8') as f:
+            json.dump(dados, f, ensure_ascii=False, indent=4)
+
+    def _ler(self, caminho_arquivo: str) -> pd.DataFrame:
+        with open(caminho_arquivo, 'r', encoding='utf-8') as f:
+            dados = json.load(f)
+
+        if not dados:
+            return criar_serie_vazia()
+
+        df = pd.DataFrame.from_records(dados, columns=['data', 'valor'])
+        df['data'] = pd.to_datetime(df['data'], format='%Y-%m-%d', errors='coerce').astype('datetime64[ns]')
+        df['valor'] = pd.to_numeric(df['valor'], errors='coerce')
+        return df.dropna(subset=['data']).reset_index(drop=True)
+
+
+class ArmazenamentoParquet(ArmazenamentoSeries):
+    """Armazenamento colunar em Parquet (data como date32, valor como float64)."""
+
+    formato = "parquet"
+    extensao = ".parquet"
+
+    def _escrever(self, caminho_arquivo: str, df: pd.DataFrame) -> None:
+        tabela = pa.table({
+            'data': pa.array(df['data'].to_numpy().astype('datetime64[D]'), type=pa.date32()),
+            'valor': pa.array(df['valor'].to_numpy(dtype='float64'), type=pa.float64())
+        })
+        pq.write_table(tabela, caminho_arquivo, compression='zstd')
+
+    def _ler(self, caminho_arquivo: str) -> pd.DataFrame:
+        tabela = pq.read_table(caminho_arquivo, columns=['data', 'valor'])
+        return pd.DataFrame({
+            'data': tabela.column('data').to_numpy().astype('datetime64[ns]'),
+            'valor': tabela.column('valor').to_numpy()
+        })
+
+
+class ArmazenamentoBinario(ArmazenamentoSeries):
+    """
+    Armazenamento binário mapeado em memória.
+
+    Layout do arquivo (little-endian):
+    - Cabeçalho de 32 bytes: assinatura (8 bytes), número de linhas (uint64)
+      e 16 bytes reservados
+    - Datas: n valores int64 (datetime64[ns])
+    - Valores: n valores float64
+
+    A leitura usa mmap e devolve um DataFrame cujas colunas apontam
+    diretamente para as páginas do arquivo, sem cópia. Processos que leem a
+    mesma série compartilham uma única cópia no cache de páginas do sistema.
+    A escrita atômica da classe base (arquivo novo + renomeação) garante que
+    leitores com o arquivo mapeado nunca o vejam truncado.
+    """
+
+    formato = "binario"
+    extensao = ".serie"
+
+    ASSINATURA = b"TSERIE01"
+    CABECALHO = struct.Struct("<8sQ16x")
+
+    def _escrever(self, caminho_arquivo: str, df: pd.DataFrame) -> None:
+        datas = np.ascontiguousarray(df['data'].to_numpy().astype('datetime64[ns]').view('<i8'))
+        valores = np.ascontiguousarray(df['valor'].to_numpy(dtype='<f8'))
+
+        with open(caminho_arquivo, 'wb') as f:
+            f.write(self.CABECALHO.pack(self.ASSINATURA, len(datas)))
+            f.write(datas.tobytes())
+            f.write(valores.tobytes())
+
+    def _ler(self, caminho_arquivo: str) -> pd.DataFrame:
+        if os.path.getsize(caminho_arquivo) == self.CABECALHO.size:
+            return criar_serie_vazia()
+
+        mapa = np.memmap(caminho_arquivo, dtype=np.uint8, mode='r')
+        assinatura, num_linhas = self.CABECALHO.unpack_from(mapa)
+        if assinatura != self.ASSINATURA:
+            raise ValueError("assinatura de arquivo de série inválida")
+        if mapa.size != self.CABECALHO.size + 16 * num_linhas:
+            raise ValueError("tamanho do arquivo de série inconsistente com o cabeçalho")
+
+        inicio_valores = self.CABECALHO.size + 8 * num_linhas
+        datas = np.frombuffer(mapa, dtype='<M8[ns]', count=num_linhas, offset=self.CABECALHO.size)
+        valores = np.frombuffer(mapa, dtype='<f8', count=num_linhas, offset=inicio_valores)
+        return pd.DataFrame({'data': datas, 'valor': valores}, copy=False)
+
+
+FORMATOS_ARMAZENAMENTO: Dict[str, Type[ArmazenamentoSeries]] = {
+    ArmazenamentoJSON.formato: ArmazenamentoJSON,
+    ArmazenamentoParquet.formato: ArmazenamentoParquet,
+    ArmazenamentoBinario.formato: ArmazenamentoBinario,
+}
+
+
+def formato_disponivel(formato: str) -> bool:
+    """Verifica se um formato é conhecido e tem suas dependências instaladas."""
+    if formato == ArmazenamentoParquet.formato:
+        return pq is not None
+    return formato in FORMATOS_ARMAZENAMENTO
+
+
+def obter_armazenamento(formato: str = None, diretorio: str = None) -> ArmazenamentoSeries:
+    """
+    Cria o armazenamento para um formato.
+
+    Args:
+        formato: Formato de armazenamento (padrão: CONFIGURACAO_ARMAZENAMENTO["formato"]).
+        diretorio: Diretório das séries (padrão: diretório de dados do projeto).
+
+    Returns:
+        Instância de ArmazenamentoSeries. Se o formato não estiver disponível,
+        retorna o armazenamento em JSON.
+    """
+    config = obter_configuracao()
+    formato = formato or config["armazenamento"]["formato"]
+    diretorio = diretorio or config["caminhos"]["diretorio_dados"]
+
+    if not formato_disponivel(formato):
+        logger.warning(f"Formato de armazenamento '{formato}' indisponível; usando JSON.")
+        formato = ArmazenamentoJSON.formato
+
+    return FORMATOS_ARMAZENAMENTO[formato](diretorio)
+
+
+def inferir_frequencia(datas: np.ndarray) -> Optional[str]:
+    """
+    Infere a frequência de uma série pela mediana do intervalo entre observações.
+
+    Args:
+        datas: Array datetime64 ordenado.
+
+    Returns:
+        'diaria', 'semanal', 'mensal', 'trimestral' ou 'anual', ou None se
+        houver menos de duas observações.
+    """
+    if len(datas) < 2:
+        return None
+
+    intervalo = float(np.median(np.diff(datas.astype('datetime64[D]').astype('int64'))))
+    if intervalo <= 4:  # Séries diárias de dias úteis têm saltos de fim de semana
+        return "diaria"
+    if intervalo <= 8:
+        return "semanal"
+    if intervalo <= 31:
+        return "mensal"
+    if intervalo <= 92:
+        return "trimestral"
+    return "anual"
+
+
+def calcular_metadados_serie(df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Calcula os metadados de catálogo de uma série.
+
+    Args:
+        df: DataFrame ordenado com as colunas 'data' e 'valor'.
+
+    Returns:
+        Dicionário com número de linhas, datas mínima e máxima (ISO),
+        frequência inferida e último valor.
+    """
+    if df.empty:
+        return {"linhas": 0, "data_min": None, "data_max": None, "frequencia": None, "ultimo_valor": None}
+
+    datas = df['data'].to_numpy()
+    return {
+        "linhas": int(len(df)),
+        "data_min": str(datas[0].astype('datetime64[D]')),
+        "data_max": str(datas[-1].astype('datetime64[D]')),
+        "frequencia": inferir_frequencia(datas),
+        "ultimo_valor": float(df['valor'].iloc[-1])
+    }
+
+
+class ManifestoSeries:
+    """
+    Manifesto (catálogo) das séries armazenadas.
+
+    Para cada série registra o hash de conteúdo, os arquivos e formatos
+    gravados, número de linhas, datas mínima e máxima, frequência, último
+    valor e horário da última atualização. Permite pular a regravação de
+    séries inalteradas, informa às etapas seguintes (previsões, invalidação
+    de cache) quais séries mudaram e deixa o dashboard montar seletores e
+    métricas lendo um único arquivo pequeno.
+
+    Attributes:
+        caminho (str): Caminho do arquivo de manifesto.
+        series (Dict[str, Dict[str, Any]]): Entradas do manifesto por nome de série.
+    """
+
+    NOME_ARQUIVO = "manifesto.json"
+
+    def __init__(self, diretorio: str):
+        """
+        Inicializa o manifesto, carregando o arquivo existente (se houver).
+
+        Args:
+            diretorio: Diretório das séries, onde o manifesto é gravado.
+        """
+        self.caminho = os.path.join(diretorio, self.NOME_ARQUIVO)
+        self.series: Dict[str, Dict[str, Any]] = self._ler()
+        self._alteradas = set()
+        self._trava = threading.Lock()
+
+    def _ler(self) -> Dict[str, Dict[str, Any]]:
+        if not os.path.exists(self.caminho):
+            return {}
+        try:
+            with open(self.caminho, 'r', encoding='utf-8') as f:
+                return json.load(f).get("series", {})
+        except (IOError, ValueError) as e:
+            logger.warning(f"Erro ao ler manifesto {self.caminho}, será recriado: {e}")
+            return {}
+
+    def obter(self, nome_serie: str) -> Optional[Dict[str, Any]]:
+        """Retorna a entrada de uma série no manifesto ou None se não houver."""
+        with self._trava:
+            entrada = self.series.get(nome_serie)
+            return dict(entrada) if entrada else None
+
+    def alterada(self, nome_serie: str, hash_conteudo: str) -> bool:
+        """Verifica se o hash informado difere do registrado para a série."""
+        entrada = self.obter(nome_serie)
+        return entrada is None or entrada.get("hash") != hash_conteudo
+
+    def registrar(self, nome_serie: str, hash_conteudo: str, **metadados: Any) -> None:
+        """
+        Registra o novo conteúdo de uma série.
+
+        Args:
+            nome_serie: Nome da série.
+            hash_conteudo: Hash do conteúdo gravado (ver calcular_hash_serie).
+            **metadados: Informações adicionais da entrada.
+        """
+        with self._trava:
+            self.series[nome_serie] = {
+                "hash": hash_conteudo,
+                "atualizado_em": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+                **metadados
+            }
+            self._alteradas.add(nome_serie)
+
+    def registrar_se_alterada(self, nome_serie: str, hash_conteudo: str, **metadados: Any) -> bool:
+        """
+        Registra a série apenas se o hash ou algum metadado diferir do manifesto.
+
+        Args:
+            nome_serie: Nome da série.
+            hash_conteudo: Hash do conteúdo gravado.
+            **metadados: Informações adicionais da entrada.
+
+        Returns:
+            True se a entrada foi (re)registrada, False se já estava atualizada.
+        """
+        entrada = self.obter(nome_serie)
+        if (entrada is not None and entrada.get("hash") == hash_conteudo
+                and all(entrada.get(chave) == valor for chave, valor in metadados.items())):
+            return False
+        self.registrar(nome_serie, hash_conteudo, **metadados)
+        return True
+
+    def salvar(self) -> bool:
+        """
+        Grava o manifesto de forma atômica.
+
+        As entradas alteradas por esta instância são mescladas ao arquivo em
+        disco, preservando as registradas por outros extratores.
+
+        Returns:
+            True se o manifesto foi salvo (ou não havia alterações), False em caso de erro.
+        """
+        with self._trava:
+            if not self._alteradas:
+                return True
+
+            series = self._ler()
+            series.update({nome: self.series[nome] for nome in self._alteradas})
+            conteudo = {"versao": 1, "series": dict(sorted(series.items()))}
+
+            def escrever(caminho_temporario: str) -> None:
+                with open(caminho_temporario, 'w', encoding='utf-8') as f:
+                    json.dump(conteudo, f, ensure_ascii=False, indent=4)
+
+            try:
+                escrever_atomico(self.caminho, escrever)
+                self.series = series
+                self._alteradas.clear()
+                logger.info(f"Manifesto salvo em {self.caminho}")
+                return True
+            except OSError as e:
+                logger.error(f"Erro ao salvar o manifesto {self.caminho}: {e}")
+                return False
+
+
+def carregar_catalogo(possiveis_diretorios: List[str]) -> Tuple[Optional[str], Dict[str, Dict[str, Any]]]:
+    """
+    Localiza e lê o manifesto (catálogo) das séries.
+
+    Args:
+        possiveis_diretorios: Lista de diretórios onde procurar o manifesto.
+
+    Returns:
+        Tupla (diretório onde o manifesto foi encontrado, entradas por série),
+        ou (None, {}) se nenhum manifesto for encontrado.
+    """
+    for diretorio in possiveis_diretorios:
+        if os.path.exists(os.path.join(diretorio, ManifestoSeries.NOME_ARQUIVO)):
+            manifesto = ManifestoSeries(diretorio)
+            logger.info(f"Catálogo de séries carregado de {manifesto.caminho} ({len(manifesto.series)} séries).")
+            return diretorio, manifesto.series
+
+    logger.warning("Catálogo de séries não encontrado em nenhum diretório.")
+    return None, {}
+
+
+def obter_armazenamentos_adicionais(principal: ArmazenamentoSeries) -> List[ArmazenamentoSeries]:
+    """
+    Cria os armazenamentos gravados junto com o principal, conforme a configuração.
+
+    Args:
+        principal: Armazenamento principal (não é repetido na lista).
+
+    Returns:
+        Lista com o JSON (se exportar_json) e o cache binário (se cache_binario).
+    """
+    config = obter_configuracao()["armazenamento"]
+    formatos = []
+    if config["exportar_json"]:
+        formatos.append(ArmazenamentoJSON.formato)
+    if config["cache_binario"]:
+        formatos.append(ArmazenamentoBinario.formato)
+    return [FORMATOS_ARMAZENAMENTO[formato](principal.diretorio)
+            for formato in formatos if formato != principal.formato]
+
+
+def formatos_leitura() -> List[str]:
+    """
+    Retorna os formatos aceitos na leitura, em ordem de preferência.
+
+    O cache binário (se habilitado) vem primeiro, por permitir leitura sem
+    cópia, seguido do formato principal e do JSON.
+
+    Returns:
+        Lista de identificadores de formato, sem repetições.
+    """
+    config = obter_configuracao()["armazenamento"]
+    formatos = [ArmazenamentoBinario.formato] if config["cache_binario"] else []
+    formatos += [config["formato"], ArmazenamentoJSON.formato]
+    return list(dict.fromkeys(formatos))
+
+
+def carregar_serie(nome_serie: str, possiveis_diretorios: List[str], formatos: List[str] = None) -> pd.DataFrame:
+    """
+    Carrega uma série procurando-a em vários diretórios e formatos.
+
+    No primeiro diretório em que a série existir, é lido o arquivo mais
+    recente entre os formatos disponíveis (por exemplo, um JSON atualizado
+    pelo git prevalece sobre um Parquet local antigo).
+
+    Args:
+        nome_serie: Nome da série.
+        possiveis_diretorios: Lista de diretórios onde procurar a série.
+        formatos: Formatos aceitos, em ordem de preferência (padrão:
+            formatos_leitura()).
+
+    Returns:
+        DataFrame com as colunas 'data' e 'valor' ou DataFrame vazio se a
+        série não for encontrada.
+    """
+    if formatos is None:
+        formatos = formatos_leitura()
+    formatos = [formato for formato in formatos if formato_disponivel(formato)]
+
+    for diretorio in possiveis_diretorios:
+        candidatos = [FORMATOS_ARMAZENAMENTO[formato](diretorio) for formato in formatos]
+        candidatos = [armazenamento for armazenamento in candidatos if armazenamento.existe(nome_serie)]
+        if not candidatos:
+            continue
+
+        # Em empate, prevalece a ordem de preferência dos formatos
+        armazenamento = max(candidatos, key=lambda a: os.path.getmtime(a.caminho(nome_serie)))
+        df = armazenamento.carregar(nome_serie)
+        if not df.empty:
+            logger.info(f"Arquivo {armazenamento.caminho(nome_serie)} carregado com sucesso.")
+            return df
+
+    logger.warning(f"Série {nome_serie} não encontrada em nenhum diretório.")
+    return criar_serie_vazia()
+
+
+def assinatura_arquivos_serie(nome_serie: str, possiveis_diretorios: List[str],
+                              formatos: List[str] = None) -> Tuple[Tuple[str, int, int], ...]:
+    """
+    Resume o estado dos arquivos de uma série sem lê-los.
+
+    A assinatura muda sempre que algum arquivo da série é criado, removido ou
+    regravado, o que permite usá-la como chave de cache.
+
+    Args:
+        nome_serie: Nome da série.
+        possiveis_diretorios: Lista de diretórios onde procurar a série.
+        formatos: Formatos considerados (padrão: formatos_leitura()).
+
+    Returns:
+        Tupla de (caminho, mtime em ns, tamanho) dos arquivos existentes.
+    """
+    if formatos is None:
+        formatos = formatos_leitura()
+
+    assinatura = []
+    for diretorio in possiveis_diretorios:
+        for formato in formatos:
+            caminho = os.path.join(diretorio, f"{nome_serie}{FORMATOS_ARMAZENAMENTO[formato].extensao}")
+            try:
+                estado = os.stat(caminho)
+            except OSError:
+                continue
+            assinatura.append((caminho, estado.st_mtime_ns, estado.st_size))
+    return tuple(assinatura)
@@ -0,0 +1,315 @@
+"""
+Módulo para carga das séries extraídas no PostgreSQL.
+
+Este módulo contém a classe CarregadorPostgres, que grava as séries
+armazenadas pelos extratores nas tabelas stg_* consultadas pelo dashboard.
+Cada série é copiada (COPY) para uma tabela temporária e incorporada à
+tabela de destino com um único INSERT ... ON CONFLICT, em uma transação
+por série.
+
+Antes da primeira carga de cada série, o esquema da tabela de destino é
+verificado: o ON CONFLICT exige um índice único em data_referencia, e a
+atualização grava a coluna atualizado_em. Tabelas criadas fora do
+carregador sem esses elementos são ajustadas (se CARGA_CRIAR_TABELAS) ou
+rejeitadas com uma mensagem clara.
+"""
+
+import io
+import logging
+import argparse
+import pandas as pd
+from typing import Dict, List, Optional, Any
+
+try:
+    import psycopg2
+    from psycopg2 import sql
+except ImportError:  # Dependência opcional, necessária apenas para a carga no banco
+    psycopg2 = None
+    sql = None
+
+from src.utils.configuracao import obter_configuracao
+from src.dados.armazenamento import carregar_serie
+
+# Configurar logger
+logger = logging.getLogger(__name__)
+
+
+def serializar_para_copy(df: pd.DataFrame) -> io.StringIO:
+    """
+    Serializa uma série no formato texto do COPY (data<TAB>valor por linha).
+
+    As datas são convertidas em bloco para ISO pelo NumPy e os valores usam
+    repr, que preserva a precisão do float64. Linhas sem data ou valor são
+    descartadas.
+
+    Args:
+        df: DataFrame com as colunas 'data' e 'valor'.
+
+    Returns:
+        Buffer de texto posicionado no início, pronto para o COPY.
+    """
+    validos = df['data'].notna() & df['valor'].notna()
+    if not validos.all():
+        df = df[validos]
+
+    datas = df['data'].to_numpy().astype('datetime64[D]').astype(str).tolist()
+    valores = map(repr, df['valor'].to_numpy(dtype='float64').tolist())
+
+    buffer = io.StringIO()
+    if datas:
+        buffer.write("\n".join(map("\t".join, zip(datas, valores))))
+        buffer.write("\n")
+    buffer.seek(0)
+    return buffer
+
+
+class CarregadorPostgres:
+    """
+    Classe para carregar séries nas tabelas de staging do PostgreSQL.
+
+    Attributes:
+        esquema (str): Esquema das tabelas de destino.
+        tabelas (Dict[str, Dict[str, str]]): Tabela e coluna de valor de cada série.
+        criar_tabelas (bool): Se as tabelas de destino são criadas (ou recebem a
+            restrição única e a coluna atualizado_em) quando necessário.
+        conexao: Conexão psycopg2 usada nas cargas.
+    """
+
+    def __init__(self, conexao=None, tabelas: Dict[str, Dict[str, str]] = None, esquema: str = None,
+                 criar_tabelas: bool = None):
+        """
+        Inicializa o carregador.
+
+        Args:
+            conexao: Conexão psycopg2 já aberta (se None, conecta com CONFIGURACAO_BD).
+            tabelas: Mapeamento série -> {"tabela", "coluna_valor"} (padrão: CONFIGURACAO_CARGA).
+            esquema: Esquema das tabelas de destino (padrão: CONFIGURACAO_CARGA).
+            criar_tabelas: Se as tabelas são criadas ou ajustadas (padrão: CONFIGURACAO_CARGA).
+
+        Raises:
+            ImportError: Se o pacote psycopg2 não estiver instalado.
+        """
+        if psycopg2 is None:
+            raise ImportError("O pacote psycopg2 é necessário para a carga no PostgreSQL.")
+
+        config = obter_configuracao()
+        self.esquema = esquema or config["carga"]["esquema"]
+        self.tabelas = tabelas or config["carga"]["tabelas"]
+        self.criar_tabelas = config["carga"]["criar_tabelas"] if criar_tabelas is None else criar_tabelas
+        self._conexao_propria = conexao is None
+        self.conexao = conexao or psycopg2.connect(
+            host=config["bd"]["host"],
+            port=config["bd"]["port"],
+            database=config["bd"]["database"],
+            user=config["bd"]["user"],
+            password=config["bd"]["password"]
+        )
+        self._tabelas_verificadas = set()
+
+    def _identificadores(self, nome_serie: str) -> Dict[str, Any]:
+        """Retorna os identificadores SQL da tabela e da coluna de valor de uma série."""
+        destino = self.tabelas[nome_serie]
+        return {
+            "tabela": sql.Identifier(self.esquema, destino["tabela"]),
+            "coluna": sql.Identifier(destino["coluna_valor"])
+        }
+
+    def _garantir_tabela(self, cursor, nome_serie: str) -> None:
+        """
+        Garante que a tabela de destino da série aceite o upsert.
+
+        Tabelas inexistentes são criadas com chave primária em data_referencia
+        (o alvo do ON CONFLICT). Em tabelas existentes, são verificados no
+        information_schema as colunas e, no catálogo, o índice único em
+        data_referencia (índices únicos sem restrição não aparecem no
+        information_schema); a restrição única e a coluna atualizado_em são
+        adicionadas se faltarem.
+
+        Args:
+            cursor: Cursor da transação corrente.
+            nome_serie: Nome da série.
+
+        Raises:
+            RuntimeError: Se a tabela não existir ou não puder ser ajustada
+                (criar_tabelas desabilitado, colunas ausentes ou datas duplicadas).
+        """
+        if nome_serie in self._tabelas_verificadas:
+            return
+        destino = self.tabelas[nome_serie]
+        nome_tabela = f"{self.esquema}.{destino['tabela']}"
+        identificadores = self._identificadores(nome_serie)
+
+        cursor.execute(
+            "SELECT column_name FROM information_schema.columns WHERE table_schema = %s AND table_name = %s",
+            (self.esquema, destino["tabela"])
+        )
+        colunas = {linha[0] for linha in cursor.fetchall()}
+        if not colunas:
+            if not self.criar_tabelas:
+                raise RuntimeError(f"A tabela {nome_tabela} não existe (CARGA_CRIAR_TABELAS desabilitado).")
+            cursor.execute(sql.SQL(
+                "CREATE TABLE IF NOT EXISTS {tabela} ("
+                "data_referencia DATE PRIMARY KEY, "
+                "{coluna} DOUBLE PRECISION NOT NULL, "
+                "atualizado_em TIMESTAMPTZ NOT NULL DEFAULT now())"
+            ).format(**identificadores))
+            return
+
+        ausentes = [coluna for coluna in ("data_referencia", destino["coluna_valor"]) if coluna not in colunas]
+        if ausentes:
+            raise RuntimeError(f"A tabela {nome_tabela} não tem as colunas {', '.join(ausentes)}.")
+
+        cursor.execute(
+            "SELECT 1 FROM pg_index i "
+            "JOIN pg_class c ON c.oid = i.indrelid "
+            "JOIN pg_namespace n ON n.oid = c.relnamespace "
+            "JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = i.indkey[0] "
+            "WHERE n.nspname = %s AND c.relname = %s AND i.indisunique AND i.indnkeyatts = 1 "
+            "AND i.indpred IS NULL AND i.indexprs IS NULL AND a.attname = 'data_referencia'",
+            (self.esquema, destino["tabela"])
+        )
+        possui_indice_unico = cursor.fetchone() is not None
+
+        faltantes = []
+        if not possui_indice_unico:
+            faltantes.append("restrição única em data_referencia")
+        if "atualizado_em" not in colunas:
+            faltantes.append("coluna atualizado_em")
+        if faltantes and not self.criar_tabelas:
+            raise RuntimeError(f"A tabela {nome_tabela} não tem {' e '.join(faltantes)}, necessária(s) para "
+                               f"o upsert (CARGA_CRIAR_TABELAS desabilitado).")
+
+        if not possui_indice_unico:
+            cursor.execute(sql.SQL(
+                "SELECT data_referencia FROM {tabela} GROUP BY data_referencia HAVING count(*) > 1 LIMIT 1"
+            ).format(**identificadores))
+            duplicada = cursor.fetchone()
+            if duplicada is not None:
+                raise RuntimeError(f"A tabela {nome_tabela} tem datas duplicadas (ex.: {duplicada[0]}); "
+                                   f"remova-as para criar a restrição única em data_referencia.")
+            cursor.execute(sql.SQL("ALTER TABLE {tabela} ADD CONSTRAINT {restricao} UNIQUE (data_referencia)").format(
+                restricao=sql.Identifier(f"{destino['tabela']}_data_referencia_key"), **identificadores
+            ))
+            logger.info(f"Restrição única em data_referencia adicionada a {nome_tabela}.")
+
+        if "atualizado_em" not in colunas:
+            cursor.execute(sql.SQL(
+                "ALTER TABLE {tabela} ADD COLUMN atualizado_em TIMESTAMPTZ NOT NULL DEFAULT now()"
+            ).format(**identificadores))
+            logger.info(f"Coluna atualizado_em adicionada a {nome_tabela}.")
+
+    def carregar(self, nome_serie: str, df: pd.DataFrame) -> int:
+        """
+        Carrega uma série na sua tabela de staging (upsert por data_referencia).
+
+        Toda a carga da série ocorre em uma única transação: COPY para uma
+        tabela temporária e INSERT ... ON CONFLICT na tabela de destino. Linhas
+        cujo valor não mudou não são reescritas.
+
+        Args:
+            nome_serie: Nome da série (chave de CONFIGURACAO_CARGA["tabelas"]).
+            df: DataFrame com as colunas 'data' e 'valor'.
+
+        Returns:
+            Número de linhas inseridas ou atualizadas.
+
+        Raises:
+            KeyError: Se a série não tiver tabela de destino configurada.
+            RuntimeError: Se a tabela de destino não aceitar o upsert (ver _garantir_tabela).
+            psycopg2.Error: Em caso de erro no banco (a transação é desfeita).
+        """
+        if nome_serie not in self.tabelas:
+            raise KeyError(f"Série sem tabela de destino configurada: {nome_serie}")
+
+        buffer = serializar_para_copy(df)
+        identificadores = self._identificadores(nome_serie)
+
+        # O bloco with da conexão faz commit ao final ou rollback em caso de exceção
+        with self.conexao:
+            with self.conexao.cursor() as cursor:
+                self._garantir_tabela(cursor, nome_serie)
+                cursor.execute(
+                    "CREATE TEMP TABLE carga_serie (data_referencia DATE, valor DOUBLE PRECISION) ON COMMIT DROP"
+                )
+                cursor.copy_expert("COPY carga_serie (data_referencia, valor) FROM STDIN", buffer)
+                cursor.execute(sql.SQL(
+                    "INSERT INTO {tabela} AS destino (data_referencia, {coluna}) "
+                    "SELECT data_referencia, valor FROM carga_serie "
+                    "ON CONFLICT (data_referencia) DO UPDATE "
+                    "SET {coluna} = EXCLUDED.{coluna}, atualizado_em = now() "
+                    "WHERE destino.{coluna} IS DISTINCT FROM EXCLUDED.{coluna}"
+                ).format(**identificadores))
+                linhas = cursor.rowcount
+        # Só depois do commit: em caso de rollback, a criação ou o ajuste da tabela também é desfeito
+        self._tabelas_verificadas.add(nome_serie)
+
+        logger.info(f"Série {nome_serie} carregada em {self.tabelas[nome_serie]['tabela']}: "
+                    f"{linhas} de {len(df)} linhas inseridas ou atualizadas.")
+        return linhas
+
+    def carregar_series(self, nomes_series: List[str] = None, diretorio_dados: str = None) -> Dict[str, Optional[int]]:
+        """
+        Carrega as séries armazenadas pelos extratores.
+
+        Uma falha em uma série não impede a carga das demais.
+
+        Args:
+            nomes_series: Séries a carregar (padrão: todas com tabela configurada).
+            diretorio_dados: Diretório das séries armazenadas.
+
+        Returns:
+            Dicionário com o número de linhas gravadas por série (None em caso de falha).
+        """
+        config = obter_configuracao()
+        diretorio_dados = diretorio_dados or config["caminhos"]["diretorio_dados"]
+
+        resultados = {}
+        for nome_serie in nomes_series or list(self.tabelas):
+            df = carregar_serie(nome_serie, [diretorio_dados])
+            if df.empty:
+                logger.warning(f"Série {nome_serie} não encontrada em {diretorio_dados}; carga ignorada.")
+                resultados[nome_serie] = None
+                continue
+            try:
+                resultados[nome_serie] = self.carregar(nome_serie, df)
+            except (KeyError, RuntimeError, psycopg2.Error) as e:
+                logger.error(f"Erro ao carregar a série {nome_serie}: {e}")
+                resultados[nome_serie] = None
+        return resultados
+
+    def fechar(self) -> None:
+        """Fecha a conexão, se tiver sido aberta pelo carregador."""
+        if self._conexao_propria and not self.conexao.closed:
+            self.conexao.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.fechar()
+
+
+# Função para uso direto via linha de comando
+def executar(argumentos: List[str] = None):
+    """Função principal para execução direta do script."""
+    parser = argparse.ArgumentParser(description="Carga das séries extraídas nas tabelas stg_* do PostgreSQL.")
+    parser.add_argument("--series", nargs="+", help="Séries a carregar (padrão: todas as configuradas).")
+    args = parser.parse_args(argumentos)
+
+    # Configurar logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    with CarregadorPostgres() as carregador:
+        resultados = carregador.carregar_series(args.series)
+
+    # Exibir resultados
+    for nome, linhas in resultados.items():
+        status = f"{linhas} linhas" if linhas is not None else "falha"
+        print(f"Carga de {nome}: {status}")
+
+
+if __name__ == "__main__":
+    executar()
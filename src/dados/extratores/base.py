@@ -0,0 +1,126 @@
+"""
+Módulo com a base comum dos extratores de séries temporais.
+
+Este módulo contém a classe ExtratorSeries, que concentra o armazenamento
+das séries extraídas (formato principal, formatos adicionais e manifesto),
+compartilhado pelos extratores do BCB e do IBGE.
+"""
+
+import os
+import logging
+import threading
+import pandas as pd
+from typing import List
+from src.utils.configuracao import obter_configuracao
+from src.dados.armazenamento import (
+    ManifestoSeries, obter_armazenamento, obter_armazenamentos_adicionais,
+    carregar_serie, calcular_hash_serie, calcular_metadados_serie
+)
+
+# Configurar logger
+logger = logging.getLogger(__name__)
+
+
+class ExtratorSeries:
+    """
+    Classe base dos extratores, responsável por gravar e ler as séries armazenadas.
+    
+    Attributes:
+        diretorio_saida (str): Diretório para salvar os arquivos de dados.
+        armazenamento (ArmazenamentoSeries): Formato principal de armazenamento das séries.
+        armazenamentos_adicionais (List[ArmazenamentoSeries]): Formatos gravados junto com o principal.
+        manifesto (ManifestoSeries): Manifesto com o hash de conteúdo de cada série.
+        series_alteradas (List[str]): Séries cujo conteúdo mudou na última extração.
+    """
+    
+    def __init__(self, diretorio_saida: str = None):
+        """
+        Inicializa o armazenamento das séries.
+        
+        Args:
+            diretorio_saida: Diretório para salvar os arquivos de dados.
+        """
+        config = obter_configuracao()
+        self.diretorio_saida = diretorio_saida or config["caminhos"]["diretorio_dados"]
+        self.armazenamento = obter_armazenamento(diretorio=self.diretorio_saida)
+        self.armazenamentos_adicionais = obter_armazenamentos_adicionais(self.armazenamento)
+        self.manifesto = ManifestoSeries(self.diretorio_saida)
+        self.series_alteradas: List[str] = []
+        self._trava_alteradas = threading.Lock()
+        
+        # Criar diretório de saída se não existir
+        os.makedirs(self.diretorio_saida, exist_ok=True)
+    
+    def _salvar_serie(self, nome_serie: str, df: pd.DataFrame) -> bool:
+        """
+        Salva a série no formato configurado e nos formatos adicionais (JSON e cache binário).
+        
+        Séries cujo hash de conteúdo coincide com o registrado no manifesto
+        não são regravadas. A entrada da série no manifesto (catálogo) é
+        atualizada com os arquivos gravados e os metadados da série.
+        
+        Args:
+            nome_serie: Nome da série.
+            df: DataFrame com as colunas 'data' e 'valor'.
+            
+        Returns:
+            True se todos os arquivos foram salvos com sucesso, False caso contrário.
+        """
+        armazenamentos = [self.armazenamento] + self.armazenamentos_adicionais
+        hash_conteudo = calcular_hash_serie(df)
+        conteudo_alterado = self.manifesto.alterada(nome_serie, hash_conteudo)
+        
+        if not conteudo_alterado:
+            # Conteúdo inalterado: só grava os formatos cujo arquivo estiver faltando
+            armazenamentos = [a for a in armazenamentos if not a.existe(nome_serie)]
+            if not armazenamentos:
+                logger.info(f"Dados de {nome_serie} inalterados; arquivos mantidos.")
+        
+        sucesso = True
+        for armazenamento in armazenamentos:
+            sucesso = armazenamento.salvar(nome_serie, df) and sucesso
+        
+        if sucesso:
+            self.manifesto.registrar_se_alterada(
+                nome_serie, hash_conteudo,
+                formato=self.armazenamento.formato,
+                arquivos={a.formato: os.path.basename(a.caminho(nome_serie))
+                          for a in [self.armazenamento] + self.armazenamentos_adicionais},
+                **calcular_metadados_serie(df)
+            )
+            if conteudo_alterado:
+                with self._trava_alteradas:
+                    self.series_alteradas.append(nome_serie)
+        return sucesso
+    
+    def _carregar_dados_existentes(self, nome_serie: str) -> pd.DataFrame:
+        """
+        Carrega os dados já armazenados de uma série.
+        
+        Args:
+            nome_serie: Nome da série (nome do arquivo sem extensão).
+            
+        Returns:
+            DataFrame com os dados armazenados ou DataFrame vazio se a série
+            não existir ou não puder ser lida.
+        """
+        return carregar_serie(nome_serie, [self.diretorio_saida],
+                              [self.armazenamento.formato] + [a.formato for a in self.armazenamentos_adicionais])
+    
+    def _mesclar_dados(self, df_existente: pd.DataFrame, df_novo: pd.DataFrame) -> pd.DataFrame:
+        """
+        Mescla novas observações às já armazenadas.
+        
+        Observações com a mesma data são substituídas pelos valores novos,
+        o que incorpora eventuais revisões publicadas pela fonte.
+        
+        Args:
+            df_existente: Dados já armazenados da série.
+            df_novo: Dados recém-extraídos e processados.
+            
+        Returns:
+            DataFrame ordenado por data, sem datas duplicadas.
+        """
+        df = pd.concat([df_existente, df_novo], ignore_index=True)
+        df = df.drop_duplicates(subset='data', keep='last')
+        return df.sort_values('data', kind='stable').reset_index(drop=True)
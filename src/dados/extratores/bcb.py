@@ -6,17 +6,119 @@ especificamente das séries temporais do Sistema Gerenciador de Séries Temporai
 """
 
 import requests
-import json
+import numpy as np
+import pandas as pd
 import datetime
-import os
 import logging
-from typing import Dict, List, Optional, Union, Any
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Union, Any, Tuple
 from src.utils.configuracao import obter_configuracao
+from src.dados.armazenamento import criar_serie_vazia
+from src.dados.extratores.base import ExtratorSeries
+from src.dados.extratores.cliente_http import ClienteHTTP, obter_cliente_padrao
 
 # Configurar logger
 logger = logging.getLogger(__name__)
 
-class ExtratorBCB:
+# Intervalo de datas representável em datetime64[ns], usado pelos DataFrames das séries
+DATA_MINIMA = np.datetime64(pd.Timestamp.min.ceil('D'), 'D')
+DATA_MAXIMA = np.datetime64(pd.Timestamp.max.floor('D'), 'D')
+
+def converter_datas_sgs(datas: List[Optional[str]]) -> np.ndarray:
+    """
+    Converte datas no formato DD/MM/YYYY do SGS de forma vetorizada.
+    
+    As strings com dia e mês de dois dígitos são reorganizadas para o formato
+    ISO por fatiamento de caracteres no NumPy e convertidas de uma só vez para
+    datetime64. As demais (ex.: 1/2/2024, aceita pelo strptime) e as datas com
+    o formato esperado mas inválidas (ex.: 31/02/2024) são convertidas pelo
+    pandas com o mesmo formato, que marca as inválidas individualmente como
+    NaT. Datas fora do intervalo representável em datetime64[ns] (ex.: ano
+    0024) também viram NaT, em vez de estourar na conversão posterior.
+    
+    Args:
+        datas: Lista de datas no formato DD/MM/YYYY (itens inválidos viram NaT).
+        
+    Returns:
+        Array datetime64[D] com uma posição por item de entrada.
+    """
+    # Itens não textuais (ex.: None) viram strings fora do formato e resultam em NaT
+    brutas = np.array(datas, dtype=str)
+    if brutas.size == 0:
+        return np.array([], dtype='datetime64[D]')
+    
+    largura = max(brutas.dtype.itemsize // 4, 1)
+    if largura >= 10:
+        caracteres = brutas.view('U1').reshape(len(brutas), largura)
+        formato_valido = (
+            (np.char.str_len(brutas) == 10)
+            & (caracteres[:, 2] == '/')
+            & (caracteres[:, 5] == '/')
+        )
+        
+        # DD/MM/YYYY -> YYYY-MM-DD
+        iso = np.empty((len(brutas), 10), dtype='U1')
+        iso[:, 0:4] = caracteres[:, 6:10]
+        iso[:, 4] = '-'
+        iso[:, 5:7] = caracteres[:, 3:5]
+        iso[:, 7] = '-'
+        iso[:, 8:10] = caracteres[:, 0:2]
+        iso = iso.view('U10').ravel()
+        iso = np.where(formato_valido, iso, 'NaT')
+        
+        try:
+            convertidas = iso.astype('datetime64[D]')
+        except ValueError:
+            # Há datas inválidas no formato esperado: são refeitas pelo caminho lento
+            convertidas = np.full(len(brutas), np.datetime64('NaT'), dtype='datetime64[D]')
+            formato_valido = np.zeros(len(brutas), dtype=bool)
+    else:
+        convertidas = np.full(len(brutas), np.datetime64('NaT'), dtype='datetime64[D]')
+        formato_valido = np.zeros(len(brutas), dtype=bool)
+    
+    restantes = ~formato_valido
+    if restantes.any():
+        lentas = pd.to_datetime(pd.Series(brutas[restantes]), format='%d/%m/%Y', errors='coerce')
+        convertidas[restantes] = lentas.to_numpy().astype('datetime64[D]')
+    
+    fora_do_intervalo = (convertidas < DATA_MINIMA) | (convertidas > DATA_MAXIMA)
+    convertidas[fora_do_intervalo] = np.datetime64('NaT')
+    return convertidas
+
+
+def converter_valores_sgs(valores: List[Optional[str]]) -> np.ndarray:
+    """
+    Converte valores com vírgula decimal do SGS de forma vetorizada.
+    
+    A troca de vírgula por ponto é feita uma única vez sobre todos os valores
+    concatenados e a conversão para float64 é feita pelo NumPy. Se houver
+    algum valor inválido, a conversão recorre ao pandas, que o marca como NaN.
+    O texto 'nan' também resulta em NaN (como em float()); cabe ao chamador
+    distingui-lo de um valor inválido.
+    
+    Args:
+        valores: Lista de valores em texto (itens inválidos viram NaN).
+        
+    Returns:
+        Array float64 com uma posição por item de entrada.
+    """
+    if not valores:
+        return np.array([], dtype='float64')
+    
+    try:
+        concatenados = '\x1f'.join(valores)
+    except TypeError:
+        # Há itens não textuais (ex.: None): são tratados como inválidos
+        concatenados = '\x1f'.join(valor if isinstance(valor, str) else '' for valor in valores)
+    convertidos = concatenados.replace(',', '.').split('\x1f')
+    try:
+        return np.array(convertidos, dtype='float64')
+    except ValueError:
+        return pd.to_numeric(pd.Series(convertidos), errors='coerce').to_numpy(dtype='float64')
+
+
+class ExtratorBCB(ExtratorSeries):
     """
     Classe para extrair dados da API do Banco Central do Brasil.
     
@@ -24,54 +126,153 @@ class ExtratorBCB:
         url_base (str): URL base da API do BCB.
         diretorio_saida (str): Diretório para salvar os arquivos de dados.
         series (Dict[str, str]): Dicionário com códigos e nomes das séries.
+        cliente_http (ClienteHTTP): Cliente HTTP com pool de conexões e novas tentativas.
     """
     
-    def __init__(self, diretorio_saida: str = None):
+    def __init__(self, diretorio_saida: str = None, cliente_http: ClienteHTTP = None):
         """
         Inicializa o extrator de dados do BCB.
         
         Args:
             diretorio_saida: Diretório para salvar os arquivos de dados.
+            cliente_http: Cliente HTTP a ser usado (por padrão, o cliente compartilhado do processo).
         """
+        super().__init__(diretorio_saida)
         config = obter_configuracao()
         self.url_base = "https://api.bcb.gov.br/dados/serie/bcdata.sgs.{}/dados"
-        self.diretorio_saida = diretorio_saida or config["caminhos"]["diretorio_dados"]
+        self.cliente_http = cliente_http or obter_cliente_padrao()
+        # Pool compartilhado pelas janelas de todas as séries durante extrair_todas_series
+        self._executor_janelas: Optional[ThreadPoolExecutor] = None
         
         # Séries padrão para extração
         self.series = config["extracao"]["bcb"]["series"]
         
-        # Criar diretório de saída se não existir
-        os.makedirs(self.diretorio_saida, exist_ok=True)
-        
     def buscar_dados_serie(self, codigo_serie: str, data_inicio: str, data_fim: str) -> Optional[List[Dict[str, Any]]]:
         """
         Busca dados de uma série específica da API do BCB.
         
+        Períodos maiores que CONFIGURACAO_EXTRACAO["bcb"]["dias_por_janela"] são
+        divididos em janelas consecutivas, buscadas em paralelo e reunidas em
+        ordem cronológica. Durante extrair_todas_series, as janelas de todas as
+        séries dividem um único pool de max_janelas_simultaneas threads.
+        
         Args:
             codigo_serie: Código da série no SGS.
             data_inicio: Data inicial no formato DD/MM/YYYY.
             data_fim: Data final no formato DD/MM/YYYY.
             
         Returns:
-            Lista de dicionários com os dados da série ou None em caso de erro.
+            Lista de dicionários com os dados da série (vazia se não houver
+            observações no período) ou None em caso de erro.
         """
-        url = f"{self.url_base.format(codigo_serie)}?formato=json&dataInicial={data_inicio}&dataFinal={data_fim}"
+        config = obter_configuracao()
+        dias_por_janela = config["extracao"]["bcb"]["dias_por_janela"]
+        
+        inicio = datetime.datetime.strptime(data_inicio, '%d/%m/%Y').date()
+        fim = datetime.datetime.strptime(data_fim, '%d/%m/%Y').date()
+        janelas = self._dividir_periodo(inicio, fim, dias_por_janela)
+        
+        if len(janelas) == 1:
+            return self._buscar_janela(codigo_serie, data_inicio, data_fim)
+        
+        logger.info(f"Período da série {codigo_serie} dividido em {len(janelas)} janelas de até {dias_por_janela} dias")
+        def buscar(janela):
+            return self._buscar_janela(codigo_serie, janela[0].strftime('%d/%m/%Y'), janela[1].strftime('%d/%m/%Y'))
+        
+        if self._executor_janelas is not None:
+            partes = list(self._executor_janelas.map(buscar, janelas))
+        else:
+            # Chamada avulsa: pool próprio, encerrado ao fim da série
+            num_workers = max(1, min(config["extracao"]["bcb"]["max_janelas_simultaneas"], len(janelas)))
+            with ThreadPoolExecutor(max_workers=num_workers, thread_name_prefix=f"sgs_{codigo_serie}") as executor:
+                partes = list(executor.map(buscar, janelas))
+        
+        # Uma janela com falha invalida a série inteira, para não gravar dados com lacunas
+        if any(parte is None for parte in partes):
+            logger.error(f"Falha ao buscar uma ou mais janelas da série {codigo_serie}")
+            return None
+        
+        # Concatena as janelas em ordem, descartando datas repetidas nas bordas
+        dados = []
+        datas_vistas = set()
+        for parte in partes:
+            for item in parte:
+                data = item.get('data')
+                if data not in datas_vistas:
+                    datas_vistas.add(data)
+                    dados.append(item)
+        return dados
+    
+    def _buscar_janela(self, codigo_serie: str, data_inicio: str, data_fim: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Busca dados de uma série para um único intervalo de datas (uma requisição).
+        
+        Args:
+            codigo_serie: Código da série no SGS.
+            data_inicio: Data inicial no formato DD/MM/YYYY.
+            data_fim: Data final no formato DD/MM/YYYY.
+            
+        Returns:
+            Lista de dicionários com os dados da série (vazia se não houver
+            observações no período) ou None em caso de erro.
+        """
+        url = self.url_base.format(codigo_serie)
+        params = {"formato": "json", "dataInicial": data_inicio, "dataFinal": data_fim}
         
         try:
             logger.info(f"Buscando dados para série {codigo_serie} de {data_inicio} até {data_fim}")
-            resposta = requests.get(url, timeout=60)
+            resposta = self.cliente_http.obter(url, params=params)
+            if resposta.status_code == 404:
+                # O SGS responde 404 quando não há observações no período solicitado
+                logger.info(f"Sem dados para a série {codigo_serie} entre {data_inicio} e {data_fim}")
+                return []
             resposta.raise_for_status()  # Lança exceção para erros HTTP
             return resposta.json()
         except requests.exceptions.RequestException as e:
             logger.error(f"Erro ao buscar dados para a série {codigo_serie}: {e}")
             return None
     
-    def extrair_todas_series(self, dias_retroativos: int = None) -> Dict[str, bool]:
+    @staticmethod
+    def _dividir_periodo(data_inicio: datetime.date, data_fim: datetime.date,
+                         dias_por_janela: int) -> List[Tuple[datetime.date, datetime.date]]:
+        """
+        Divide um período em janelas consecutivas e sem sobreposição.
+        
+        Args:
+            data_inicio: Data inicial do período.
+            data_fim: Data final do período (inclusive).
+            dias_por_janela: Número máximo de dias de cada janela.
+            
+        Returns:
+            Lista de tuplas (início, fim) em ordem cronológica.
+        """
+        if dias_por_janela <= 0 or data_inicio > data_fim:
+            return [(data_inicio, data_fim)]
+        
+        janelas = []
+        inicio_janela = data_inicio
+        while inicio_janela <= data_fim:
+            fim_janela = min(inicio_janela + datetime.timedelta(days=dias_por_janela - 1), data_fim)
+            janelas.append((inicio_janela, fim_janela))
+            inicio_janela = fim_janela + datetime.timedelta(days=1)
+        return janelas
+    
+    def extrair_todas_series(self, dias_retroativos: int = None, max_concorrencia: int = None,
+                             incremental: bool = None) -> Dict[str, bool]:
         """
         Extrai dados de todas as séries configuradas.
         
+        As séries são buscadas, processadas e salvas em paralelo por um pool de
+        threads, de modo que o tempo total se aproxima do da série mais lenta.
+        
         Args:
             dias_retroativos: Número de dias para buscar dados retroativamente.
+            max_concorrencia: Número máximo de séries extraídas simultaneamente
+                (1 para execução sequencial).
+            incremental: Se True, busca apenas as datas posteriores à última
+                observação já armazenada de cada série e mescla os novos pontos
+                ao arquivo existente. Se None, usa BCB_INCREMENTAL (padrão False,
+                extração completa da janela de dias retroativos).
             
         Returns:
             Dicionário com o status de extração de cada série.
@@ -79,42 +280,128 @@ class ExtratorBCB:
         config = obter_configuracao()
         if dias_retroativos is None:
             dias_retroativos = config["extracao"]["bcb"]["dias_retroativos"]
+        if max_concorrencia is None:
+            max_concorrencia = config["extracao"]["bcb"]["max_concorrencia"]
+        if incremental is None:
+            incremental = config["extracao"]["bcb"]["incremental"]
             
         # Define a data de hoje e a data de dias_retroativos atrás
         data_fim = datetime.date.today()
         data_inicio = data_fim - datetime.timedelta(days=dias_retroativos)
         
-        # Formata as datas para o formato da API (dd/MM/yyyy)
-        data_inicio_str = data_inicio.strftime('%d/%m/%Y')
-        data_fim_str = data_fim.strftime('%d/%m/%Y')
+        # Cópia das séries para não ser afetada por adicionar_serie/remover_serie durante a execução
+        series = list(self.series.items())
+        if not series:
+            logger.warning("Nenhuma série configurada para extração.")
+            return {}
         
         resultados = {}
+        self.series_alteradas = []
+        num_workers = max(1, min(max_concorrencia, len(series)))
         
-        # Busca e salva os dados para cada série
-        for codigo, nome in self.series.items():
-            logger.info(f"Iniciando extração de dados para {nome} (SGS {codigo})...")
-            dados = self.buscar_dados_serie(codigo, data_inicio_str, data_fim_str)
-            
-            if dados:
-                # Processar os dados para formato padronizado
-                dados_processados = self._processar_dados(dados, nome)
-                
-                caminho_arquivo = os.path.join(self.diretorio_saida, f"{nome}.json")
-                try:
-                    with open(caminho_arquivo, 'w', encoding='utf-8') as f:
-                        json.dump(dados_processados, f, ensure_ascii=False, indent=4)
-                    logger.info(f"Dados de {nome} salvos em {caminho_arquivo}")
-                    resultados[nome] = True
-                except IOError as e:
-                    logger.error(f"Erro ao salvar o arquivo {caminho_arquivo}: {e}")
-                    resultados[nome] = False
-            else:
-                logger.warning(f"Não foi possível obter dados para {nome}.")
-                resultados[nome] = False
-        
-        logger.info("Coleta de dados do BCB concluída.")
+        # Busca e salva os dados de cada série em paralelo. As janelas dos períodos longos vão
+        # para um pool separado e compartilhado: as requisições simultâneas de janelas ficam
+        # limitadas a max_janelas_simultaneas no total (e não por série), e as threads das
+        # séries que aguardam suas janelas não ocupam as vagas delas
+        max_janelas = max(1, config["extracao"]["bcb"]["max_janelas_simultaneas"])
+        with ThreadPoolExecutor(max_workers=max_janelas, thread_name_prefix="sgs_janelas") as executor_janelas, \
+                ThreadPoolExecutor(max_workers=num_workers, thread_name_prefix="extrator_bcb") as executor:
+            self._executor_janelas = executor_janelas
+            try:
+                futuros = {
+                    nome: executor.submit(self._extrair_serie, codigo, nome, data_inicio, data_fim, incremental)
+                    for codigo, nome in series
+                }
+                # Mantém a ordem de configuração das séries no resultado
+                for nome, futuro in futuros.items():
+                    try:
+                        resultados[nome] = futuro.result()
+                    except Exception as e:
+                        logger.error(f"Erro inesperado na extração de {nome}: {e}")
+                        resultados[nome] = False
+            finally:
+                self._executor_janelas = None
+        
+        self.manifesto.salvar()
+        logger.info(f"Coleta de dados do BCB concluída. Séries alteradas: {', '.join(self.series_alteradas) or 'nenhuma'}.")
         return resultados
     
+    def _extrair_serie(self, codigo: str, nome: str, data_inicio: datetime.date,
+                       data_fim: datetime.date, incremental: bool = False) -> bool:
+        """
+        Busca, processa e salva os dados de uma única série.
+        
+        Args:
+            codigo: Código da série no SGS.
+            nome: Nome da série (usado como nome do arquivo).
+            data_inicio: Data inicial da janela completa de extração.
+            data_fim: Data final da extração.
+            incremental: Se True, busca apenas a partir da última observação
+                armazenada (menos a sobreposição configurada).
+            
+        Returns:
+            True se a série foi extraída e salva com sucesso, False caso contrário.
+        """
+        df_existente, data_inicio = self._preparar_extracao(nome, data_inicio, data_fim, incremental)
+        
+        logger.info(f"Iniciando extração de dados para {nome} (SGS {codigo})...")
+        dados = self.buscar_dados_serie(codigo, data_inicio.strftime('%d/%m/%Y'), data_fim.strftime('%d/%m/%Y'))
+        
+        return self._concluir_extracao(nome, dados, df_existente)
+    
+    def _preparar_extracao(self, nome: str, data_inicio: datetime.date, data_fim: datetime.date,
+                           incremental: bool) -> Tuple[pd.DataFrame, datetime.date]:
+        """
+        Carrega os dados existentes (modo incremental) e define a data inicial da busca.
+        
+        Args:
+            nome: Nome da série.
+            data_inicio: Data inicial da janela completa de extração.
+            data_fim: Data final da extração.
+            incremental: Se a extração é incremental.
+            
+        Returns:
+            Tupla (dados já armazenados, data inicial a ser buscada).
+        """
+        df_existente = self._carregar_dados_existentes(nome) if incremental else criar_serie_vazia()
+        
+        if not df_existente.empty:
+            config = obter_configuracao()
+            dias_sobreposicao = config["extracao"]["bcb"]["dias_sobreposicao"]
+            ultima_data = df_existente['data'].max().date()
+            # Recua alguns dias para capturar revisões dos últimos valores publicados
+            data_inicio = min(ultima_data - datetime.timedelta(days=dias_sobreposicao), data_fim)
+            logger.info(f"Extração incremental de {nome} a partir de {data_inicio.isoformat()} "
+                        f"(última observação armazenada: {ultima_data.isoformat()})")
+        
+        return df_existente, data_inicio
+    
+    def _concluir_extracao(self, nome: str, dados: Optional[List[Dict[str, Any]]],
+                           df_existente: pd.DataFrame) -> bool:
+        """
+        Processa os dados recebidos, mescla-os aos existentes e salva a série.
+        
+        Args:
+            nome: Nome da série.
+            dados: Dados retornados pela API (None em caso de erro).
+            df_existente: Dados já armazenados (vazio na extração completa).
+            
+        Returns:
+            True se a série foi salva com sucesso, False caso contrário.
+        """
+        if dados is None or (not dados and df_existente.empty):
+            logger.warning(f"Não foi possível obter dados para {nome}.")
+            return False
+        
+        # Processar os dados para formato padronizado
+        df = self._processar_dados_colunar(dados, nome)
+        
+        if not df_existente.empty:
+            logger.info(f"{len(df)} observações recebidas para {nome} na extração incremental.")
+            df = self._mesclar_dados(df_existente, df)
+        
+        return self._salvar_serie(nome, df)
+    
     def _processar_dados(self, dados: List[Dict[str, Any]], nome_serie: str) -> List[Dict[str, Any]]:
         """
         Processa os dados da série para um formato padronizado.
@@ -126,31 +413,56 @@ class ExtratorBCB:
         Returns:
             Lista de dicionários com os dados processados.
         """
-        dados_processados = []
+        df = self._processar_dados_colunar(dados, nome_serie)
         
-        for item in dados:
-            # Converter data para formato ISO
-            try:
-                data_str = item.get('data')
-                data_obj = datetime.datetime.strptime(data_str, '%d/%m/%Y')
-                data_iso = data_obj.strftime('%Y-%m-%d')
-                
-                # Converter valor para float
-                valor_str = item.get('valor', '0').replace(',', '.')
-                valor = float(valor_str)
-                
-                # Criar item processado
-                item_processado = {
-                    'data': data_iso,
-                    'valor': valor
-                }
-                
-                dados_processados.append(item_processado)
-            except (ValueError, KeyError) as e:
-                logger.warning(f"Erro ao processar item da série {nome_serie}: {e}")
-                continue
+        # Datas em formato ISO (YYYY-MM-DD) convertidas de uma só vez pelo NumPy
+        datas_iso = df['data'].to_numpy().astype('datetime64[D]').astype(str).tolist()
+        valores = df['valor'].tolist()
         
-        return dados_processados
+        return [{'data': data, 'valor': valor} for data, valor in zip(datas_iso, valores)]
+    
+    def _processar_dados_colunar(self, dados: List[Dict[str, Any]], nome_serie: str) -> pd.DataFrame:
+        """
+        Processa os dados da série de forma vetorizada.
+        
+        Todas as datas são convertidas de uma vez com formato fixo e os valores
+        com vírgula decimal são convertidos em bloco, aceitando o mesmo que o
+        strptime e o float() da versão item a item (inclusive dia e mês sem
+        zero à esquerda e o valor 'nan', mantido como NaN). Itens inválidos e
+        datas fora do intervalo de datetime64[ns] são descartados e
+        contabilizados em uma única mensagem de log.
+        
+        Args:
+            dados: Lista de dicionários com os dados da série (formato do SGS).
+            nome_serie: Nome da série para identificação.
+            
+        Returns:
+            DataFrame com as colunas 'data' (datetime64) e 'valor' (float64).
+        """
+        if not dados:
+            return pd.DataFrame({'data': pd.Series(dtype='datetime64[ns]'), 'valor': pd.Series(dtype='float64')})
+        
+        # Valor ausente é tratado como '0', como no formato histórico do extrator
+        valores_brutos = [item.get('valor', '0') for item in dados]
+        datas = pd.Series(converter_datas_sgs([item.get('data') for item in dados]))
+        valores = pd.Series(converter_valores_sgs(valores_brutos))
+        
+        valores_invalidos = valores.isna()
+        if valores_invalidos.any():
+            # O texto 'nan' é aceito por float() e mantido como NaN, como no formato histórico
+            nulos = pd.Series(valores_brutos, dtype=object)[valores_invalidos]
+            literais = nulos.map(lambda valor: isinstance(valor, str) and valor.strip().lower().lstrip('+-') == 'nan')
+            valores_invalidos[literais[literais].index] = False
+        
+        validos = datas.notna() & ~valores_invalidos
+        num_invalidos = int((~validos).sum())
+        if num_invalidos:
+            logger.warning(f"{num_invalidos} de {len(dados)} itens da série {nome_serie} descartados por data ou valor inválido.")
+        
+        return pd.DataFrame({
+            'data': datas[validos].to_numpy().astype('datetime64[ns]'),
+            'valor': valores[validos].to_numpy(dtype='float64')
+        })
     
     def adicionar_serie(self, codigo: str, nome: str) -> None:
         """
@@ -182,17 +494,39 @@ class ExtratorBCB:
 
 
 # Função para uso direto via linha de comando
-def executar():
+def executar(argumentos: List[str] = None):
     """Função principal para execução direta do script."""
+    parser = argparse.ArgumentParser(description="Extração de séries temporais do BCB (SGS).")
+    parser.add_argument("--completo", action="store_true",
+                        help="Ignora os dados armazenados e baixa toda a janela de dias retroativos.")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Busca apenas as datas posteriores à última observação armazenada.")
+    parser.add_argument("--async", dest="assincrono", action="store_true",
+                        help="Usa o extrator assíncrono (asyncio/aiohttp).")
+    parser.add_argument("--timeout", type=float, default=None,
+                        help="Tempo limite total da extração assíncrona, em segundos.")
+    args = parser.parse_args(argumentos)
+    
     # Configurar logging
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
     
+    # Sem flags, prevalece a configuração (CONFIGURACAO_EXTRACAO["bcb"]["incremental"])
+    incremental = None
+    if args.completo:
+        incremental = False
+    elif args.incremental:
+        incremental = True
+    
     # Criar extrator e executar
-    extrator = ExtratorBCB()
-    resultados = extrator.extrair_todas_series()
+    if args.assincrono:
+        from src.dados.extratores.bcb_assincrono import executar_assincrono
+        resultados = executar_assincrono(incremental=incremental, timeout=args.timeout)
+    else:
+        extrator = ExtratorBCB()
+        resultados = extrator.extrair_todas_series(incremental=incremental)
     
     # Exibir resultados
     for nome, sucesso in resultados.items():
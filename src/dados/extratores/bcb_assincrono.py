@@ -0,0 +1,251 @@
+"""
+Módulo de extração assíncrona de dados do Banco Central do Brasil (BCB).
+
+Este módulo contém uma variante do ExtratorBCB baseada em asyncio, para ser
+embutida em serviços assíncronos (por exemplo, um processo que também
+atualiza o cache do dashboard) sem recorrer a executar() em subprocesso.
+As requisições usam um cliente HTTP assíncrono com semáforo de concorrência
+e a leitura e gravação de arquivos é feita fora do laço de eventos.
+"""
+
+import asyncio
+import datetime
+import logging
+from typing import Dict, List, Optional, Any
+
+from src.utils.configuracao import obter_configuracao
+from src.dados.extratores.bcb import ExtratorBCB
+from src.dados.extratores.cliente_http import ClienteHTTPAssincrono, aiohttp
+
+# Configurar logger
+logger = logging.getLogger(__name__)
+
+
+class ExtratorBCBAssincrono(ExtratorBCB):
+    """
+    Extrator de dados do BCB baseado em asyncio.
+
+    Reaproveita do ExtratorBCB o processamento, a mesclagem incremental e o
+    armazenamento das séries; apenas a busca na API e a orquestração são
+    assíncronas.
+
+    Attributes:
+        cliente_http_assincrono (ClienteHTTPAssincrono): Cliente HTTP assíncrono
+            injetado (se None, um cliente é criado a cada extração).
+    """
+
+    def __init__(self, diretorio_saida: str = None, cliente_http_assincrono: ClienteHTTPAssincrono = None):
+        """
+        Inicializa o extrator assíncrono de dados do BCB.
+
+        Args:
+            diretorio_saida: Diretório para salvar os arquivos de dados.
+            cliente_http_assincrono: Cliente HTTP assíncrono já aberto, gerenciado
+                pelo chamador (opcional).
+        """
+        super().__init__(diretorio_saida)
+        self.cliente_http_assincrono = cliente_http_assincrono
+        self._cliente_ativo: Optional[ClienteHTTPAssincrono] = None
+        self._semaforo: Optional[asyncio.Semaphore] = None
+        self._gravacoes: Dict[str, asyncio.Task] = {}
+
+    async def buscar_dados_serie_async(self, codigo_serie: str, data_inicio: str,
+                                       data_fim: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Busca dados de uma série da API do BCB de forma assíncrona.
+
+        Períodos longos são divididos em janelas buscadas concorrentemente,
+        como em buscar_dados_serie.
+
+        Args:
+            codigo_serie: Código da série no SGS.
+            data_inicio: Data inicial no formato DD/MM/YYYY.
+            data_fim: Data final no formato DD/MM/YYYY.
+
+        Returns:
+            Lista de dicionários com os dados da série (vazia se não houver
+            observações no período) ou None em caso de erro.
+        """
+        config = obter_configuracao()
+        inicio = datetime.datetime.strptime(data_inicio, '%d/%m/%Y').date()
+        fim = datetime.datetime.strptime(data_fim, '%d/%m/%Y').date()
+        janelas = self._dividir_periodo(inicio, fim, config["extracao"]["bcb"]["dias_por_janela"])
+
+        partes = await asyncio.gather(*(
+            self._buscar_janela_async(codigo_serie, ini.strftime('%d/%m/%Y'), fim_janela.strftime('%d/%m/%Y'))
+            for ini, fim_janela in janelas
+        ))
+
+        if any(parte is None for parte in partes):
+            logger.error(f"Falha ao buscar uma ou mais janelas da série {codigo_serie}")
+            return None
+
+        dados = []
+        datas_vistas = set()
+        for parte in partes:
+            for item in parte:
+                data = item.get('data')
+                if data not in datas_vistas:
+                    datas_vistas.add(data)
+                    dados.append(item)
+        return dados
+
+    async def _buscar_janela_async(self, codigo_serie: str, data_inicio: str,
+                                   data_fim: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Busca um único intervalo de datas, limitado pelo semáforo de concorrência.
+
+        Args:
+            codigo_serie: Código da série no SGS.
+            data_inicio: Data inicial no formato DD/MM/YYYY.
+            data_fim: Data final no formato DD/MM/YYYY.
+
+        Returns:
+            Lista de dicionários com os dados (vazia se não houver observações)
+            ou None em caso de erro.
+        """
+        url = self.url_base.format(codigo_serie)
+        params = {"formato": "json", "dataInicial": data_inicio, "dataFinal": data_fim}
+
+        async with self._semaforo:
+            try:
+                logger.info(f"Buscando dados para série {codigo_serie} de {data_inicio} até {data_fim}")
+                status, dados = await self._cliente_ativo.obter_json(url, params=params)
+                if status == 404:
+                    logger.info(f"Sem dados para a série {codigo_serie} entre {data_inicio} e {data_fim}")
+                    return []
+                return dados
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                logger.error(f"Erro ao buscar dados para a série {codigo_serie}: {e}")
+                return None
+
+    async def _extrair_serie_async(self, codigo: str, nome: str, data_inicio: datetime.date,
+                                   data_fim: datetime.date, incremental: bool) -> bool:
+        """
+        Busca, processa e salva os dados de uma única série de forma assíncrona.
+
+        Args:
+            codigo: Código da série no SGS.
+            nome: Nome da série.
+            data_inicio: Data inicial da janela completa de extração.
+            data_fim: Data final da extração.
+            incremental: Se a extração é incremental.
+
+        Returns:
+            True se a série foi extraída e salva com sucesso, False caso contrário.
+        """
+        try:
+            df_existente, data_inicio = await asyncio.to_thread(
+                self._preparar_extracao, nome, data_inicio, data_fim, incremental
+            )
+
+            logger.info(f"Iniciando extração de dados para {nome} (SGS {codigo})...")
+            dados = await self.buscar_dados_serie_async(
+                codigo, data_inicio.strftime('%d/%m/%Y'), data_fim.strftime('%d/%m/%Y')
+            )
+
+            # Processamento e gravação (atômica) rodam em thread para não bloquear o laço de eventos.
+            # Cancelar a espera não interrompe a thread, então a gravação é protegida com shield e
+            # registrada para que extrair_todas_series_async aguarde seu término antes do manifesto.
+            gravacao = asyncio.create_task(asyncio.to_thread(self._concluir_extracao, nome, dados, df_existente))
+            self._gravacoes[nome] = gravacao
+            return await asyncio.shield(gravacao)
+        except asyncio.CancelledError:
+            logger.warning(f"Extração de {nome} cancelada.")
+            raise
+        except Exception as e:
+            logger.error(f"Erro inesperado na extração de {nome}: {e}")
+            return False
+
+    async def extrair_todas_series_async(self, dias_retroativos: int = None, max_concorrencia: int = None,
+                                         incremental: bool = None, timeout: float = None) -> Dict[str, bool]:
+        """
+        Extrai dados de todas as séries configuradas de forma assíncrona.
+
+        Todas as séries rodam como tarefas de um mesmo TaskGroup. Se o tempo
+        limite total for atingido, as tarefas pendentes são canceladas e as
+        séries correspondentes ficam marcadas como falha. Gravações já
+        iniciadas não são canceladas: o manifesto só é salvo depois que todas
+        terminam, e as séries gravadas com sucesso contam como extraídas.
+
+        Args:
+            dias_retroativos: Número de dias para buscar dados retroativamente.
+            max_concorrencia: Número máximo de requisições simultâneas à API.
+            incremental: Se True, busca apenas a partir da última observação armazenada.
+            timeout: Tempo limite total da extração, em segundos (None para
+                usar CONFIGURACAO_EXTRACAO["bcb"]["timeout_total"]).
+
+        Returns:
+            Dicionário com o status de extração de cada série.
+        """
+        config = obter_configuracao()
+        if dias_retroativos is None:
+            dias_retroativos = config["extracao"]["bcb"]["dias_retroativos"]
+        if max_concorrencia is None:
+            max_concorrencia = config["extracao"]["bcb"]["max_concorrencia"]
+        if incremental is None:
+            incremental = config["extracao"]["bcb"]["incremental"]
+        if timeout is None:
+            timeout = config["extracao"]["bcb"]["timeout_total"]
+
+        data_fim = datetime.date.today()
+        data_inicio = data_fim - datetime.timedelta(days=dias_retroativos)
+
+        series = list(self.series.items())
+        if not series:
+            logger.warning("Nenhuma série configurada para extração.")
+            return {}
+
+        resultados = {nome: False for _, nome in series}
+        self.series_alteradas = []
+        self._gravacoes = {}
+        self._semaforo = asyncio.Semaphore(max(1, max_concorrencia))
+
+        async def extrair(codigo: str, nome: str) -> None:
+            resultados[nome] = await self._extrair_serie_async(codigo, nome, data_inicio, data_fim, incremental)
+
+        cliente = self.cliente_http_assincrono or ClienteHTTPAssincrono(limitador=self.cliente_http.limitador)
+        try:
+            if self.cliente_http_assincrono is None:
+                await cliente.__aenter__()
+            self._cliente_ativo = cliente
+
+            async with asyncio.timeout(timeout):
+                async with asyncio.TaskGroup() as grupo:
+                    for codigo, nome in series:
+                        grupo.create_task(extrair(codigo, nome), name=f"extracao_{nome}")
+        except TimeoutError:
+            pendentes = [nome for nome, sucesso in resultados.items() if not sucesso]
+            logger.error(f"Tempo limite de {timeout}s atingido; extrações canceladas ou com falha: {', '.join(pendentes)}")
+        finally:
+            self._cliente_ativo = None
+            if self.cliente_http_assincrono is None:
+                await cliente.fechar()
+
+        # Aguardar gravações em andamento (após o tempo limite, suas threads continuam rodando)
+        # antes de salvar o manifesto e de ler series_alteradas
+        await asyncio.gather(*self._gravacoes.values(), return_exceptions=True)
+        for nome, gravacao in self._gravacoes.items():
+            if not resultados[nome] and not gravacao.cancelled() and gravacao.exception() is None and gravacao.result():
+                resultados[nome] = True
+                logger.info(f"Gravação de {nome} concluída após o tempo limite.")
+        self._gravacoes = {}
+
+        await asyncio.to_thread(self.manifesto.salvar)
+        logger.info(f"Coleta de dados do BCB concluída. Séries alteradas: {', '.join(self.series_alteradas) or 'nenhuma'}.")
+        return resultados
+
+
+def executar_assincrono(incremental: bool = None, timeout: float = None) -> Dict[str, bool]:
+    """
+    Executa a extração assíncrona em um novo laço de eventos.
+
+    Args:
+        incremental: Se a extração é incremental (None usa a configuração).
+        timeout: Tempo limite total, em segundos (None usa a configuração).
+
+    Returns:
+        Dicionário com o status de extração de cada série.
+    """
+    extrator = ExtratorBCBAssincrono()
+    return asyncio.run(extrator.extrair_todas_series_async(incremental=incremental, timeout=timeout))
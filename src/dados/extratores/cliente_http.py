@@ -0,0 +1,376 @@
+"""
+Módulo de cliente HTTP compartilhado pelos extratores de dados.
+
+Este módulo contém um cliente HTTP com sessão reutilizável (keep-alive e pool
+de conexões), novas tentativas com backoff exponencial e jitter que respeitam
+o cabeçalho Retry-After, e um limitador de taxa por host. É usado pelos
+extratores do BCB e do IBGE. Há também uma variante assíncrona (aiohttp),
+com a mesma política de novas tentativas, para o extrator assíncrono.
+"""
+
+import time
+import random
+import asyncio
+import threading
+import logging
+import datetime
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Any, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.utils.configuracao import obter_configuracao
+
+try:
+    import aiohttp
+except ImportError:  # Dependência opcional, necessária apenas para a extração assíncrona
+    aiohttp = None
+
+# Configurar logger
+logger = logging.getLogger(__name__)
+
+# Códigos HTTP considerados transitórios (vale a pena tentar novamente)
+STATUS_TRANSITORIOS = frozenset({429, 500, 502, 503, 504})
+
+
+class LimitadorTaxa:
+    """
+    Limitador de taxa por host baseado em intervalo mínimo entre requisições.
+
+    O limitador apenas reserva horários de envio e informa quanto tempo o
+    chamador deve esperar, o que permite usá-lo tanto com threads
+    (time.sleep) quanto com asyncio (asyncio.sleep).
+
+    Attributes:
+        intervalo (float): Intervalo mínimo, em segundos, entre requisições ao mesmo host.
+    """
+
+    def __init__(self, requisicoes_por_segundo: float):
+        """
+        Inicializa o limitador de taxa.
+
+        Args:
+            requisicoes_por_segundo: Número máximo de requisições por segundo para
+                cada host (0 ou negativo desabilita o limite).
+        """
+        self.intervalo = 1.0 / requisicoes_por_segundo if requisicoes_por_segundo > 0 else 0.0
+        self._proximo_envio: Dict[str, float] = {}
+        self._trava = threading.Lock()
+
+    def reservar(self, host: str) -> float:
+        """
+        Reserva o próximo horário de envio disponível para um host.
+
+        Args:
+            host: Host de destino da requisição.
+
+        Returns:
+            Tempo de espera, em segundos, antes de enviar a requisição.
+        """
+        if self.intervalo <= 0:
+            return 0.0
+
+        with self._trava:
+            agora = time.monotonic()
+            horario = max(agora, self._proximo_envio.get(host, agora))
+            self._proximo_envio[host] = horario + self.intervalo
+            return horario - agora
+
+
+def calcular_espera(tentativa: int, backoff_base: float, backoff_maximo: float,
+                    retry_after: Optional[float] = None) -> float:
+    """
+    Calcula o tempo de espera antes de uma nova tentativa.
+
+    Usa backoff exponencial com jitter completo, a menos que o servidor tenha
+    informado o tempo de espera pelo cabeçalho Retry-After.
+
+    Args:
+        tentativa: Número da tentativa que falhou (começando em 0).
+        backoff_base: Tempo base, em segundos, do backoff exponencial.
+        backoff_maximo: Tempo máximo de espera, em segundos.
+        retry_after: Tempo de espera indicado pelo servidor, se houver.
+
+    Returns:
+        Tempo de espera em segundos.
+    """
+    if retry_after is not None:
+        return retry_after
+    return random.uniform(0, min(backoff_maximo, backoff_base * (2 ** tentativa)))
+
+
+def interpretar_retry_after(valor: Optional[str]) -> Optional[float]:
+    """
+    Interpreta o cabeçalho Retry-After (segundos ou data HTTP).
+
+    Args:
+        valor: Valor do cabeçalho.
+
+    Returns:
+        Tempo de espera em segundos ou None se o cabeçalho estiver ausente ou inválido.
+    """
+    if not valor:
+        return None
+
+    valor = valor.strip()
+    if valor.isdigit():
+        return float(valor)
+
+    try:
+        data = parsedate_to_datetime(valor)
+        if data.tzinfo is None:
+            data = data.replace(tzinfo=datetime.timezone.utc)
+        return max(0.0, (data - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+class ClienteHTTP:
+    """
+    Cliente HTTP com sessão persistente, novas tentativas e limite de taxa.
+
+    Attributes:
+        timeout (float): Tempo limite padrão de cada requisição, em segundos.
+        max_tentativas (int): Número máximo de tentativas por requisição.
+        backoff_base (float): Tempo base do backoff exponencial, em segundos.
+        backoff_maximo (float): Tempo máximo de espera entre tentativas, em segundos.
+        limitador (LimitadorTaxa): Limitador de taxa por host.
+        sessao (requests.Session): Sessão HTTP reutilizada entre requisições.
+    """
+
+    def __init__(self, timeout: float = None, max_tentativas: int = None,
+                 backoff_base: float = None, backoff_maximo: float = None,
+                 requisicoes_por_segundo: float = None, tamanho_pool: int = None):
+        """
+        Inicializa o cliente HTTP.
+
+        Os parâmetros não informados são lidos de CONFIGURACAO_EXTRACAO["http"].
+
+        Args:
+            timeout: Tempo limite de cada requisição, em segundos.
+            max_tentativas: Número máximo de tentativas por requisição.
+            backoff_base: Tempo base do backoff exponencial, em segundos.
+            backoff_maximo: Tempo máximo de espera entre tentativas, em segundos.
+            requisicoes_por_segundo: Limite de requisições por segundo por host.
+            tamanho_pool: Número máximo de conexões mantidas por host.
+        """
+        config = obter_configuracao()["extracao"]["http"]
+        self.timeout = timeout if timeout is not None else config["timeout"]
+        self.max_tentativas = max(1, max_tentativas if max_tentativas is not None else config["max_tentativas"])
+        self.backoff_base = backoff_base if backoff_base is not None else config["backoff_base"]
+        self.backoff_maximo = backoff_maximo if backoff_maximo is not None else config["backoff_maximo"]
+        self.limitador = LimitadorTaxa(
+            requisicoes_por_segundo if requisicoes_por_segundo is not None else config["requisicoes_por_segundo"]
+        )
+        self.tamanho_pool = tamanho_pool if tamanho_pool is not None else config["tamanho_pool"]
+
+        # Sessão com pool de conexões (keep-alive); as novas tentativas são tratadas aqui
+        self.sessao = requests.Session()
+        adaptador = HTTPAdapter(pool_connections=self.tamanho_pool, pool_maxsize=self.tamanho_pool, max_retries=0)
+        self.sessao.mount("https://", adaptador)
+        self.sessao.mount("http://", adaptador)
+
+    def obter(self, url: str, params: Dict[str, Any] = None, timeout: float = None) -> requests.Response:
+        """
+        Executa uma requisição GET com novas tentativas para falhas transitórias.
+
+        Args:
+            url: URL da requisição.
+            params: Parâmetros da query string.
+            timeout: Tempo limite da requisição (usa o padrão do cliente se omitido).
+
+        Returns:
+            Resposta HTTP. Respostas com erro não transitório, ou da última
+            tentativa, são devolvidas ao chamador (use raise_for_status).
+
+        Raises:
+            requests.exceptions.RequestException: Se todas as tentativas falharem
+                por erro de conexão ou tempo limite.
+        """
+        host = urlsplit(url).netloc
+        timeout = timeout if timeout is not None else self.timeout
+
+        for tentativa in range(self.max_tentativas):
+            time.sleep(self.limitador.reservar(host))
+
+            retry_after = None
+            try:
+                resposta = self.sessao.get(url, params=params, timeout=timeout)
+                if resposta.status_code not in STATUS_TRANSITORIOS:
+                    return resposta
+                motivo = f"HTTP {resposta.status_code}"
+                retry_after = interpretar_retry_after(resposta.headers.get("Retry-After"))
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                resposta = None
+                motivo = str(e)
+                if tentativa == self.max_tentativas - 1:
+                    raise
+
+            if tentativa == self.max_tentativas - 1:
+                break
+
+            espera = calcular_espera(tentativa, self.backoff_base, self.backoff_maximo, retry_after)
+            if espera > self.backoff_maximo and retry_after is not None:
+                logger.warning(f"Servidor {host} pediu espera de {espera:.0f}s (Retry-After); desistindo de {url}")
+                break
+
+            logger.warning(f"Falha transitória em {url} ({motivo}); nova tentativa "
+                           f"{tentativa + 2}/{self.max_tentativas} em {espera:.1f}s")
+            time.sleep(espera)
+
+        return resposta
+
+    def fechar(self) -> None:
+        """Fecha a sessão e libera as conexões do pool."""
+        self.sessao.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.fechar()
+
+
+_cliente_padrao: Optional[ClienteHTTP] = None
+_trava_cliente_padrao = threading.Lock()
+
+
+def obter_cliente_padrao() -> ClienteHTTP:
+    """
+    Retorna o cliente HTTP compartilhado pelo processo.
+
+    Compartilhar o cliente entre extratores reaproveita as conexões abertas e
+    aplica um único limite de taxa por host.
+
+    Returns:
+        Instância única de ClienteHTTP.
+    """
+    global _cliente_padrao
+    with _trava_cliente_padrao:
+        if _cliente_padrao is None:
+            _cliente_padrao = ClienteHTTP()
+        return _cliente_padrao
+
+
+class ClienteHTTPAssincrono:
+    """
+    Cliente HTTP assíncrono (aiohttp) com pool de conexões, novas tentativas e limite de taxa.
+
+    Deve ser usado como gerenciador de contexto assíncrono dentro do laço de
+    eventos em que as requisições serão feitas.
+
+    Attributes:
+        timeout (float): Tempo limite padrão de cada requisição, em segundos.
+        max_tentativas (int): Número máximo de tentativas por requisição.
+        backoff_base (float): Tempo base do backoff exponencial, em segundos.
+        backoff_maximo (float): Tempo máximo de espera entre tentativas, em segundos.
+        limitador (LimitadorTaxa): Limitador de taxa por host.
+        tamanho_pool (int): Número máximo de conexões simultâneas por host.
+    """
+
+    def __init__(self, timeout: float = None, max_tentativas: int = None,
+                 backoff_base: float = None, backoff_maximo: float = None,
+                 requisicoes_por_segundo: float = None, tamanho_pool: int = None,
+                 limitador: LimitadorTaxa = None):
+        """
+        Inicializa o cliente HTTP assíncrono.
+
+        Os parâmetros não informados são lidos de CONFIGURACAO_EXTRACAO["http"].
+
+        Args:
+            timeout: Tempo limite de cada requisição, em segundos.
+            max_tentativas: Número máximo de tentativas por requisição.
+            backoff_base: Tempo base do backoff exponencial, em segundos.
+            backoff_maximo: Tempo máximo de espera entre tentativas, em segundos.
+            requisicoes_por_segundo: Limite de requisições por segundo por host.
+            tamanho_pool: Número máximo de conexões simultâneas por host.
+            limitador: Limitador de taxa compartilhado (por exemplo, com o cliente síncrono).
+
+        Raises:
+            ImportError: Se o aiohttp não estiver instalado.
+        """
+        if aiohttp is None:
+            raise ImportError("O pacote aiohttp é necessário para a extração assíncrona.")
+
+        config = obter_configuracao()["extracao"]["http"]
+        self.timeout = timeout if timeout is not None else config["timeout"]
+        self.max_tentativas = max(1, max_tentativas if max_tentativas is not None else config["max_tentativas"])
+        self.backoff_base = backoff_base if backoff_base is not None else config["backoff_base"]
+        self.backoff_maximo = backoff_maximo if backoff_maximo is not None else config["backoff_maximo"]
+        self.limitador = limitador or LimitadorTaxa(
+            requisicoes_por_segundo if requisicoes_por_segundo is not None else config["requisicoes_por_segundo"]
+        )
+        self.tamanho_pool = tamanho_pool if tamanho_pool is not None else config["tamanho_pool"]
+        self.sessao = None
+
+    async def __aenter__(self):
+        conector = aiohttp.TCPConnector(limit_per_host=self.tamanho_pool)
+        self.sessao = aiohttp.ClientSession(connector=conector)
+        return self
+
+    async def __aexit__(self, *args):
+        await self.fechar()
+
+    async def obter_json(self, url: str, params: Dict[str, Any] = None,
+                         timeout: float = None) -> Tuple[int, Any]:
+        """
+        Executa uma requisição GET e decodifica a resposta JSON.
+
+        Falhas transitórias (conexão, tempo limite, 429 e 5xx) são repetidas
+        com backoff exponencial e jitter, respeitando o Retry-After.
+
+        Args:
+            url: URL da requisição.
+            params: Parâmetros da query string.
+            timeout: Tempo limite da requisição (usa o padrão do cliente se omitido).
+
+        Returns:
+            Tupla (código HTTP, conteúdo JSON). Para respostas 404, o conteúdo é None.
+
+        Raises:
+            aiohttp.ClientError: Para erros HTTP não transitórios ou quando todas
+                as tentativas falharem.
+            asyncio.TimeoutError: Se a última tentativa exceder o tempo limite.
+        """
+        if self.sessao is None:
+            raise RuntimeError("ClienteHTTPAssincrono deve ser usado com 'async with'.")
+
+        host = urlsplit(url).netloc
+        limite = aiohttp.ClientTimeout(total=timeout if timeout is not None else self.timeout)
+
+        for tentativa in range(self.max_tentativas):
+            await asyncio.sleep(self.limitador.reservar(host))
+            ultima_tentativa = tentativa == self.max_tentativas - 1
+
+            retry_after = None
+            try:
+                async with self.sessao.get(url, params=params, timeout=limite) as resposta:
+                    if resposta.status == 404:
+                        return resposta.status, None
+                    if resposta.status not in STATUS_TRANSITORIOS or ultima_tentativa:
+                        resposta.raise_for_status()
+                        # O SGS nem sempre informa o content-type como JSON
+                        return resposta.status, await resposta.json(content_type=None)
+                    motivo = f"HTTP {resposta.status}"
+                    retry_after = interpretar_retry_after(resposta.headers.get("Retry-After"))
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if ultima_tentativa:
+                    raise
+                motivo = str(e) or e.__class__.__name__
+
+            espera = calcular_espera(tentativa, self.backoff_base, self.backoff_maximo, retry_after)
+            if espera > self.backoff_maximo and retry_after is not None:
+                logger.warning(f"Servidor {host} pediu espera de {espera:.0f}s (Retry-After); desistindo de {url}")
+                raise aiohttp.ClientError(f"{motivo} em {url}; Retry-After acima do limite de espera")
+
+            logger.warning(f"Falha transitória em {url} ({motivo}); nova tentativa "
+                           f"{tentativa + 2}/{self.max_tentativas} em {espera:.1f}s")
+            await asyncio.sleep(espera)
+
+    async def fechar(self) -> None:
+        """Fecha a sessão e libera as conexões do pool."""
+        if self.sessao is not None:
+            await self.sessao.close()
+            self.sessao = None
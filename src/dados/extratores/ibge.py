@@ -0,0 +1,362 @@
+"""
+Módulo para extração de dados do Instituto Brasileiro de Geografia e Estatística (IBGE).
+
+Este módulo contém classes e funções para extrair dados dos agregados do
+SIDRA por meio da API de agregados do IBGE (servicodados, versão 3).
+"""
+
+import numpy as np
+import pandas as pd
+import datetime
+import logging
+import argparse
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple
+from src.utils.configuracao import obter_configuracao
+from src.dados.armazenamento import criar_serie_vazia
+from src.dados.extratores.base import ExtratorSeries
+from src.dados.extratores.cliente_http import ClienteHTTP, obter_cliente_padrao
+
+# Configurar logger
+logger = logging.getLogger(__name__)
+
+# Número de meses coberto por cada período do SIDRA, por tipo de período
+MESES_POR_PERIODO = {
+    "mensal": 1,
+    "trimestre_movel": 1,  # O código AAAAMM identifica o último mês do trimestre móvel
+    "trimestre": 3
+}
+
+
+def converter_periodos_sidra(codigos: List[str], tipo_periodo: str) -> np.ndarray:
+    """
+    Converte códigos de período do SIDRA em datas de forma vetorizada.
+
+    Códigos mensais e de trimestre móvel (AAAAMM) viram o primeiro dia do mês;
+    códigos trimestrais (AAAATT) viram o primeiro dia do trimestre.
+
+    Args:
+        codigos: Lista de códigos de período com 6 dígitos (inválidos viram NaT).
+        tipo_periodo: Tipo de período ("mensal", "trimestre_movel" ou "trimestre").
+
+    Returns:
+        Array datetime64[D] com uma posição por código de entrada.
+
+    Raises:
+        ValueError: Se o tipo de período não for suportado.
+    """
+    if tipo_periodo not in MESES_POR_PERIODO:
+        raise ValueError(f"Tipo de período não suportado: {tipo_periodo}")
+
+    brutos = np.array(codigos, dtype=str)
+    if brutos.size == 0:
+        return np.array([], dtype='datetime64[D]')
+
+    formato_valido = (np.char.str_len(brutos) == 6) & np.char.isdigit(brutos)
+    numeros = np.where(formato_valido, brutos, '0').astype(np.int64)
+    ano, subperiodo = np.divmod(numeros, 100)
+
+    meses_por_periodo = MESES_POR_PERIODO[tipo_periodo]
+    validos = formato_valido & (subperiodo >= 1) & (subperiodo <= 12 // meses_por_periodo)
+
+    # Meses desde 1970-01, a origem do datetime64
+    meses = (ano - 1970) * 12 + (subperiodo - 1) * meses_por_periodo
+    datas = meses.astype('datetime64[M]').astype('datetime64[D]')
+    return np.where(validos, datas, np.datetime64('NaT'))
+
+
+def converter_valores_sidra(valores: List[Optional[str]]) -> np.ndarray:
+    """
+    Converte valores do SIDRA de forma vetorizada.
+
+    O SIDRA usa ponto decimal e marca valores indisponíveis com símbolos
+    ("-", "..", "...", "X"), que viram NaN.
+
+    Args:
+        valores: Lista de valores em texto.
+
+    Returns:
+        Array float64 com uma posição por item de entrada.
+    """
+    if not valores:
+        return np.array([], dtype='float64')
+
+    try:
+        return np.array(valores, dtype='float64')
+    except (TypeError, ValueError):
+        return pd.to_numeric(pd.Series(valores, dtype=object), errors='coerce').to_numpy(dtype='float64')
+
+
+def formatar_periodo_sidra(data: datetime.date, tipo_periodo: str) -> str:
+    """
+    Formata uma data como código de período do SIDRA.
+
+    Args:
+        data: Data a ser formatada.
+        tipo_periodo: Tipo de período ("mensal", "trimestre_movel" ou "trimestre").
+
+    Returns:
+        Código AAAAMM (mensal e trimestre móvel) ou AAAATT (trimestre).
+    """
+    if tipo_periodo == "trimestre":
+        return f"{data.year}{(data.month - 1) // 3 + 1:02d}"
+    return f"{data.year}{data.month:02d}"
+
+
+class ExtratorIBGE(ExtratorSeries):
+    """
+    Classe para extrair dados dos agregados do SIDRA/IBGE.
+
+    Attributes:
+        url_base (str): URL base da API de agregados do IBGE.
+        diretorio_saida (str): Diretório para salvar os arquivos de dados.
+        agregados (Dict[str, Dict[str, Any]]): Configuração de cada agregado, por nome da série.
+        cliente_http (ClienteHTTP): Cliente HTTP com pool de conexões e novas tentativas.
+    """
+
+    def __init__(self, diretorio_saida: str = None, cliente_http: ClienteHTTP = None):
+        """
+        Inicializa o extrator de dados do IBGE.
+
+        Args:
+            diretorio_saida: Diretório para salvar os arquivos de dados.
+            cliente_http: Cliente HTTP a ser usado (por padrão, o cliente compartilhado do processo).
+        """
+        super().__init__(diretorio_saida)
+        config = obter_configuracao()
+        self.url_base = "https://servicodados.ibge.gov.br/api/v3/agregados/{agregado}/periodos/{periodos}/variaveis/{variavel}"
+        self.cliente_http = cliente_http or obter_cliente_padrao()
+
+        # Agregados padrão para extração
+        self.agregados = dict(config["extracao"]["ibge"]["agregados"])
+
+    def buscar_dados_agregado(self, config_agregado: Dict[str, Any], periodo_inicio: str,
+                              periodo_fim: str) -> Optional[Dict[str, str]]:
+        """
+        Busca os valores de uma variável de um agregado do SIDRA.
+
+        Args:
+            config_agregado: Configuração do agregado (id, variável, localidade etc.).
+            periodo_inicio: Código do período inicial (AAAAMM ou AAAATT).
+            periodo_fim: Código do período final (AAAAMM ou AAAATT).
+
+        Returns:
+            Dicionário {código do período: valor em texto} (vazio se não houver
+            observações no período) ou None em caso de erro.
+        """
+        url = self.url_base.format(
+            agregado=config_agregado["id"],
+            periodos=f"{periodo_inicio}-{periodo_fim}",
+            variavel=config_agregado["variavel"]
+        )
+        params = {"localidades": f"{config_agregado['nivel_geografico'].upper()}[{config_agregado['localidade']}]"}
+        if config_agregado.get("classificacao"):
+            params["classificacao"] = config_agregado["classificacao"]
+
+        try:
+            logger.info(f"Buscando dados do agregado {config_agregado['id']} de {periodo_inicio} até {periodo_fim}")
+            resposta = self.cliente_http.obter(url, params=params)
+            if resposta.status_code == 404:
+                logger.info(f"Sem dados para o agregado {config_agregado['id']} entre {periodo_inicio} e {periodo_fim}")
+                return {}
+            resposta.raise_for_status()
+            variaveis = resposta.json()
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.error(f"Erro ao buscar dados do agregado {config_agregado['id']}: {e}")
+            return None
+
+        # Estrutura: [variável] -> resultados (por classificação) -> séries (por localidade) -> {período: valor}
+        try:
+            if not variaveis or not variaveis[0]["resultados"]:
+                return {}
+            series = variaveis[0]["resultados"][0]["series"]
+            return dict(series[0]["serie"]) if series else {}
+        except (KeyError, IndexError, TypeError) as e:
+            logger.error(f"Resposta inesperada para o agregado {config_agregado['id']}: {e}")
+            return None
+
+    def extrair_todos_agregados(self, dias_retroativos: int = None, max_concorrencia: int = None,
+                                incremental: bool = None) -> Dict[str, bool]:
+        """
+        Extrai dados de todos os agregados configurados.
+
+        Os agregados são buscados, processados e salvos em paralelo por um pool
+        de threads.
+
+        Args:
+            dias_retroativos: Número de dias para buscar dados retroativamente.
+            max_concorrencia: Número máximo de agregados extraídos simultaneamente.
+            incremental: Se True, busca apenas os períodos a partir da última
+                observação armazenada (menos a sobreposição configurada).
+
+        Returns:
+            Dicionário com o status de extração de cada série.
+        """
+        config = obter_configuracao()
+        if dias_retroativos is None:
+            dias_retroativos = config["extracao"]["ibge"]["dias_retroativos"]
+        if max_concorrencia is None:
+            max_concorrencia = config["extracao"]["ibge"]["max_concorrencia"]
+        if incremental is None:
+            incremental = config["extracao"]["ibge"]["incremental"]
+
+        data_fim = datetime.date.today()
+        data_inicio = data_fim - datetime.timedelta(days=dias_retroativos)
+
+        agregados = list(self.agregados.items())
+        if not agregados:
+            logger.warning("Nenhum agregado configurado para extração.")
+            return {}
+
+        resultados = {}
+        self.series_alteradas = []
+        num_workers = max(1, min(max_concorrencia, len(agregados)))
+
+        with ThreadPoolExecutor(max_workers=num_workers, thread_name_prefix="extrator_ibge") as executor:
+            futuros = {
+                nome: executor.submit(self._extrair_agregado, nome, config_agregado, data_inicio, data_fim, incremental)
+                for nome, config_agregado in agregados
+            }
+            for nome, futuro in futuros.items():
+                try:
+                    resultados[nome] = futuro.result()
+                except Exception as e:
+                    logger.error(f"Erro inesperado na extração de {nome}: {e}")
+                    resultados[nome] = False
+
+        self.manifesto.salvar()
+        logger.info(f"Coleta de dados do IBGE concluída. Séries alteradas: {', '.join(self.series_alteradas) or 'nenhuma'}.")
+        return resultados
+
+    def _extrair_agregado(self, nome: str, config_agregado: Dict[str, Any], data_inicio: datetime.date,
+                          data_fim: datetime.date, incremental: bool = False) -> bool:
+        """
+        Busca, processa e salva os dados de um único agregado.
+
+        Args:
+            nome: Nome da série (usado como nome do arquivo).
+            config_agregado: Configuração do agregado.
+            data_inicio: Data inicial da janela completa de extração.
+            data_fim: Data final da extração.
+            incremental: Se a extração é incremental.
+
+        Returns:
+            True se a série foi extraída e salva com sucesso, False caso contrário.
+        """
+        tipo_periodo = config_agregado.get("tipo_periodo", "mensal")
+        df_existente, data_inicio = self._preparar_extracao(nome, tipo_periodo, data_inicio, data_fim, incremental)
+
+        logger.info(f"Iniciando extração de dados para {nome} (agregado {config_agregado['id']})...")
+        serie = self.buscar_dados_agregado(
+            config_agregado,
+            formatar_periodo_sidra(data_inicio, tipo_periodo),
+            formatar_periodo_sidra(data_fim, tipo_periodo)
+        )
+
+        if serie is None or (not serie and df_existente.empty):
+            logger.warning(f"Não foi possível obter dados para {nome}.")
+            return False
+
+        df = self._processar_dados_colunar(serie, nome, tipo_periodo)
+        if not df_existente.empty:
+            logger.info(f"{len(df)} observações recebidas para {nome} na extração incremental.")
+            df = self._mesclar_dados(df_existente, df)
+
+        return self._salvar_serie(nome, df)
+
+    def _preparar_extracao(self, nome: str, tipo_periodo: str, data_inicio: datetime.date,
+                           data_fim: datetime.date, incremental: bool) -> Tuple[pd.DataFrame, datetime.date]:
+        """
+        Carrega os dados existentes (modo incremental) e define a data inicial da busca.
+
+        Args:
+            nome: Nome da série.
+            tipo_periodo: Tipo de período do agregado.
+            data_inicio: Data inicial da janela completa de extração.
+            data_fim: Data final da extração.
+            incremental: Se a extração é incremental.
+
+        Returns:
+            Tupla (dados já armazenados, data inicial a ser buscada).
+        """
+        df_existente = self._carregar_dados_existentes(nome) if incremental else criar_serie_vazia()
+
+        if not df_existente.empty:
+            config = obter_configuracao()
+            periodos_sobreposicao = config["extracao"]["ibge"]["periodos_sobreposicao"]
+            ultima_data = df_existente['data'].max().to_datetime64().astype('datetime64[M]')
+            # Recua alguns períodos para capturar revisões dos últimos valores divulgados
+            recuo = periodos_sobreposicao * MESES_POR_PERIODO[tipo_periodo]
+            data_inicio = min((ultima_data - recuo).astype('datetime64[D]').item(), data_fim)
+            logger.info(f"Extração incremental de {nome} a partir de {data_inicio.isoformat()} "
+                        f"(última observação armazenada: {ultima_data})")
+
+        return df_existente, data_inicio
+
+    def _processar_dados_colunar(self, serie: Dict[str, str], nome_serie: str, tipo_periodo: str) -> pd.DataFrame:
+        """
+        Processa os dados de um agregado de forma vetorizada.
+
+        Args:
+            serie: Dicionário {código do período: valor em texto}.
+            nome_serie: Nome da série para identificação.
+            tipo_periodo: Tipo de período do agregado.
+
+        Returns:
+            DataFrame ordenado com as colunas 'data' (datetime64) e 'valor' (float64).
+        """
+        if not serie:
+            return criar_serie_vazia()
+
+        datas = pd.Series(converter_periodos_sidra(list(serie.keys()), tipo_periodo))
+        valores = pd.Series(converter_valores_sidra(list(serie.values())))
+
+        validos = datas.notna() & valores.notna()
+        num_invalidos = int((~validos).sum())
+        if num_invalidos:
+            logger.warning(f"{num_invalidos} de {len(serie)} períodos da série {nome_serie} descartados por período ou valor indisponível.")
+
+        df = pd.DataFrame({
+            'data': datas[validos].to_numpy().astype('datetime64[ns]'),
+            'valor': valores[validos].to_numpy(dtype='float64')
+        })
+        if not df['data'].is_monotonic_increasing:
+            df = df.sort_values('data', kind='stable').reset_index(drop=True)
+        return df
+
+
+# Função para uso direto via linha de comando
+def executar(argumentos: List[str] = None):
+    """Função principal para execução direta do script."""
+    parser = argparse.ArgumentParser(description="Extração de agregados do IBGE (SIDRA).")
+    parser.add_argument("--completo", action="store_true",
+                        help="Ignora os dados armazenados e baixa toda a janela de dias retroativos.")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Busca apenas os períodos posteriores à última observação armazenada.")
+    args = parser.parse_args(argumentos)
+
+    # Configurar logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    # Sem flags, prevalece a configuração (CONFIGURACAO_EXTRACAO["ibge"]["incremental"])
+    incremental = None
+    if args.completo:
+        incremental = False
+    elif args.incremental:
+        incremental = True
+
+    extrator = ExtratorIBGE()
+    resultados = extrator.extrair_todos_agregados(incremental=incremental)
+
+    # Exibir resultados
+    for nome, sucesso in resultados.items():
+        status = "sucesso" if sucesso else "falha"
+        print(f"Extração de {nome}: {status}")
+
+
+if __name__ == "__main__":
+    executar()
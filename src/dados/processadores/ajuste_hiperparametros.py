@@ -0,0 +1,299 @@
+"""
+Módulo de busca de hiperparâmetros das previsões.
+
+Este módulo procura, para cada indicador, os parâmetros do previsor
+(sazonalidades, modo de sazonalidade e escala do prior dos pontos de
+mudança) com o menor erro no backtest com origem móvel. A busca pode
+percorrer todas as combinações do espaço configurado (grade) ou uma
+amostra aleatória delas.
+
+Os pares (candidato, corte) são avaliados em um pool de processos, em
+rodadas: os cortes são divididos em grupos intercalados e, após cada
+rodada, os candidatos com erro acima de fator_poda vezes o do melhor são
+descartados. Os vencedores são gravados em CONFIGURACAO_PREVISAO["arquivo_parametros"]
+e passam a ser os valores iniciais do dashboard (ver obter_parametros_previsao).
+"""
+
+import json
+import math
+import time
+import random
+import logging
+import datetime
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Any
+
+import pandas as pd
+
+from src.utils.configuracao import obter_configuracao
+from src.dados.armazenamento import escrever_atomico
+from src.dados.processadores.execucao_lote import processos_disponiveis
+from src.dados.processadores.repositorio_previsoes import normalizar_parametros, chave_parametros
+from src.dados.processadores.backtest import calcular_cortes, avaliar_corte, resumir_metricas
+
+# Configurar logger
+logger = logging.getLogger(__name__)
+
+# Métricas aceitas para escolher os parâmetros (quanto menor, melhor)
+METRICAS_AJUSTE = ["mae", "rmse", "mape"]
+
+
+def gerar_candidatos(espaco: Dict[str, List[Any]], estrategia: str = "grade", amostras: int = 20,
+                     semente: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Gera os candidatos da busca de hiperparâmetros.
+
+    Na busca aleatória, a escala do prior é sorteada em escala logarítmica
+    entre o menor e o maior valor do espaço (arredondada a 0.01, o passo do
+    dashboard); os demais parâmetros são sorteados entre os valores listados.
+
+    Args:
+        espaco: Valores de cada parâmetro do previsor.
+        estrategia: "grade" (todas as combinações) ou "aleatoria".
+        amostras: Número de candidatos da busca aleatória.
+        semente: Semente do sorteio.
+
+    Returns:
+        Lista de parâmetros, sem repetições.
+
+    Raises:
+        ValueError: Se a estratégia não for reconhecida.
+    """
+    # Importação local: o módulo de previsão importa o pool de execução em lote
+    from src.dados.processadores.previsao import combinacoes_grade
+
+    if estrategia == "grade":
+        return combinacoes_grade(espaco)
+    if estrategia != "aleatoria":
+        raise ValueError(f"Estratégia de busca não suportada: {estrategia}")
+
+    sorteio = random.Random(semente)
+    escalas = espaco["escala_prior_pontos_mudanca"]
+    limite_inferior, limite_superior = math.log(min(escalas)), math.log(max(escalas))
+    candidatos = {}
+    # Limita as tentativas para espaços com menos combinações do que amostras
+    for _ in range(amostras * 10):
+        if len(candidatos) >= amostras:
+            break
+        candidato = {nome: sorteio.choice(valores) for nome, valores in espaco.items()}
+        candidato["escala_prior_pontos_mudanca"] = max(
+            round(math.exp(sorteio.uniform(limite_inferior, limite_superior)), 2), 0.01
+        )
+        candidatos.setdefault(chave_parametros(candidato), candidato)
+    return list(candidatos.values())
+
+
+def ajustar_serie(dados: pd.DataFrame, candidatos: List[Dict[str, Any]], metrica: str = None,
+                  rodadas: int = None, fator_poda: float = None, processos: int = None,
+                  janela_inicial: int = None, passo: int = None, horizonte: int = None,
+                  max_cortes: int = None) -> Optional[Dict[str, Any]]:
+    """
+    Escolhe, entre os candidatos, os parâmetros com menor erro no backtest de uma série.
+
+    Os valores omitidos vêm de CONFIGURACAO_PREVISAO["ajuste"] e
+    CONFIGURACAO_PREVISAO["backtest"].
+
+    Args:
+        dados: DataFrame no formato do Prophet (colunas 'ds' e 'y').
+        candidatos: Parâmetros avaliados (ver gerar_candidatos).
+        metrica: Métrica minimizada ("mae", "rmse" ou "mape").
+        rodadas: Número de rodadas de cortes (com poda entre elas).
+        fator_poda: Candidatos com métrica acima de fator_poda vezes a melhor são descartados.
+        processos: Número de processos (padrão: CONFIGURACAO_PREVISAO["processos"];
+            0 usa todos os núcleos disponíveis).
+        janela_inicial: Observações mínimas de treinamento.
+        passo: Observações entre cortes consecutivos.
+        horizonte: Observações avaliadas a partir de cada corte.
+        max_cortes: Número máximo de cortes (os mais recentes).
+
+    Returns:
+        Dicionário com 'parametros' (vencedor), 'valor' (métrica do vencedor),
+        'geral' (métricas do vencedor), 'ranking' (DataFrame com a métrica de
+        cada candidato e a rodada em que foi descartado), 'cortes' e 'duracao',
+        ou None se nenhum candidato puder ser avaliado.
+
+    Raises:
+        ValueError: Se a métrica não for reconhecida.
+    """
+    config = obter_configuracao()["previsao"]
+    config_ajuste, config_backtest = config["ajuste"], config["backtest"]
+    metrica = metrica or config_ajuste["metrica"]
+    if metrica not in METRICAS_AJUSTE:
+        raise ValueError(f"Métrica de ajuste não suportada: {metrica}")
+    rodadas = rodadas or config_ajuste["rodadas"]
+    fator_poda = fator_poda or config_ajuste["fator_poda"]
+    horizonte = horizonte or config_backtest["horizonte"]
+    if processos is None:
+        processos = config["processos"]
+
+    dados = dados.sort_values("ds").reset_index(drop=True)
+    cortes = calcular_cortes(len(dados), janela_inicial or config_backtest["janela_inicial"],
+                             passo or config_backtest["passo"], horizonte,
+                             max_cortes if max_cortes is not None else config_backtest["max_cortes"])
+    if not cortes or not candidatos:
+        return None
+
+    # Grupos intercalados: cada rodada cobre todo o período avaliado
+    grupos = [grupo for grupo in (cortes[i::rodadas] for i in range(rodadas)) if grupo]
+    avaliacoes: Dict[int, List[pd.DataFrame]] = {i: [] for i in range(len(candidatos))}
+    valores: Dict[int, float] = {}
+    podados: Dict[int, int] = {}
+    ativos = list(range(len(candidatos)))
+
+    inicio = time.perf_counter()
+    processos = max(1, min(processos or processos_disponiveis(), len(candidatos) * len(grupos[0])))
+    executor = ProcessPoolExecutor(max_workers=processos) if processos > 1 else None
+    try:
+        for rodada, grupo in enumerate(grupos, start=1):
+            tarefas = [(i, corte) for i in ativos for corte in grupo]
+            if executor is not None:
+                futuros = {(i, corte): executor.submit(avaliar_corte, dados, candidatos[i], corte, horizonte)
+                           for i, corte in tarefas}
+
+            for i, corte in tarefas:
+                try:
+                    if executor is not None:
+                        avaliacoes[i].append(futuros[(i, corte)].result())
+                    else:
+                        avaliacoes[i].append(avaliar_corte(dados, candidatos[i], corte, horizonte))
+                except Exception as e:
+                    logger.warning(f"Erro no corte {corte} do candidato {candidatos[i]}: {e}")
+
+            # Candidatos sem nenhum corte avaliado (ou sem métrica definida) são descartados
+            for i in ativos:
+                valor = resumir_metricas(pd.concat(avaliacoes[i], ignore_index=True))[metrica] if avaliacoes[i] else math.inf
+                valores[i] = math.inf if math.isnan(valor) else valor
+            melhor = min(valores[i] for i in ativos)
+            if math.isinf(melhor):
+                break
+            if rodada < len(grupos):
+                for i in ativos:
+                    if valores[i] > fator_poda * melhor:
+                        podados[i] = rodada
+                ativos = [i for i in ativos if i not in podados]
+            logger.info(f"Rodada {rodada} de {len(grupos)}: {len(ativos)} candidatos mantidos "
+                        f"(melhor {metrica}: {melhor:.4f}).")
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    finalistas = [i for i in ativos if not math.isinf(valores.get(i, math.inf))]
+    if not finalistas:
+        return None
+    vencedor = min(finalistas, key=lambda i: valores[i])
+
+    ranking = pd.DataFrame([
+        dict(normalizar_parametros(candidatos[i]), **{metrica: valores.get(i, math.inf), "podado_na_rodada": podados.get(i)})
+        for i in range(len(candidatos))
+    ]).sort_values(["podado_na_rodada", metrica], ascending=[False, True], na_position="first").reset_index(drop=True)
+
+    return {
+        "parametros": candidatos[vencedor],
+        "metrica": metrica,
+        "valor": valores[vencedor],
+        "geral": resumir_metricas(pd.concat(avaliacoes[vencedor], ignore_index=True)),
+        "ranking": ranking,
+        "cortes": len(cortes),
+        "duracao": time.perf_counter() - inicio
+    }
+
+
+def salvar_parametros_ajustados(resultados: Dict[str, Dict[str, Any]], caminho: str = None) -> bool:
+    """
+    Grava os parâmetros vencedores, mesclando-os aos de outros indicadores já gravados.
+
+    Args:
+        resultados: Resultado de ajustar_serie por indicador.
+        caminho: Arquivo de destino (padrão: CONFIGURACAO_PREVISAO["arquivo_parametros"]).
+
+    Returns:
+        True se o arquivo foi gravado, False em caso de erro.
+    """
+    caminho = caminho or obter_configuracao()["previsao"]["arquivo_parametros"]
+    try:
+        with open(caminho, 'r', encoding='utf-8') as f:
+            indicadores = json.load(f).get("indicadores", {})
+    except FileNotFoundError:
+        indicadores = {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Arquivo de parâmetros {caminho} inválido, será recriado: {e}")
+        indicadores = {}
+
+    ajustado_em = datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds')
+    for id_indicador, resultado in resultados.items():
+        indicadores[id_indicador] = {
+            "parametros": resultado["parametros"],
+            "metrica": resultado["metrica"],
+            "valor": resultado["valor"],
+            "geral": resultado["geral"],
+            "candidatos": len(resultado["ranking"]),
+            "cortes": resultado["cortes"],
+            "ajustado_em": ajustado_em
+        }
+    conteudo = {"versao": 1, "indicadores": dict(sorted(indicadores.items()))}
+
+    def escrever(caminho_temporario: str) -> None:
+        with open(caminho_temporario, 'w', encoding='utf-8') as f:
+            json.dump(conteudo, f, ensure_ascii=False, indent=4)
+
+    try:
+        escrever_atomico(caminho, escrever)
+    except OSError as e:
+        logger.error(f"Erro ao salvar os parâmetros ajustados em {caminho}: {e}")
+        return False
+    logger.info(f"Parâmetros ajustados salvos em {caminho}")
+    return True
+
+
+# Função para uso direto via linha de comando
+def executar(argumentos: List[str] = None):
+    """Função principal para execução direta do script."""
+    parser = argparse.ArgumentParser(description="Busca dos parâmetros de previsão de cada indicador.")
+    parser.add_argument("--indicadores", nargs="+",
+                        help="Indicadores ajustados (padrão: todos com série armazenada).")
+    parser.add_argument("--estrategia", choices=["grade", "aleatoria"], help="Estratégia de busca.")
+    parser.add_argument("--amostras", type=int, help="Candidatos da busca aleatória.")
+    parser.add_argument("--metrica", choices=METRICAS_AJUSTE, help="Métrica minimizada.")
+    parser.add_argument("--processos", type=int, help="Número de processos (0 = todos os núcleos).")
+    parser.add_argument("--max-cortes", type=int, help="Número máximo de cortes do backtest (0 para todos).")
+    parser.add_argument("--sem-salvar", action="store_true", help="Apenas exibe os vencedores, sem gravá-los.")
+    args = parser.parse_args(argumentos)
+
+    # Configurar logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    # Importação local: o módulo de previsão importa o pool de execução em lote
+    from src.dados.processadores.previsao import carregar_dados_preparados
+
+    config = obter_configuracao()
+    config_ajuste = config["previsao"]["ajuste"]
+    candidatos = gerar_candidatos(config_ajuste["espaco"], args.estrategia or config_ajuste["estrategia"],
+                                  args.amostras or config_ajuste["amostras"], config_ajuste["semente"])
+
+    resultados = {}
+    for id_indicador, config_indicador in config["visualizacao"]["indicadores"].items():
+        nome_serie = config_indicador.get("serie_armazenada")
+        if not nome_serie or (args.indicadores and id_indicador not in args.indicadores):
+            continue
+
+        dados = carregar_dados_preparados(nome_serie, config["caminhos"]["diretorio_dados"])
+        resultado = ajustar_serie(dados, candidatos, args.metrica, processos=args.processos,
+                                  max_cortes=args.max_cortes)
+        if resultado is None:
+            print(f"{id_indicador}: não foi possível ajustar os parâmetros")
+            continue
+
+        resultados[id_indicador] = resultado
+        print(f"{id_indicador}: {resultado['metrica']}={resultado['valor']:.4f} com {resultado['parametros']} "
+              f"({len(candidatos)} candidatos, {resultado['duracao']:.1f}s)")
+
+    if resultados and not args.sem_salvar:
+        salvar_parametros_ajustados(resultados)
+
+
+if __name__ == "__main__":
+    executar()
@@ -0,0 +1,271 @@
+"""
+Módulo de avaliação da qualidade das previsões (backtest).
+
+Este módulo implementa a validação com origem móvel (rolling origin) sobre
+PrevisorSeriesTemporal: para cada corte, o modelo é treinado com as
+observações anteriores ao corte e avaliado nas observações seguintes. Os
+tamanhos (janela inicial, passo e horizonte) são contados em observações,
+de modo que a mesma configuração serve para séries mensais e diárias. Os
+cortes são avaliados em paralelo, em um pool de processos, e as métricas
+(MAE, RMSE, MAPE e cobertura do intervalo) são calculadas por passo do
+horizonte.
+"""
+
+import json
+import time
+import logging
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Any
+
+import numpy as np
+import pandas as pd
+
+from src.utils.configuracao import obter_configuracao, obter_parametros_previsao
+from src.dados.processadores.execucao_lote import processos_disponiveis
+
+# Configurar logger
+logger = logging.getLogger(__name__)
+
+# Métricas calculadas por passo do horizonte
+METRICAS = ["mae", "rmse", "mape", "cobertura"]
+
+
+def calcular_cortes(observacoes: int, janela_inicial: int, passo: int, horizonte: int,
+                    max_cortes: Optional[int] = None) -> List[int]:
+    """
+    Calcula as posições dos cortes da validação com origem móvel.
+
+    Os cortes são ancorados no fim da série: o último corte deixa exatamente
+    `horizonte` observações para avaliação, e os anteriores recuam `passo`
+    observações até a janela inicial.
+
+    Args:
+        observacoes: Número de observações da série.
+        janela_inicial: Observações mínimas de treinamento.
+        passo: Observações entre cortes consecutivos.
+        horizonte: Observações avaliadas a partir de cada corte.
+        max_cortes: Número máximo de cortes (os mais recentes; None para todos).
+
+    Returns:
+        Número de observações de treinamento de cada corte, em ordem crescente.
+    """
+    cortes = list(range(observacoes - horizonte, max(janela_inicial, 2) - 1, -max(passo, 1)))[::-1]
+    if max_cortes:
+        cortes = cortes[-max_cortes:]
+    return cortes
+
+
+def avaliar_corte(dados: pd.DataFrame, parametros: Dict[str, Any], corte: int, horizonte: int) -> pd.DataFrame:
+    """
+    Treina o modelo até um corte e prevê as observações seguintes.
+
+    As previsões são feitas nas datas observadas após o corte (e não em uma
+    grade de datas), de modo que lacunas como fins de semana das séries
+    diárias não desalinham os passos do horizonte.
+
+    Args:
+        dados: DataFrame no formato do Prophet (colunas 'ds' e 'y'), ordenado por data.
+        parametros: Parâmetros do previsor.
+        corte: Número de observações de treinamento.
+        horizonte: Número de observações avaliadas.
+
+    Returns:
+        DataFrame com corte (data da última observação de treinamento), passo
+        (1 a horizonte), ds, y, yhat, yhat_lower e yhat_upper.
+
+    Raises:
+        RuntimeError: Se o treinamento falhar.
+    """
+    # Importação local: o módulo de previsão importa o pool de execução em lote
+    from src.dados.processadores.previsao import PrevisorSeriesTemporal
+
+    treino = dados.iloc[:corte]
+    teste = dados.iloc[corte:corte + horizonte]
+
+    previsor = PrevisorSeriesTemporal(**parametros)
+    if not previsor.treinar(treino):
+        raise RuntimeError(f"falha no treinamento até {treino['ds'].iloc[-1]:%Y-%m-%d}")
+
+    previsao = previsor.modelo.predict(teste[["ds"]])
+    return pd.DataFrame({
+        "corte": treino["ds"].iloc[-1],
+        "passo": np.arange(1, len(teste) + 1),
+        "ds": teste["ds"].to_numpy(),
+        "y": teste["y"].to_numpy(),
+        "yhat": previsao["yhat"].to_numpy(),
+        "yhat_lower": previsao["yhat_lower"].to_numpy(),
+        "yhat_upper": previsao["yhat_upper"].to_numpy()
+    })
+
+
+def calcular_metricas(avaliacoes: pd.DataFrame) -> pd.DataFrame:
+    """
+    Calcula as métricas de erro por passo do horizonte.
+
+    O MAPE (em fração, não em %) ignora observações iguais a zero; a
+    cobertura é a fração das observações dentro do intervalo de incerteza
+    (yhat_lower a yhat_upper).
+
+    Args:
+        avaliacoes: Resultado concatenado de avaliar_corte.
+
+    Returns:
+        DataFrame indexado por passo, com as colunas de METRICAS e cortes
+        (número de cortes avaliados no passo).
+    """
+    erros = avaliacoes.assign(
+        erro_absoluto=(avaliacoes["y"] - avaliacoes["yhat"]).abs(),
+        erro_quadratico=(avaliacoes["y"] - avaliacoes["yhat"]) ** 2,
+        erro_percentual=((avaliacoes["y"] - avaliacoes["yhat"]) / avaliacoes["y"].where(avaliacoes["y"] != 0)).abs(),
+        coberto=avaliacoes["y"].between(avaliacoes["yhat_lower"], avaliacoes["yhat_upper"])
+    )
+    agrupado = erros.groupby("passo")
+    return pd.DataFrame({
+        "mae": agrupado["erro_absoluto"].mean(),
+        "rmse": np.sqrt(agrupado["erro_quadratico"].mean()),
+        "mape": agrupado["erro_percentual"].mean(),
+        "cobertura": agrupado["coberto"].mean(),
+        "cortes": agrupado.size()
+    })
+
+
+def resumir_metricas(avaliacoes: pd.DataFrame) -> Dict[str, float]:
+    """Calcula as métricas sobre todos os passos do horizonte."""
+    metricas = calcular_metricas(avaliacoes.assign(passo=0))
+    return {nome: float(metricas[nome].iloc[0]) for nome in METRICAS}
+
+
+def executar_backtest(dados: pd.DataFrame, parametros: Dict[str, Any], janela_inicial: int = None,
+                      passo: int = None, horizonte: int = None, max_cortes: int = None,
+                      processos: int = None) -> Optional[Dict[str, Any]]:
+    """
+    Executa a validação com origem móvel de uma série.
+
+    Os valores omitidos vêm de CONFIGURACAO_PREVISAO["backtest"]. Cortes que
+    falham são registrados no log e desconsiderados.
+
+    Args:
+        dados: DataFrame no formato do Prophet (colunas 'ds' e 'y').
+        parametros: Parâmetros do previsor.
+        janela_inicial: Observações mínimas de treinamento.
+        passo: Observações entre cortes consecutivos.
+        horizonte: Observações avaliadas a partir de cada corte.
+        max_cortes: Número máximo de cortes (os mais recentes).
+        processos: Número de processos (padrão: CONFIGURACAO_PREVISAO["processos"];
+            0 usa todos os núcleos disponíveis).
+
+    Returns:
+        Dicionário com 'metricas' (DataFrame por passo), 'geral' (métricas de
+        todos os passos), 'avaliacoes' (previsões e observações de cada corte),
+        'cortes' e 'duracao', ou None se nenhum corte puder ser avaliado.
+    """
+    config = obter_configuracao()["previsao"]
+    config_backtest = config["backtest"]
+    janela_inicial = janela_inicial or config_backtest["janela_inicial"]
+    passo = passo or config_backtest["passo"]
+    horizonte = horizonte or config_backtest["horizonte"]
+    max_cortes = max_cortes if max_cortes is not None else config_backtest["max_cortes"]
+    if processos is None:
+        processos = config["processos"]
+
+    dados = dados.sort_values("ds").reset_index(drop=True)
+    cortes = calcular_cortes(len(dados), janela_inicial, passo, horizonte, max_cortes)
+    if not cortes:
+        logger.warning(f"Série com {len(dados)} observações é curta demais para janela inicial de "
+                       f"{janela_inicial} e horizonte de {horizonte}.")
+        return None
+
+    inicio = time.perf_counter()
+    processos = max(1, min(processos or processos_disponiveis(), len(cortes)))
+    avaliacoes = []
+    if processos == 1:
+        for corte in cortes:
+            try:
+                avaliacoes.append(avaliar_corte(dados, parametros, corte, horizonte))
+            except Exception as e:
+                logger.error(f"Erro no corte {corte} do backtest: {e}")
+    else:
+        with ProcessPoolExecutor(max_workers=processos) as executor:
+            futuros = [executor.submit(avaliar_corte, dados, parametros, corte, horizonte) for corte in cortes]
+            for corte, futuro in zip(cortes, futuros):
+                try:
+                    avaliacoes.append(futuro.result())
+                except Exception as e:
+                    logger.error(f"Erro no corte {corte} do backtest: {e}")
+
+    if not avaliacoes:
+        return None
+
+    avaliacoes = pd.concat(avaliacoes, ignore_index=True)
+    duracao = time.perf_counter() - inicio
+    logger.info(f"Backtest com {len(cortes)} cortes concluído em {duracao:.1f}s com {processos} processo(s).")
+    return {
+        "metricas": calcular_metricas(avaliacoes),
+        "geral": resumir_metricas(avaliacoes),
+        "avaliacoes": avaliacoes,
+        "cortes": int(avaliacoes["corte"].nunique()),
+        "duracao": duracao
+    }
+
+
+# Função para uso direto via linha de comando
+def executar(argumentos: List[str] = None):
+    """Função principal para execução direta do script."""
+    parser = argparse.ArgumentParser(description="Validação com origem móvel das previsões de um indicador.")
+    parser.add_argument("indicador", help="Indicador (chave de CONFIGURACAO_VISUALIZACAO['indicadores']).")
+    parser.add_argument("--janela-inicial", type=int, help="Observações mínimas de treinamento.")
+    parser.add_argument("--passo", type=int, help="Observações entre cortes consecutivos.")
+    parser.add_argument("--horizonte", type=int, help="Observações avaliadas a partir de cada corte.")
+    parser.add_argument("--max-cortes", type=int, help="Número máximo de cortes (0 para todos).")
+    parser.add_argument("--processos", type=int, help="Número de processos (0 = todos os núcleos).")
+    parser.add_argument("--modo-sazonalidade", choices=["additive", "multiplicative"])
+    parser.add_argument("--escala-prior", type=float, help="Escala do prior para pontos de mudança.")
+    parser.add_argument("--saida", help="Arquivo JSON para gravar as métricas.")
+    args = parser.parse_args(argumentos)
+
+    # Configurar logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    # Importação local: o módulo de previsão importa o pool de execução em lote
+    from src.dados.processadores.previsao import carregar_dados_preparados
+
+    config = obter_configuracao()
+    config_indicador = config["visualizacao"]["indicadores"].get(args.indicador, {})
+    nome_serie = config_indicador.get("serie_armazenada")
+    if not nome_serie:
+        parser.error(f"Indicador sem série armazenada: {args.indicador}")
+
+    parametros = obter_parametros_previsao(args.indicador)
+    if args.modo_sazonalidade:
+        parametros["modo_sazonalidade"] = args.modo_sazonalidade
+    if args.escala_prior is not None:
+        parametros["escala_prior_pontos_mudanca"] = args.escala_prior
+
+    dados = carregar_dados_preparados(nome_serie, config["caminhos"]["diretorio_dados"])
+    resultado = executar_backtest(dados, parametros, args.janela_inicial, args.passo, args.horizonte,
+                                  args.max_cortes, args.processos)
+    if resultado is None:
+        print(f"Não foi possível executar o backtest de {args.indicador}.")
+        return
+
+    print(f"Backtest de {args.indicador}: {resultado['cortes']} cortes em {resultado['duracao']:.1f}s")
+    print(resultado["metricas"].to_string(float_format=lambda valor: f"{valor:.4f}"))
+    print("Geral: " + ", ".join(f"{nome}={valor:.4f}" for nome, valor in resultado["geral"].items()))
+
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as f:
+            json.dump({
+                "indicador": args.indicador,
+                "parametros": parametros,
+                "cortes": resultado["cortes"],
+                "geral": resultado["geral"],
+                "por_passo": resultado["metricas"].reset_index().to_dict(orient="records")
+            }, f, ensure_ascii=False, indent=4)
+
+
+if __name__ == "__main__":
+    executar()
@@ -0,0 +1,211 @@
+"""
+Módulo de cache das previsões geradas sob demanda.
+
+Este módulo contém a classe CachePrevisoes, que memoriza os resultados de
+PrevisorSeriesTemporal.gerar_previsao. A chave combina o hash dos dados
+preparados (ds, y), o tipo de modelo, todos os parâmetros do previsor e o
+número de períodos, de modo que uma previsão repetida não treina o modelo
+de novo. O cache tem dois níveis:
+- memória: LRU limitado pelo número de itens
+- disco (opcional): arquivos pickle, removidos dos menos usados para os
+  mais usados quando o tamanho total passa do limite
+"""
+
+import os
+import json
+import pickle
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Any
+
+from src.utils.configuracao import obter_configuracao
+from src.dados.armazenamento import escrever_atomico
+from src.dados.processadores.repositorio_previsoes import normalizar_parametros
+
+# Configurar logger
+logger = logging.getLogger(__name__)
+
+# Extensão dos arquivos do nível em disco
+EXTENSAO_CACHE = ".pkl"
+
+
+def chave_cache(hash_dados: str, tipo_modelo: str, parametros: Dict[str, Any], periodos: int) -> str:
+    """
+    Calcula a chave de cache de uma previsão.
+
+    Args:
+        hash_dados: Hash dos dados preparados (ver calcular_hash_dados).
+        tipo_modelo: Tipo de modelo de previsão.
+        parametros: Parâmetros do previsor.
+        periodos: Número de períodos previstos.
+
+    Returns:
+        Hash SHA-256 (hexadecimal) da combinação.
+    """
+    conteudo = json.dumps({
+        "hash_dados": hash_dados,
+        "tipo_modelo": tipo_modelo,
+        "parametros": normalizar_parametros(parametros),
+        "periodos": int(periodos)
+    }, sort_keys=True)
+    return hashlib.sha256(conteudo.encode("utf-8")).hexdigest()
+
+
+class CachePrevisoes:
+    """
+    Cache em dois níveis (memória e disco) de resultados de previsão.
+
+    Os resultados são compartilhados entre quem consulta o cache e devem ser
+    tratados como somente leitura.
+
+    Attributes:
+        itens_memoria (int): Número máximo de resultados mantidos em memória.
+        diretorio (Optional[str]): Diretório do nível em disco (None desabilita o nível).
+        tamanho_maximo_disco (int): Tamanho máximo, em bytes, do nível em disco.
+        estatisticas (Dict[str, int]): Acertos em memória, acertos em disco e faltas.
+    """
+
+    def __init__(self, itens_memoria: int = 32, diretorio: Optional[str] = None,
+                 tamanho_maximo_disco: int = 256 * 1024 * 1024):
+        """
+        Inicializa o cache.
+
+        Args:
+            itens_memoria: Número máximo de resultados mantidos em memória.
+            diretorio: Diretório do nível em disco (None desabilita o nível).
+            tamanho_maximo_disco: Tamanho máximo do nível em disco, em bytes
+                (0 desabilita o nível).
+        """
+        self.itens_memoria = max(1, itens_memoria)
+        self.diretorio = diretorio if diretorio and tamanho_maximo_disco > 0 else None
+        self.tamanho_maximo_disco = tamanho_maximo_disco
+        self.estatisticas = {"acertos_memoria": 0, "acertos_disco": 0, "faltas": 0}
+        self._memoria: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._trava = threading.Lock()
+        if self.diretorio:
+            os.makedirs(self.diretorio, exist_ok=True)
+
+    @classmethod
+    def da_configuracao(cls) -> "CachePrevisoes":
+        """Cria um cache com os parâmetros de CONFIGURACAO_PREVISAO["cache"]."""
+        config = obter_configuracao()["previsao"]["cache"]
+        return cls(
+            itens_memoria=config["itens_memoria"],
+            diretorio=config["diretorio"],
+            tamanho_maximo_disco=config["tamanho_maximo_disco_mb"] * 1024 * 1024
+        )
+
+    def _caminho(self, chave: str) -> str:
+        return os.path.join(self.diretorio, chave + EXTENSAO_CACHE)
+
+    def _guardar_memoria(self, chave: str, resultado: Dict[str, Any]) -> None:
+        with self._trava:
+            self._memoria[chave] = resultado
+            self._memoria.move_to_end(chave)
+            while len(self._memoria) > self.itens_memoria:
+                self._memoria.popitem(last=False)
+
+    def obter(self, chave: str) -> Optional[Dict[str, Any]]:
+        """
+        Obtém um resultado do cache (memória e, em seguida, disco).
+
+        Acertos em disco são promovidos para a memória.
+
+        Args:
+            chave: Chave do resultado (ver chave_cache).
+
+        Returns:
+            Resultado armazenado ou None se não estiver no cache.
+        """
+        with self._trava:
+            resultado = self._memoria.get(chave)
+            if resultado is not None:
+                self._memoria.move_to_end(chave)
+                self.estatisticas["acertos_memoria"] += 1
+                return resultado
+
+        if self.diretorio:
+            caminho = self._caminho(chave)
+            try:
+                with open(caminho, 'rb') as f:
+                    resultado = pickle.load(f)
+                # Marca o arquivo como usado recentemente para a remoção por tamanho
+                os.utime(caminho)
+            except FileNotFoundError:
+                resultado = None
+            except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+                logger.warning(f"Entrada inválida no cache de previsões ({chave[:12]}), descartada: {e}")
+                self._remover_arquivo(caminho)
+                resultado = None
+
+            if resultado is not None:
+                self._guardar_memoria(chave, resultado)
+                with self._trava:
+                    self.estatisticas["acertos_disco"] += 1
+                return resultado
+
+        with self._trava:
+            self.estatisticas["faltas"] += 1
+        return None
+
+    def guardar(self, chave: str, resultado: Dict[str, Any]) -> None:
+        """
+        Guarda um resultado na memória e, se habilitado, no disco.
+
+        Args:
+            chave: Chave do resultado (ver chave_cache).
+            resultado: Resultado da previsão (DataFrame e gráficos).
+        """
+        self._guardar_memoria(chave, resultado)
+        if not self.diretorio:
+            return
+
+        def escrever(caminho_temporario: str) -> None:
+            with open(caminho_temporario, 'wb') as f:
+                pickle.dump(resultado, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        try:
+            escrever_atomico(self._caminho(chave), escrever)
+        except (OSError, pickle.PicklingError) as e:
+            logger.warning(f"Erro ao gravar a previsão no cache em disco: {e}")
+            return
+        self._limitar_disco()
+
+    def _remover_arquivo(self, caminho: str) -> None:
+        try:
+            os.remove(caminho)
+        except OSError:
+            pass
+
+    def _limitar_disco(self) -> None:
+        """Remove os arquivos usados há mais tempo até o nível em disco caber no limite."""
+        arquivos = []
+        with os.scandir(self.diretorio) as entradas:
+            for entrada in entradas:
+                # Ignora os temporários de gravações em andamento (".<nome>.*.tmp.pkl")
+                if entrada.is_file() and entrada.name.endswith(EXTENSAO_CACHE) and not entrada.name.startswith("."):
+                    try:
+                        informacoes = entrada.stat()
+                    except OSError:  # Removido por outra thread durante a varredura
+                        continue
+                    arquivos.append((informacoes.st_mtime, informacoes.st_size, entrada.path))
+
+        tamanho_total = sum(tamanho for _, tamanho, _ in arquivos)
+        for _, tamanho, caminho in sorted(arquivos):
+            if tamanho_total <= self.tamanho_maximo_disco:
+                break
+            self._remover_arquivo(caminho)
+            tamanho_total -= tamanho
+            logger.info(f"Previsão removida do cache em disco por tamanho: {os.path.basename(caminho)}")
+
+    def limpar(self) -> None:
+        """Remove todos os resultados da memória e do disco."""
+        with self._trava:
+            self._memoria.clear()
+        if self.diretorio:
+            with os.scandir(self.diretorio) as entradas:
+                for entrada in entradas:
+                    if entrada.name.endswith(EXTENSAO_CACHE) and not entrada.name.startswith("."):
+                        self._remover_arquivo(entrada.path)
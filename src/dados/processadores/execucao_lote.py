@@ -0,0 +1,159 @@
+"""
+Módulo de treinamento em lote das previsões.
+
+Este módulo distribui tarefas de previsão (série e parâmetros) por um pool
+de processos do tamanho dos núcleos disponíveis. Cada processo treina o
+modelo (consultando o registro de modelos), gera a previsão e o gráfico de
+componentes e devolve o resultado ao processo principal, que é o único a
+gravar as previsões. Falhas de uma tarefa não interrompem as demais, e o
+tempo de cada tarefa é registrado no resultado.
+
+Cada tarefa é um dicionário com:
+- identificador: identificador da série (ex.: 'deficit_primario')
+- dados: DataFrame no formato do Prophet (colunas 'ds' e 'y')
+- parametros: parâmetros do previsor (ver PrevisorSeriesTemporal.parametros)
+- horizonte: número de períodos previstos
+- incremental (opcional): se o treinamento parte do modelo anterior (padrão: True)
+"""
+
+import os
+import time
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Any
+
+from src.utils.configuracao import obter_configuracao
+from src.dados.processadores.registro_modelos import RegistroModelos
+from src.dados.processadores.repositorio_previsoes import COLUNAS_PREVISAO
+
+# Configurar logger
+logger = logging.getLogger(__name__)
+
+# Registro de modelos de cada processo do pool (criado por _inicializar_processo)
+_registro_processo: Optional[RegistroModelos] = None
+
+
+def processos_disponiveis() -> int:
+    """Retorna o número de núcleos disponíveis para o processo atual."""
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return os.cpu_count() or 1
+
+
+def _inicializar_processo(diretorio_registro: Optional[str], max_modelos: int) -> None:
+    """Cria o registro de modelos do processo (o registro não é serializável)."""
+    global _registro_processo
+    _registro_processo = RegistroModelos(diretorio_registro, max_modelos) if diretorio_registro else None
+
+
+def executar_tarefa(tarefa: Dict[str, Any], registro: Optional[RegistroModelos] = None) -> Dict[str, Any]:
+    """
+    Treina o modelo de uma tarefa e gera a previsão.
+
+    Erros são capturados e devolvidos no resultado, sem propagar.
+
+    Args:
+        tarefa: Tarefa de previsão (ver a documentação do módulo).
+        registro: Registro de modelos (padrão: o registro do processo do pool).
+
+    Returns:
+        Dicionário com identificador, parametros, sucesso, previsao (DataFrame
+        com as colunas de COLUNAS_PREVISAO), componentes (Figure), duracao
+        (segundos), erro e processo (PID).
+    """
+    # Importação local: previsao importa este módulo
+    from src.dados.processadores.previsao import PrevisorSeriesTemporal
+
+    inicio = time.perf_counter()
+    resultado = {
+        "identificador": tarefa["identificador"],
+        "parametros": tarefa["parametros"],
+        "sucesso": False,
+        "previsao": None,
+        "componentes": None,
+        "erro": None,
+        "processo": os.getpid()
+    }
+    try:
+        previsor = PrevisorSeriesTemporal(**tarefa["parametros"], identificador=tarefa["identificador"],
+                                          registro=registro if registro is not None else _registro_processo)
+        if not previsor.treinar(tarefa["dados"], incremental=tarefa.get("incremental", True)):
+            resultado["erro"] = "falha no treinamento"
+        else:
+            previsao = previsor.prever(tarefa["horizonte"])
+            if previsao is None:
+                resultado["erro"] = "falha na previsão"
+            else:
+                resultado["previsao"] = previsao[COLUNAS_PREVISAO]
+                resultado["componentes"] = previsor.plotar_componentes(previsao)
+                resultado["sucesso"] = True
+    except Exception as e:
+        resultado["erro"] = str(e)
+
+    resultado["duracao"] = time.perf_counter() - inicio
+    return resultado
+
+
+def executar_lote(tarefas: List[Dict[str, Any]], processos: int = None,
+                  registro: Optional[RegistroModelos] = None) -> List[Dict[str, Any]]:
+    """
+    Executa tarefas de previsão em um pool de processos.
+
+    As tarefas com mais observações são enviadas primeiro, para que as mais
+    demoradas não fiquem para o fim. Com um único processo (ou uma única
+    tarefa), as tarefas são executadas no processo atual.
+
+    Args:
+        tarefas: Tarefas de previsão (ver a documentação do módulo).
+        processos: Número de processos (padrão: CONFIGURACAO_PREVISAO["processos"];
+            0 usa todos os núcleos disponíveis).
+        registro: Registro de modelos consultado pelas tarefas (padrão:
+            CONFIGURACAO_PREVISAO["registro_modelos"]).
+
+    Returns:
+        Resultados de executar_tarefa, na ordem das tarefas.
+    """
+    if not tarefas:
+        return []
+    if processos is None:
+        processos = obter_configuracao()["previsao"]["processos"]
+    processos = max(1, min(processos or processos_disponiveis(), len(tarefas)))
+    registro = registro or RegistroModelos.da_configuracao()
+
+    inicio = time.perf_counter()
+    if processos == 1:
+        resultados = [executar_tarefa(tarefa, registro) for tarefa in tarefas]
+    else:
+        ordem = sorted(range(len(tarefas)), key=lambda i: len(tarefas[i]["dados"]), reverse=True)
+        resultados: List[Optional[Dict[str, Any]]] = [None] * len(tarefas)
+        with ProcessPoolExecutor(max_workers=processos, initializer=_inicializar_processo,
+                                 initargs=(registro.diretorio, registro.max_modelos)) as executor:
+            futuros = {i: executor.submit(executar_tarefa, tarefas[i]) for i in ordem}
+            for i, futuro in futuros.items():
+                try:
+                    resultados[i] = futuro.result()
+                except Exception as e:
+                    # Ex.: processo encerrado inesperadamente (BrokenProcessPool)
+                    resultados[i] = {
+                        "identificador": tarefas[i]["identificador"],
+                        "parametros": tarefas[i]["parametros"],
+                        "sucesso": False,
+                        "previsao": None,
+                        "componentes": None,
+                        "erro": str(e) or type(e).__name__,
+                        "processo": None,
+                        "duracao": 0.0
+                    }
+
+    for resultado in resultados:
+        if resultado["sucesso"]:
+            logger.debug(f"Previsão de {resultado['identificador']} concluída em {resultado['duracao']:.2f}s")
+        else:
+            logger.error(f"Falha na previsão de {resultado['identificador']} ({resultado['parametros']}): {resultado['erro']}")
+
+    concluidas = sum(1 for resultado in resultados if resultado["sucesso"])
+    logger.info(
+        f"{concluidas} de {len(tarefas)} previsões concluídas em {time.perf_counter() - inicio:.1f}s "
+        f"com {processos} processo(s) (soma das tarefas: {sum(r['duracao'] for r in resultados):.1f}s)."
+    )
+    return resultados
@@ -8,13 +8,20 @@ de previsão para séries temporais econômicas, utilizando Prophet e outras té
 import pandas as pd
 import numpy as np
 import logging
+import argparse
+import itertools
 import json
 import os
 from typing import Dict, List, Optional, Union, Any, Tuple
 from prophet import Prophet
-from prophet.plot import plot_plotly, plot_components_plotly
+from prophet.plot import plot_components_plotly
 import plotly.graph_objects as go
-from src.utils.configuracao import obter_configuracao
+from src.utils.configuracao import obter_configuracao, obter_parametros_previsao
+from src.dados.armazenamento import carregar_serie
+from src.dados.processadores.repositorio_previsoes import RepositorioPrevisoes, calcular_hash_dados, chave_parametros
+from src.dados.processadores.cache_previsoes import CachePrevisoes, chave_cache
+from src.dados.processadores.registro_modelos import RegistroModelos, salvar_modelo_prophet, carregar_modelo_prophet
+from src.dados.processadores.execucao_lote import executar_lote
 
 # Configurar logger
 logger = logging.getLogger(__name__)
@@ -26,11 +33,17 @@ class PrevisorSeriesTemporal:
     Attributes:
         tipo_modelo (str): Tipo de modelo de previsão ('prophet', 'arima', etc.).
         modelo: Modelo de previsão treinado.
+        cache (Optional[CachePrevisoes]): Cache consultado por gerar_previsao.
+        registro (Optional[RegistroModelos]): Registro de modelos consultado por treinar.
+        identificador (Optional[str]): Identificador da série, usado para localizar
+            o modelo anterior no treinamento incremental.
     """
     
     def __init__(self, tipo_modelo: str = 'prophet', sazonalidade_anual: bool = True, 
                  sazonalidade_semanal: bool = True, sazonalidade_diaria: bool = False,
-                 modo_sazonalidade: str = 'multiplicative', escala_prior_pontos_mudanca: float = 0.05):
+                 modo_sazonalidade: str = 'multiplicative', escala_prior_pontos_mudanca: float = 0.05,
+                 cache: Optional[CachePrevisoes] = None, registro: Optional[RegistroModelos] = None,
+                 identificador: Optional[str] = None):
         """
         Inicializa o previsor de séries temporais.
         
@@ -41,14 +54,31 @@ class PrevisorSeriesTemporal:
             sazonalidade_diaria: Se deve incluir sazonalidade diária.
             modo_sazonalidade: Modo de sazonalidade ('additive' ou 'multiplicative').
             escala_prior_pontos_mudanca: Escala do prior para pontos de mudança.
+            cache: Cache de previsões consultado por gerar_previsao (None desabilita).
+            registro: Registro de modelos ajustados consultado por treinar (None desabilita).
+            identificador: Identificador da série (ex.: 'deficit_primario'), gravado no registro.
         """
         self.tipo_modelo = tipo_modelo
         self.modelo = None
+        self.cache = cache
+        self.registro = registro
+        self.identificador = identificador
         self.sazonalidade_anual = sazonalidade_anual
         self.sazonalidade_semanal = sazonalidade_semanal
         self.sazonalidade_diaria = sazonalidade_diaria
         self.modo_sazonalidade = modo_sazonalidade
         self.escala_prior_pontos_mudanca = escala_prior_pontos_mudanca
+    
+    @property
+    def parametros(self) -> Dict[str, Any]:
+        """Parâmetros do modelo, na forma aceita pelo construtor (exceto tipo_modelo)."""
+        return {
+            "sazonalidade_anual": self.sazonalidade_anual,
+            "sazonalidade_semanal": self.sazonalidade_semanal,
+            "sazonalidade_diaria": self.sazonalidade_diaria,
+            "modo_sazonalidade": self.modo_sazonalidade,
+            "escala_prior_pontos_mudanca": self.escala_prior_pontos_mudanca
+        }
         
     def preparar_dados(self, df: pd.DataFrame, coluna_data: str, coluna_valor: str) -> pd.DataFrame:
         """
@@ -89,12 +119,35 @@ class PrevisorSeriesTemporal:
             logger.error(f"Erro ao preparar dados para previsão: {e}")
             return pd.DataFrame()
     
-    def treinar(self, df: pd.DataFrame) -> bool:
+    def _criar_prophet(self) -> Prophet:
+        """Cria um modelo Prophet (não ajustado) com os parâmetros do previsor."""
+        return Prophet(
+            yearly_seasonality=self.sazonalidade_anual,
+            weekly_seasonality=self.sazonalidade_semanal,
+            daily_seasonality=self.sazonalidade_diaria,
+            seasonality_mode=self.modo_sazonalidade,
+            changepoint_prior_scale=self.escala_prior_pontos_mudanca
+        )
+    
+    def treinar(self, df: pd.DataFrame, incremental: bool = False,
+                modelo_anterior: Optional[Prophet] = None) -> bool:
         """
         Treina o modelo de previsão com os dados fornecidos.
         
+        Com um registro de modelos, um modelo já ajustado com os mesmos dados e
+        parâmetros é carregado em vez de treinado, e modelos novos são registrados.
+        
+        No modo incremental, o otimizador parte dos parâmetros (k, m, delta, beta,
+        sigma_obs) de um modelo anterior da mesma série e configuração, em vez da
+        inicialização padrão; se os formatos não forem compatíveis ou o ajuste
+        falhar, o modelo é treinado do zero.
+        
         Args:
             df: DataFrame formatado para o modelo (com colunas 'ds' e 'y').
+            incremental: Se deve partir do modelo anterior da série no registro
+                (requer registro e identificador).
+            modelo_anterior: Modelo ajustado usado como ponto de partida (tem
+                precedência sobre o registro).
             
         Returns:
             True se o treinamento foi bem-sucedido, False caso contrário.
@@ -105,16 +158,36 @@ class PrevisorSeriesTemporal:
             
         try:
             if self.tipo_modelo == 'prophet':
+                hash_dados = calcular_hash_dados(df) if self.registro is not None else None
+                if hash_dados is not None:
+                    modelo = self.registro.carregar(hash_dados, self.tipo_modelo, self.parametros)
+                    if modelo is not None:
+                        self.modelo = modelo
+                        logger.info("Modelo Prophet reutilizado do registro de modelos.")
+                        return True
+                
+                if modelo_anterior is None and incremental and self.registro is not None and self.identificador:
+                    modelo_anterior = self.registro.carregar_anterior(self.identificador, self.tipo_modelo, self.parametros)
+                
                 # Configura e treina o modelo Prophet
-                self.modelo = Prophet(
-                    yearly_seasonality=self.sazonalidade_anual,
-                    weekly_seasonality=self.sazonalidade_semanal,
-                    daily_seasonality=self.sazonalidade_diaria,
-                    seasonality_mode=self.modo_sazonalidade,
-                    changepoint_prior_scale=self.escala_prior_pontos_mudanca
-                )
-                self.modelo.fit(df)
-                logger.info("Modelo Prophet treinado com sucesso.")
+                self.modelo = self._criar_prophet()
+                inicializacao = parametros_iniciais(modelo_anterior, self.modelo, len(df)) if modelo_anterior is not None else None
+                if inicializacao is not None:
+                    try:
+                        self.modelo.fit(df, init=inicializacao)
+                        logger.info("Modelo Prophet treinado a partir do modelo anterior.")
+                    except Exception as e:
+                        logger.warning(f"Falha no treinamento incremental, treinando do zero: {e}")
+                        inicializacao = None
+                if inicializacao is None:
+                    # Um modelo Prophet só pode ser ajustado uma vez
+                    self.modelo = self._criar_prophet()
+                    self.modelo.fit(df)
+                    logger.info("Modelo Prophet treinado com sucesso.")
+                
+                if hash_dados is not None:
+                    self.registro.salvar(self.modelo, hash_dados, self.tipo_modelo, self.parametros, len(df),
+                                         identificador=self.identificador)
                 return True
             else:
                 logger.error(f"Tipo de modelo não suportado: {self.tipo_modelo}")
@@ -155,6 +228,83 @@ class PrevisorSeriesTemporal:
             logger.error(f"Erro ao gerar previsão: {e}")
             return None
     
+    def salvar_modelo(self, caminho: str) -> bool:
+        """
+        Grava o modelo treinado em JSON (prophet.serialize).
+        
+        Args:
+            caminho: Caminho do arquivo de destino.
+            
+        Returns:
+            True se o modelo foi gravado, False caso contrário.
+        """
+        if self.modelo is None:
+            logger.error("Modelo não treinado. Execute o método treinar() primeiro.")
+            return False
+            
+        try:
+            salvar_modelo_prophet(self.modelo, caminho)
+            logger.info(f"Modelo salvo em {caminho}")
+            return True
+        except (OSError, ValueError) as e:
+            logger.error(f"Erro ao salvar modelo em {caminho}: {e}")
+            return False
+    
+    def carregar_modelo(self, caminho: str) -> bool:
+        """
+        Carrega um modelo gravado por salvar_modelo.
+        
+        Args:
+            caminho: Caminho do arquivo.
+            
+        Returns:
+            True se o modelo foi carregado, False caso contrário.
+        """
+        try:
+            self.modelo = carregar_modelo_prophet(caminho)
+            logger.info(f"Modelo carregado de {caminho}")
+            return True
+        except (OSError, ValueError, KeyError) as e:
+            logger.error(f"Erro ao carregar modelo de {caminho}: {e}")
+            return False
+    
+    def gerar_previsao(self, df: pd.DataFrame, periodos: int,
+                       titulo: str = "Previsão de Série Temporal") -> Optional[Dict[str, Any]]:
+        """
+        Treina o modelo, gera a previsão e os gráficos, consultando o cache antes.
+        
+        Em um acerto de cache o modelo não é treinado (o atributo modelo não é
+        alterado). O gráfico de previsão é recriado a partir dos dados e da
+        previsão, pois o título pode variar entre chamadas.
+        
+        Args:
+            df: DataFrame formatado para o modelo (com colunas 'ds' e 'y').
+            periodos: Número de períodos futuros para prever.
+            titulo: Título do gráfico de previsão.
+            
+        Returns:
+            Dicionário com 'previsao' (DataFrame), 'fig_previsao' e 'fig_componentes'
+            (Figure ou None), ou None em caso de erro.
+        """
+        chave = None
+        if self.cache is not None and not df.empty:
+            chave = chave_cache(calcular_hash_dados(df), self.tipo_modelo, self.parametros, periodos)
+            resultado = self.cache.obter(chave)
+            if resultado is not None:
+                logger.info(f"Previsão obtida do cache ({chave[:12]}).")
+                return {**resultado, "fig_previsao": criar_figura_previsao(df, resultado["previsao"], titulo)}
+        
+        if not self.treinar(df):
+            return None
+        previsao = self.prever(periodos)
+        if previsao is None:
+            return None
+        
+        resultado = {"previsao": previsao, "fig_componentes": self.plotar_componentes(previsao)}
+        if chave is not None:
+            self.cache.guardar(chave, resultado)
+        return {**resultado, "fig_previsao": self.plotar_previsao(previsao, titulo)}
+    
     def plotar_previsao(self, previsao: pd.DataFrame, titulo: str = "Previsão de Série Temporal") -> Optional[go.Figure]:
         """
         Cria gráfico de previsão.
@@ -172,14 +322,8 @@ class PrevisorSeriesTemporal:
             
         try:
             if self.tipo_modelo == 'prophet':
-                fig = plot_plotly(self.modelo, previsao)
-                fig.update_layout(
-                    title=titulo,
-                    xaxis_title="Data",
-                    yaxis_title="Valor",
-                    hovermode="x unified"
-                )
-                return fig
+                # Mesmo gráfico das previsões armazenadas, que não têm o modelo
+                return criar_figura_previsao(self.modelo.history, previsao, titulo)
             else:
                 logger.error(f"Tipo de modelo não suportado: {self.tipo_modelo}")
                 return None
@@ -215,12 +359,254 @@ class PrevisorSeriesTemporal:
             return None
 
 
-def processar_dados_deficit(dados: List[Dict[str, Any]]) -> pd.DataFrame:
+def numero_pontos_mudanca(modelo: Prophet, linhas: int) -> int:
+    """
+    Calcula o tamanho do vetor delta que o Prophet usará ao ajustar um modelo.
+
+    Segue a regra de Prophet.set_changepoints: os pontos de mudança ficam na
+    fração inicial (changepoint_range) do histórico, e sem nenhum ponto o
+    Prophet usa um único ponto fictício.
+
+    Args:
+        modelo: Modelo Prophet ainda não ajustado.
+        linhas: Número de observações de treinamento.
+
+    Returns:
+        Número de elementos de delta.
+    """
+    if modelo.changepoints is not None:
+        return max(len(modelo.changepoints), 1)
+    tamanho_historico = int(np.floor(linhas * modelo.changepoint_range))
+    return max(min(modelo.n_changepoints, tamanho_historico - 1), 1)
+
+
+def parametros_iniciais(modelo_anterior: Prophet, modelo: Prophet, linhas: int) -> Optional[Dict[str, Any]]:
+    """
+    Extrai de um modelo ajustado a inicialização do otimizador para um novo ajuste.
+
+    Args:
+        modelo_anterior: Modelo ajustado anteriormente (mesma série e parâmetros).
+        modelo: Modelo Prophet que será ajustado.
+        linhas: Número de observações do novo treinamento.
+
+    Returns:
+        Dicionário com k, m, sigma_obs, delta e beta (argumento init de Prophet.fit),
+        ou None se o modelo anterior não tiver parâmetros compatíveis.
+    """
+    parametros = getattr(modelo_anterior, "params", None) or {}
+    if not all(nome in parametros for nome in ("k", "m", "sigma_obs", "delta", "beta")):
+        return None
+
+    # Média das amostras (uma única linha quando o ajuste é por otimização)
+    inicializacao = {nome: float(np.mean(parametros[nome])) for nome in ("k", "m", "sigma_obs")}
+    for nome in ("delta", "beta"):
+        inicializacao[nome] = np.asarray(parametros[nome]).mean(axis=0)
+
+    if len(inicializacao["delta"]) != numero_pontos_mudanca(modelo, linhas):
+        logger.info("Pontos de mudança incompatíveis com o modelo anterior; treinamento do zero.")
+        return None
+    return inicializacao
+
+
+def criar_figura_previsao(historico: pd.DataFrame, previsao: pd.DataFrame,
+                          titulo: str = "Previsão de Série Temporal") -> go.Figure:
+    """
+    Cria o gráfico de previsão sem o modelo treinado (ex.: para previsões armazenadas).
+    
+    Reproduz o gráfico de plot_plotly: observações, previsão e intervalo de incerteza.
+    
+    Args:
+        historico: DataFrame com os dados de treinamento (colunas 'ds' e 'y').
+        previsao: DataFrame com as previsões (colunas 'ds', 'yhat', 'yhat_lower' e 'yhat_upper').
+        titulo: Título do gráfico.
+        
+    Returns:
+        Objeto Figure do Plotly.
+    """
+    cor_previsao = '#0072B2'
+    cor_incerteza = 'rgba(0, 114, 178, 0.2)'
+    
+    fig = go.Figure(data=[
+        go.Scatter(name='Actual', x=historico['ds'], y=historico['y'],
+                   marker=dict(color='black', size=4), mode='markers'),
+        go.Scatter(x=previsao['ds'], y=previsao['yhat_lower'], mode='lines',
+                   line=dict(width=0), hoverinfo='skip'),
+        go.Scatter(name='Predicted', x=previsao['ds'], y=previsao['yhat'], mode='lines',
+                   line=dict(color=cor_previsao, width=2), fillcolor=cor_incerteza, fill='tonexty'),
+        go.Scatter(x=previsao['ds'], y=previsao['yhat_upper'], mode='lines',
+                   line=dict(width=0), fillcolor=cor_incerteza, fill='tonexty', hoverinfo='skip')
+    ])
+    fig.update_layout(
+        showlegend=False,
+        width=900,
+        height=600,
+        title=titulo,
+        xaxis=dict(
+            title="Data",
+            type='date',
+            rangeselector=dict(buttons=[
+                dict(count=7, label='1w', step='day', stepmode='backward'),
+                dict(count=1, label='1m', step='month', stepmode='backward'),
+                dict(count=6, label='6m', step='month', stepmode='backward'),
+                dict(count=1, label='1y', step='year', stepmode='backward'),
+                dict(step='all')
+            ]),
+            rangeslider=dict(visible=True)
+        ),
+        yaxis_title="Valor",
+        hovermode="x unified"
+    )
+    return fig
+
+
+def combinacoes_grade(grade: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """
+    Expande uma grade de parâmetros em todas as suas combinações.
+    
+    Args:
+        grade: Lista de valores de cada parâmetro do previsor.
+        
+    Returns:
+        Lista de dicionários de parâmetros (produto cartesiano da grade).
+    """
+    nomes = list(grade)
+    return [dict(zip(nomes, valores)) for valores in itertools.product(*(grade[nome] for nome in nomes))]
+
+
+def carregar_dados_preparados(nome_serie: str, diretorio_dados: str) -> pd.DataFrame:
+    """
+    Carrega uma série armazenada no formato do Prophet (colunas 'ds' e 'y').
+    
+    Args:
+        nome_serie: Nome da série armazenada.
+        diretorio_dados: Diretório das séries armazenadas.
+        
+    Returns:
+        DataFrame preparado (vazio se a série não existir).
+    """
+    dados = carregar_serie(nome_serie, [diretorio_dados])
+    return PrevisorSeriesTemporal().preparar_dados(dados, 'data', 'valor')
+
+
+def gerar_previsoes_armazenadas(diretorio_dados: str = None, indicadores: List[str] = None,
+                                repositorio: RepositorioPrevisoes = None,
+                                registro: RegistroModelos = None, processos: int = None) -> Dict[str, int]:
+    """
+    Pré-calcula e grava as previsões de cada indicador para a grade e para os parâmetros ajustados.
+    
+    Cada combinação é treinada com o horizonte máximo configurado; combinações
+    cujos dados e horizonte não mudaram desde a última execução são puladas.
+    Os treinamentos são distribuídos em um pool de processos (ver
+    execucao_lote.executar_lote), e as previsões são gravadas por este processo.
+    
+    Args:
+        diretorio_dados: Diretório das séries armazenadas.
+        indicadores: Indicadores a processar (padrão: todos com série armazenada).
+        repositorio: Repositório de destino (padrão: CONFIGURACAO_PREVISAO["diretorio"]).
+        registro: Registro de modelos ajustados (padrão: CONFIGURACAO_PREVISAO["registro_modelos"]).
+        processos: Número de processos do treinamento (padrão: CONFIGURACAO_PREVISAO["processos"]).
+        
+    Returns:
+        Dicionário com o número de previsões gravadas por indicador.
+    """
+    config = obter_configuracao()
+    diretorio_dados = diretorio_dados or config["caminhos"]["diretorio_dados"]
+    repositorio = repositorio or RepositorioPrevisoes()
+    registro = registro or RegistroModelos.da_configuracao()
+    horizonte = config["previsao"]["horizonte_maximo"]
+    grade = combinacoes_grade(config["previsao"]["grade"])
+    
+    tarefas = []
+    hashes = {}
+    for id_indicador, config_indicador in config["visualizacao"]["indicadores"].items():
+        nome_serie = config_indicador.get("serie_armazenada")
+        if not nome_serie or (indicadores and id_indicador not in indicadores):
+            continue
+        
+        df_preparado = carregar_dados_preparados(nome_serie, diretorio_dados)
+        if len(df_preparado) < 2:
+            logger.warning(f"Dados insuficientes para pré-calcular previsões de {id_indicador}.")
+            continue
+        hashes[id_indicador] = hash_dados = calcular_hash_dados(df_preparado)
+        
+        # Os parâmetros ajustados do indicador (valores iniciais do dashboard) também são pré-calculados
+        combinacoes = list({chave_parametros(parametros): parametros
+                            for parametros in grade + [obter_parametros_previsao(id_indicador)]}.values())
+        for parametros in combinacoes:
+            if not repositorio.atualizada(id_indicador, parametros, hash_dados, horizonte):
+                tarefas.append({
+                    "indicador": id_indicador,
+                    "identificador": nome_serie,
+                    "dados": df_preparado,
+                    "parametros": parametros,
+                    "horizonte": horizonte
+                })
+    
+    resultados = dict.fromkeys(hashes, 0)
+    for tarefa, resultado in zip(tarefas, executar_lote(tarefas, processos, registro)):
+        id_indicador = tarefa["indicador"]
+        if resultado["sucesso"] and repositorio.salvar(id_indicador, tarefa["parametros"], hashes[id_indicador],
+                                                       resultado["previsao"], horizonte, resultado["componentes"]):
+            resultados[id_indicador] += 1
+    
+    for id_indicador, gravadas in resultados.items():
+        logger.info(f"{gravadas} previsões de {id_indicador} recalculadas.")
+    
+    repositorio.salvar_indice()
+    return resultados
+
+
+def gerar_graficos_previsao(diretorio_dados: str = None, registro: RegistroModelos = None,
+                            processos: int = None) -> List[str]:
+    """
+    Gera os gráficos HTML de previsão das séries de CONFIGURACAO_PREVISAO["graficos"].
+    
+    Args:
+        diretorio_dados: Diretório das séries armazenadas e dos gráficos.
+        registro: Registro de modelos ajustados (padrão: CONFIGURACAO_PREVISAO["registro_modelos"]).
+        processos: Número de processos do treinamento (padrão: CONFIGURACAO_PREVISAO["processos"]).
+        
+    Returns:
+        Caminhos dos arquivos gravados.
+    """
+    config = obter_configuracao()
+    diretorio_dados = diretorio_dados or config["caminhos"]["diretorio_dados"]
+    
+    tarefas = []
+    for nome_serie, titulo in config["previsao"]["graficos"].items():
+        df_preparado = carregar_dados_preparados(nome_serie, diretorio_dados)
+        if len(df_preparado) < 2:
+            continue
+        tarefas.append({
+            "identificador": nome_serie,
+            "dados": df_preparado,
+            "parametros": config["previsao"]["parametros_padrao"],
+            "horizonte": 24,  # 24 meses (2 anos)
+            "titulo": titulo
+        })
+    
+    arquivos = []
+    for tarefa, resultado in zip(tarefas, executar_lote(tarefas, processos, registro)):
+        if not resultado["sucesso"]:
+            continue
+        figuras = {
+            f"previsao_{tarefa['identificador']}.html": criar_figura_previsao(tarefa["dados"], resultado["previsao"], tarefa["titulo"]),
+            f"componentes_{tarefa['identificador']}.html": resultado["componentes"]
+        }
+        for nome_arquivo, figura in figuras.items():
+            if figura is not None:
+                caminho = os.path.join(diretorio_dados, nome_arquivo)
+                figura.write_html(caminho)
+                arquivos.append(caminho)
+    return arquivos
+
+
+def processar_dados_deficit(dados: Union[List[Dict[str, Any]], pd.DataFrame]) -> pd.DataFrame:
     """
     Processa dados de déficit primário do BCB.
     
     Args:
-        dados: Lista de dicionários com dados do déficit primário.
+        dados: Lista de dicionários ou DataFrame com dados do déficit primário.
         
     Returns:
         DataFrame processado.
@@ -249,12 +635,12 @@ def processar_dados_deficit(dados: List[Dict[str, Any]]) -> pd.DataFrame:
         return pd.DataFrame()
 
 
-def processar_dados_iof(dados: List[Dict[str, Any]]) -> pd.DataFrame:
+def processar_dados_iof(dados: Union[List[Dict[str, Any]], pd.DataFrame]) -> pd.DataFrame:
     """
     Processa dados de arrecadação de IOF do BCB.
     
     Args:
-        dados: Lista de dicionários com dados de arrecadação de IOF.
+        dados: Lista de dicionários ou DataFrame com dados de arrecadação de IOF.
         
     Returns:
         DataFrame processado.
@@ -284,91 +670,37 @@ def processar_dados_iof(dados: List[Dict[str, Any]]) -> pd.DataFrame:
 
 
 # Função para uso direto via linha de comando
-def executar():
+def executar(argumentos: List[str] = None):
     """Função principal para execução direta do script."""
+    parser = argparse.ArgumentParser(description="Geração das previsões dos indicadores.")
+    parser.add_argument("--indicadores", nargs="+",
+                        help="Indicadores com previsões pré-calculadas (padrão: todos com série armazenada).")
+    parser.add_argument("--sem-pre-calculo", action="store_true",
+                        help="Não pré-calcula as previsões servidas pelo dashboard.")
+    parser.add_argument("--processos", type=int,
+                        help="Processos do treinamento em lote (padrão: CONFIGURACAO_PREVISAO['processos']; 0 = todos os núcleos).")
+    args = parser.parse_args(argumentos)
+    
     # Configurar logging
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
     
-    # Exemplo de uso
     config = obter_configuracao()
     diretorio_dados = config["caminhos"]["diretorio_dados"]
+    registro = RegistroModelos.da_configuracao()
     
-    # Tenta carregar dados de déficit primário
-    arquivo_deficit = os.path.join(diretorio_dados, "deficit_primario.json")
-    if os.path.exists(arquivo_deficit):
-        with open(arquivo_deficit, 'r', encoding='utf-8') as f:
-            dados_deficit = json.load(f)
-            
-        # Processa dados
-        df_deficit = processar_dados_deficit(dados_deficit)
-        
-        if not df_deficit.empty and len(df_deficit) > 1:
-            # Cria e treina modelo para déficit primário
-            previsor_deficit = PrevisorSeriesTemporal(
-                sazonalidade_anual=True,
-                sazonalidade_semanal=False,  # Dados mensais não têm sazonalidade semanal
-                sazonalidade_diaria=False,
-                modo_sazonalidade='multiplicative',
-                escala_prior_pontos_mudanca=0.05
-            )
-            df_preparado = previsor_deficit.preparar_dados(df_deficit, 'data', 'deficit')
-            
-            if previsor_deficit.treinar(df_preparado):
-                # Gera previsão para 24 meses (2 anos)
-                previsao = previsor_deficit.prever(24)
-                
-                # Cria gráficos
-                fig_previsao = previsor_deficit.plotar_previsao(previsao, "Previsão do Déficit Primário")
-                fig_componentes = previsor_deficit.plotar_componentes(previsao)
-                
-                # Salva gráficos
-                if fig_previsao:
-                    fig_previsao.write_html(os.path.join(diretorio_dados, "previsao_deficit_primario.html"))
-                    print("Gráfico de previsão do déficit primário salvo em previsao_deficit_primario.html")
-                
-                if fig_componentes:
-                    fig_componentes.write_html(os.path.join(diretorio_dados, "componentes_deficit_primario.html"))
-                    print("Gráfico de componentes do déficit primário salvo em componentes_deficit_primario.html")
+    # Gráficos HTML de previsão (déficit primário e arrecadação de IOF)
+    for caminho in gerar_graficos_previsao(diretorio_dados, registro, args.processos):
+        print(f"Gráfico salvo em {os.path.basename(caminho)}")
     
-    # Tenta carregar dados de arrecadação de IOF
-    arquivo_iof = os.path.join(diretorio_dados, "arrecadacao_iof.json")
-    if os.path.exists(arquivo_iof):
-        with open(arquivo_iof, 'r', encoding='utf-8') as f:
-            dados_iof = json.load(f)
-            
-        # Processa dados
-        df_iof = processar_dados_iof(dados_iof)
-        
-        if not df_iof.empty and len(df_iof) > 1:
-            # Cria e treina modelo para arrecadação de IOF
-            previsor_iof = PrevisorSeriesTemporal(
-                sazonalidade_anual=True,
-                sazonalidade_semanal=False,  # Dados mensais não têm sazonalidade semanal
-                sazonalidade_diaria=False,
-                modo_sazonalidade='multiplicative',
-                escala_prior_pontos_mudanca=0.05
-            )
-            df_preparado = previsor_iof.preparar_dados(df_iof, 'data', 'iof')
-            
-            if previsor_iof.treinar(df_preparado):
-                # Gera previsão para 24 meses (2 anos)
-                previsao = previsor_iof.prever(24)
-                
-                # Cria gráficos
-                fig_previsao = previsor_iof.plotar_previsao(previsao, "Previsão da Arrecadação de IOF")
-                fig_componentes = previsor_iof.plotar_componentes(previsao)
-                
-                # Salva gráficos
-                if fig_previsao:
-                    fig_previsao.write_html(os.path.join(diretorio_dados, "previsao_arrecadacao_iof.html"))
-                    print("Gráfico de previsão da arrecadação de IOF salvo em previsao_arrecadacao_iof.html")
-                
-                if fig_componentes:
-                    fig_componentes.write_html(os.path.join(diretorio_dados, "componentes_arrecadacao_iof.html"))
-                    print("Gráfico de componentes da arrecadação de IOF salvo em componentes_arrecadacao_iof.html")
+    # Pré-calcula as previsões servidas pelo dashboard
+    if not args.sem_pre_calculo:
+        resultados = gerar_previsoes_armazenadas(diretorio_dados, args.indicadores, registro=registro,
+                                                 processos=args.processos)
+        for id_indicador, gravadas in resultados.items():
+            print(f"Previsões pré-calculadas de {id_indicador}: {gravadas} recalculadas")
 
 
 if __name__ == "__main__":
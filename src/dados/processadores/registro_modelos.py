@@ -0,0 +1,309 @@
+"""
+Módulo do registro de modelos de previsão treinados.
+
+Este módulo contém a classe RegistroModelos, que grava em disco os modelos
+Prophet ajustados (via prophet.serialize) para que reinícios do processo,
+novas sessões do dashboard e o pipeline noturno reutilizem um modelo já
+treinado enquanto os dados de treinamento não mudarem.
+
+Cada modelo ocupa dois arquivos no diretório do registro:
+- <chave>.json: modelo serializado por prophet.serialize.model_to_json
+- <chave>.meta.json: identificador da série, hash dos dados, parâmetros,
+  versão da biblioteca, horário do treinamento e número de linhas
+
+Os metadados são lidos primeiro; o modelo só é desserializado quando os
+metadados confirmam que ele pode ser reutilizado.
+"""
+
+import os
+import json
+import hashlib
+import logging
+import datetime
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any
+
+import prophet
+from prophet import Prophet
+from prophet.serialize import model_to_json, model_from_json
+
+from src.utils.configuracao import obter_configuracao
+from src.dados.armazenamento import escrever_atomico
+from src.dados.processadores.repositorio_previsoes import normalizar_parametros
+
+# Configurar logger
+logger = logging.getLogger(__name__)
+
+# Sufixo dos arquivos de metadados
+SUFIXO_METADADOS = ".meta.json"
+
+
+def versao_biblioteca() -> str:
+    """Retorna a biblioteca e a versão usadas para treinar os modelos."""
+    return f"prophet {prophet.__version__}"
+
+
+def salvar_modelo_prophet(modelo: Prophet, caminho: str) -> None:
+    """
+    Grava um modelo Prophet ajustado em JSON, de forma atômica.
+
+    Args:
+        modelo: Modelo ajustado.
+        caminho: Caminho do arquivo de destino.
+
+    Raises:
+        OSError: Se a escrita falhar.
+        ValueError: Se o modelo ainda não tiver sido ajustado.
+    """
+    conteudo = model_to_json(modelo)
+
+    def escrever(caminho_temporario: str) -> None:
+        with open(caminho_temporario, 'w', encoding='utf-8') as f:
+            f.write(conteudo)
+
+    escrever_atomico(caminho, escrever)
+
+
+def carregar_modelo_prophet(caminho: str) -> Prophet:
+    """
+    Carrega um modelo Prophet gravado por salvar_modelo_prophet.
+
+    Args:
+        caminho: Caminho do arquivo.
+
+    Returns:
+        Modelo ajustado.
+
+    Raises:
+        OSError: Se a leitura falhar.
+        ValueError: Se o conteúdo não for um modelo válido.
+    """
+    with open(caminho, 'r', encoding='utf-8') as f:
+        return model_from_json(f.read())
+
+
+def chave_modelo(hash_dados: str, tipo_modelo: str, parametros: Dict[str, Any]) -> str:
+    """
+    Calcula a chave de um modelo no registro.
+
+    Args:
+        hash_dados: Hash dos dados de treinamento (ver calcular_hash_dados).
+        tipo_modelo: Tipo de modelo de previsão.
+        parametros: Parâmetros do previsor.
+
+    Returns:
+        Prefixo (32 caracteres) do SHA-256 da combinação.
+    """
+    conteudo = json.dumps({
+        "hash_dados": hash_dados,
+        "tipo_modelo": tipo_modelo,
+        "parametros": normalizar_parametros(parametros)
+    }, sort_keys=True)
+    return hashlib.sha256(conteudo.encode("utf-8")).hexdigest()[:32]
+
+
+class RegistroModelos:
+    """
+    Registro em disco dos modelos de previsão ajustados.
+
+    Attributes:
+        diretorio (str): Diretório do registro.
+        max_modelos (int): Número máximo de modelos mantidos (os treinados há
+            mais tempo são removidos primeiro).
+        modelos_em_memoria (int): Número de modelos desserializados mantidos em memória.
+    """
+
+    def __init__(self, diretorio: str = None, max_modelos: int = 200, modelos_em_memoria: int = 4):
+        """
+        Inicializa o registro.
+
+        Args:
+            diretorio: Diretório do registro (padrão: CONFIGURACAO_PREVISAO["registro_modelos"]).
+            max_modelos: Número máximo de modelos mantidos em disco.
+            modelos_em_memoria: Número de modelos desserializados mantidos em memória.
+        """
+        self.diretorio = diretorio or obter_configuracao()["previsao"]["registro_modelos"]["diretorio"]
+        self.max_modelos = max(1, max_modelos)
+        self.modelos_em_memoria = max(0, modelos_em_memoria)
+        self._carregados: "OrderedDict[str, Prophet]" = OrderedDict()
+        self._trava = threading.Lock()
+        os.makedirs(self.diretorio, exist_ok=True)
+
+    @classmethod
+    def da_configuracao(cls) -> "RegistroModelos":
+        """Cria um registro com os parâmetros de CONFIGURACAO_PREVISAO["registro_modelos"]."""
+        config = obter_configuracao()["previsao"]["registro_modelos"]
+        return cls(config["diretorio"], config["max_modelos"])
+
+    def _caminho_modelo(self, chave: str) -> str:
+        return os.path.join(self.diretorio, f"{chave}.json")
+
+    def _caminho_metadados(self, chave: str) -> str:
+        return os.path.join(self.diretorio, f"{chave}{SUFIXO_METADADOS}")
+
+    def obter_metadados(self, hash_dados: str, tipo_modelo: str, parametros: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Retorna os metadados de um modelo registrado, sem carregar o modelo.
+
+        Args:
+            hash_dados: Hash dos dados de treinamento.
+            tipo_modelo: Tipo de modelo de previsão.
+            parametros: Parâmetros do previsor.
+
+        Returns:
+            Metadados do modelo ou None se não houver modelo registrado.
+        """
+        caminho = self._caminho_metadados(chave_modelo(hash_dados, tipo_modelo, parametros))
+        try:
+            with open(caminho, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Metadados inválidos no registro de modelos ({caminho}): {e}")
+            return None
+
+    def carregar(self, hash_dados: str, tipo_modelo: str, parametros: Dict[str, Any]) -> Optional[Prophet]:
+        """
+        Carrega o modelo treinado com os dados e parâmetros indicados, se houver.
+
+        Modelos gravados por outra versão da biblioteca não são reutilizados.
+
+        Args:
+            hash_dados: Hash dos dados de treinamento.
+            tipo_modelo: Tipo de modelo de previsão.
+            parametros: Parâmetros do previsor.
+
+        Returns:
+            Modelo ajustado ou None se não houver modelo reutilizável.
+        """
+        chave = chave_modelo(hash_dados, tipo_modelo, parametros)
+        with self._trava:
+            modelo = self._carregados.get(chave)
+            if modelo is not None:
+                self._carregados.move_to_end(chave)
+                return modelo
+
+        metadados = self.obter_metadados(hash_dados, tipo_modelo, parametros)
+        if metadados is None or metadados.get("hash_dados") != hash_dados:
+            return None
+        if metadados.get("versao_biblioteca") != versao_biblioteca():
+            logger.info(f"Modelo {chave[:12]} treinado com {metadados.get('versao_biblioteca')}; será retreinado.")
+            return None
+
+        try:
+            modelo = carregar_modelo_prophet(self._caminho_modelo(chave))
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Erro ao carregar o modelo {chave[:12]} do registro: {e}")
+            return None
+
+        if self.modelos_em_memoria:
+            with self._trava:
+                self._carregados[chave] = modelo
+                while len(self._carregados) > self.modelos_em_memoria:
+                    self._carregados.popitem(last=False)
+        logger.info(f"Modelo {chave[:12]} carregado do registro (treinado em {metadados.get('treinado_em')}).")
+        return modelo
+
+    def carregar_anterior(self, identificador: str, tipo_modelo: str,
+                          parametros: Dict[str, Any]) -> Optional[Prophet]:
+        """
+        Carrega o modelo mais recente de uma série com os mesmos parâmetros, com quaisquer dados.
+
+        Usado como ponto de partida do treinamento incremental quando os dados mudaram.
+
+        Args:
+            identificador: Identificador da série (ex.: 'deficit_primario').
+            tipo_modelo: Tipo de modelo de previsão.
+            parametros: Parâmetros do previsor.
+
+        Returns:
+            Modelo ajustado ou None se não houver modelo anterior da mesma versão da biblioteca.
+        """
+        parametros = normalizar_parametros(parametros)
+        for metadados in reversed(self.listar()):
+            if (metadados.get("identificador") == identificador and metadados.get("tipo_modelo") == tipo_modelo
+                    and metadados.get("parametros") == parametros
+                    and metadados.get("versao_biblioteca") == versao_biblioteca()):
+                return self.carregar(metadados["hash_dados"], tipo_modelo, parametros)
+        return None
+
+    def salvar(self, modelo: Prophet, hash_dados: str, tipo_modelo: str, parametros: Dict[str, Any],
+               linhas: int = None, identificador: str = None) -> bool:
+        """
+        Registra um modelo ajustado.
+
+        O modelo é gravado antes dos metadados, de modo que metadados
+        presentes sempre apontam para um modelo completo.
+
+        Args:
+            modelo: Modelo ajustado.
+            hash_dados: Hash dos dados de treinamento.
+            tipo_modelo: Tipo de modelo de previsão.
+            parametros: Parâmetros do previsor.
+            linhas: Número de observações de treinamento.
+            identificador: Identificador da série (permite localizar o modelo
+                anterior no treinamento incremental).
+
+        Returns:
+            True se o modelo foi registrado, False em caso de erro.
+        """
+        chave = chave_modelo(hash_dados, tipo_modelo, parametros)
+        metadados = {
+            "identificador": identificador,
+            "tipo_modelo": tipo_modelo,
+            "parametros": normalizar_parametros(parametros),
+            "hash_dados": hash_dados,
+            "versao_biblioteca": versao_biblioteca(),
+            "treinado_em": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+            "linhas": linhas,
+            "arquivo": os.path.basename(self._caminho_modelo(chave))
+        }
+
+        def escrever_metadados(caminho_temporario: str) -> None:
+            with open(caminho_temporario, 'w', encoding='utf-8') as f:
+                json.dump(metadados, f, ensure_ascii=False, indent=4)
+
+        try:
+            salvar_modelo_prophet(modelo, self._caminho_modelo(chave))
+            escrever_atomico(self._caminho_metadados(chave), escrever_metadados)
+        except (OSError, ValueError) as e:
+            logger.error(f"Erro ao registrar o modelo {chave[:12]}: {e}")
+            return False
+
+        logger.info(f"Modelo {chave[:12]} registrado em {self.diretorio}")
+        self._limitar()
+        return True
+
+    def listar(self) -> List[Dict[str, Any]]:
+        """Retorna os metadados de todos os modelos registrados, do mais antigo ao mais recente."""
+        modelos = []
+        for nome in os.listdir(self.diretorio):
+            if not nome.endswith(SUFIXO_METADADOS) or nome.startswith("."):
+                continue
+            try:
+                with open(os.path.join(self.diretorio, nome), 'r', encoding='utf-8') as f:
+                    metadados = json.load(f)
+            except (OSError, ValueError):
+                continue
+            metadados["chave"] = nome[:-len(SUFIXO_METADADOS)]
+            modelos.append(metadados)
+        return sorted(modelos, key=lambda metadados: metadados.get("treinado_em") or "")
+
+    def remover(self, chave: str) -> None:
+        """Remove um modelo do registro (metadados primeiro, depois o modelo)."""
+        with self._trava:
+            self._carregados.pop(chave, None)
+        for caminho in (self._caminho_metadados(chave), self._caminho_modelo(chave)):
+            try:
+                os.remove(caminho)
+            except OSError:
+                pass
+
+    def _limitar(self) -> None:
+        """Remove os modelos treinados há mais tempo além de max_modelos."""
+        modelos = self.listar()
+        for metadados in modelos[:max(0, len(modelos) - self.max_modelos)]:
+            self.remover(metadados["chave"])
+            logger.info(f"Modelo {metadados['chave'][:12]} removido do registro (limite de {self.max_modelos}).")
@@ -0,0 +1,329 @@
+"""
+Módulo de persistência das previsões pré-calculadas pelo pipeline.
+
+Este módulo contém a classe RepositorioPrevisoes, que grava em disco as
+previsões geradas para cada indicador e combinação de parâmetros e as
+devolve ao dashboard quando os parâmetros escolhidos e os dados coincidem
+com os usados no treinamento. Cada previsão é gravada uma única vez, com o
+maior horizonte configurado; horizontes menores são recortes dela.
+
+Estrutura do diretório:
+- indice.json: parâmetros, hash dos dados, horizonte e arquivos de cada previsão
+- <indicador>/<chave>.parquet (ou .json): colunas ds, yhat, yhat_lower e yhat_upper
+- <indicador>/<chave>.componentes.json: gráfico de componentes (Plotly JSON)
+
+O gráfico de componentes também é gravado com o horizonte máximo; ao
+recortar a previsão, as curvas com um ponto por data prevista (tendência,
+feriados, regressores) são recortadas junto (ver recortar_componentes).
+"""
+
+import os
+import json
+import hashlib
+import logging
+import datetime
+import threading
+from typing import Dict, Optional, Any
+
+import pandas as pd
+import plotly.io as pio
+import plotly.graph_objects as go
+
+from src.utils.configuracao import obter_configuracao
+from src.dados.armazenamento import escrever_atomico, calcular_hash_serie, formato_disponivel
+
+# Configurar logger
+logger = logging.getLogger(__name__)
+
+# Colunas da previsão mantidas em disco (as usadas pelo dashboard)
+COLUNAS_PREVISAO = ["ds", "yhat", "yhat_lower", "yhat_upper"]
+
+
+def normalizar_parametros(parametros: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Normaliza os parâmetros de um previsor para comparação e uso como chave.
+
+    A escala do prior é arredondada, pois os valores vindos de sliders do
+    dashboard podem carregar erros de ponto flutuante (ex.: 0.05000000000000001).
+
+    Args:
+        parametros: Parâmetros do previsor (ver PrevisorSeriesTemporal.parametros).
+
+    Returns:
+        Parâmetros com tipos e arredondamento padronizados, em ordem alfabética.
+    """
+    normalizados = {}
+    for nome, valor in sorted(parametros.items()):
+        if isinstance(valor, bool) or valor is None:
+            normalizados[nome] = valor
+        elif isinstance(valor, (int, float)):
+            normalizados[nome] = round(float(valor), 6)
+        else:
+            normalizados[nome] = str(valor)
+    return normalizados
+
+
+def chave_parametros(parametros: Dict[str, Any]) -> str:
+    """
+    Calcula a chave de uma combinação de parâmetros.
+
+    Args:
+        parametros: Parâmetros do previsor.
+
+    Returns:
+        Prefixo (16 caracteres) do SHA-256 dos parâmetros normalizados.
+    """
+    conteudo = json.dumps(normalizar_parametros(parametros), sort_keys=True)
+    return hashlib.sha256(conteudo.encode("utf-8")).hexdigest()[:16]
+
+
+def calcular_hash_dados(df_preparado: pd.DataFrame) -> str:
+    """
+    Calcula o hash dos dados de treinamento de uma previsão.
+
+    Args:
+        df_preparado: DataFrame no formato do Prophet (colunas 'ds' e 'y').
+
+    Returns:
+        Hash SHA-256 (hexadecimal) das datas e valores (ver calcular_hash_serie).
+    """
+    return calcular_hash_serie(df_preparado.rename(columns={"ds": "data", "y": "valor"}))
+
+
+def recortar_componentes(componentes: go.Figure, linhas_total: int, linhas: int) -> go.Figure:
+    """
+    Recorta o gráfico de componentes de uma previsão para um horizonte menor.
+
+    As curvas com um ponto por linha da previsão (tendência, feriados e
+    regressores, no eixo de datas da previsão) são truncadas nas primeiras
+    `linhas` posições e o intervalo dos seus eixos é recalculado com a mesma
+    margem de 5% do Prophet. As curvas de sazonalidade (perfil de um ano ou
+    de uma semana) não dependem do horizonte e são mantidas.
+
+    Args:
+        componentes: Gráfico gerado por plot_components_plotly com a previsão completa.
+        linhas_total: Número de linhas da previsão completa (histórico e horizonte).
+        linhas: Número de linhas da previsão recortada.
+
+    Returns:
+        Cópia do gráfico recortada (ou o próprio gráfico, se não houver recorte).
+    """
+    if linhas >= linhas_total:
+        return componentes
+
+    fig = go.Figure(componentes)
+    datas_por_eixo: Dict[str, pd.Series] = {}
+    for curva in fig.data:
+        if curva.x is None or len(curva.x) != linhas_total:
+            continue
+        curva.x = curva.x[:linhas]
+        if curva.y is not None:
+            curva.y = curva.y[:linhas]
+        eixo = curva.xaxis or "x"
+        datas_por_eixo[eixo] = pd.to_datetime(pd.Series(curva.x))
+
+    for eixo, datas in datas_por_eixo.items():
+        margem = (datas.max() - datas.min()) * 0.05
+        fig.layout["xaxis" + eixo[1:]].range = [datas.min() - margem, datas.max() + margem]
+    return fig
+
+
+class RepositorioPrevisoes:
+    """
+    Repositório em disco das previsões pré-calculadas.
+
+    Attributes:
+        diretorio (str): Diretório das previsões.
+        formato (str): Formato dos arquivos de previsão ("parquet" ou "json").
+        previsoes (Dict[str, Dict[str, Dict[str, Any]]]): Entradas do índice por
+            indicador e chave de parâmetros.
+    """
+
+    NOME_INDICE = "indice.json"
+
+    def __init__(self, diretorio: str = None, formato: str = None):
+        """
+        Inicializa o repositório, carregando o índice existente (se houver).
+
+        Args:
+            diretorio: Diretório das previsões (padrão: CONFIGURACAO_PREVISAO["diretorio"]).
+            formato: Formato dos arquivos de previsão (padrão: parquet, se disponível).
+        """
+        self.diretorio = diretorio or obter_configuracao()["previsao"]["diretorio"]
+        formato = formato or "parquet"
+        self.formato = "parquet" if formato == "parquet" and formato_disponivel(formato) else "json"
+        self.caminho_indice = os.path.join(self.diretorio, self.NOME_INDICE)
+        self.previsoes: Dict[str, Dict[str, Dict[str, Any]]] = self._ler_indice()
+        self._alteradas = set()
+        self._trava = threading.Lock()
+
+    def _ler_indice(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        if not os.path.exists(self.caminho_indice):
+            return {}
+        try:
+            with open(self.caminho_indice, 'r', encoding='utf-8') as f:
+                return json.load(f).get("previsoes", {})
+        except (IOError, ValueError) as e:
+            logger.warning(f"Erro ao ler o índice de previsões {self.caminho_indice}, será recriado: {e}")
+            return {}
+
+    def obter_entrada(self, indicador: str, parametros: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Retorna a entrada do índice para um indicador e parâmetros, ou None se não houver."""
+        with self._trava:
+            entrada = self.previsoes.get(indicador, {}).get(chave_parametros(parametros))
+            return dict(entrada) if entrada else None
+
+    def atualizada(self, indicador: str, parametros: Dict[str, Any], hash_dados: str, horizonte: int) -> bool:
+        """
+        Verifica se já existe previsão para os mesmos dados, parâmetros e horizonte (ou maior).
+
+        Args:
+            indicador: Identificador do indicador.
+            parametros: Parâmetros do previsor.
+            hash_dados: Hash dos dados de treinamento (ver calcular_hash_dados).
+            horizonte: Número de períodos previstos.
+
+        Returns:
+            True se a previsão armazenada pode ser reutilizada.
+        """
+        entrada = self.obter_entrada(indicador, parametros)
+        return (entrada is not None and entrada.get("hash_dados") == hash_dados
+                and entrada.get("horizonte", 0) >= horizonte)
+
+    def salvar(self, indicador: str, parametros: Dict[str, Any], hash_dados: str, previsao: pd.DataFrame,
+               horizonte: int, fig_componentes: Optional[go.Figure] = None) -> bool:
+        """
+        Grava uma previsão e registra sua entrada no índice (gravado por salvar_indice).
+
+        Args:
+            indicador: Identificador do indicador.
+            parametros: Parâmetros do previsor.
+            hash_dados: Hash dos dados de treinamento.
+            previsao: DataFrame retornado por PrevisorSeriesTemporal.prever(horizonte).
+            horizonte: Número de períodos previstos.
+            fig_componentes: Gráfico de componentes da previsão (opcional).
+
+        Returns:
+            True se a previsão foi gravada, False em caso de erro.
+        """
+        chave = chave_parametros(parametros)
+        diretorio_indicador = os.path.join(self.diretorio, indicador)
+        arquivo = f"{chave}.{self.formato}"
+        arquivo_componentes = f"{chave}.componentes.json" if fig_componentes is not None else None
+        df = previsao[COLUNAS_PREVISAO]
+
+        def escrever_previsao(caminho_temporario: str) -> None:
+            if self.formato == "parquet":
+                df.to_parquet(caminho_temporario, index=False)
+            else:
+                df.to_json(caminho_temporario, orient="records", date_format="iso")
+
+        def escrever_componentes(caminho_temporario: str) -> None:
+            with open(caminho_temporario, 'w', encoding='utf-8') as f:
+                f.write(fig_componentes.to_json())
+
+        try:
+            os.makedirs(diretorio_indicador, exist_ok=True)
+            escrever_atomico(os.path.join(diretorio_indicador, arquivo), escrever_previsao)
+            if arquivo_componentes:
+                escrever_atomico(os.path.join(diretorio_indicador, arquivo_componentes), escrever_componentes)
+        except (OSError, ValueError) as e:
+            logger.error(f"Erro ao salvar a previsão de {indicador} ({chave}): {e}")
+            return False
+
+        with self._trava:
+            self.previsoes.setdefault(indicador, {})[chave] = {
+                "parametros": normalizar_parametros(parametros),
+                "hash_dados": hash_dados,
+                "horizonte": int(horizonte),
+                "linhas": int(len(df)),
+                "arquivo": arquivo,
+                "arquivo_componentes": arquivo_componentes,
+                "gerado_em": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds')
+            }
+            self._alteradas.add((indicador, chave))
+
+        logger.info(f"Previsão de {indicador} salva em {os.path.join(diretorio_indicador, arquivo)}")
+        return True
+
+    def salvar_indice(self) -> bool:
+        """
+        Grava o índice de forma atômica, mesclando as entradas alteradas ao arquivo em disco.
+
+        Returns:
+            True se o índice foi salvo (ou não havia alterações), False em caso de erro.
+        """
+        with self._trava:
+            if not self._alteradas:
+                return True
+
+            previsoes = self._ler_indice()
+            for indicador, chave in self._alteradas:
+                previsoes.setdefault(indicador, {})[chave] = self.previsoes[indicador][chave]
+            conteudo = {
+                "versao": 1,
+                "previsoes": {indicador: dict(sorted(entradas.items())) for indicador, entradas in sorted(previsoes.items())}
+            }
+
+            def escrever(caminho_temporario: str) -> None:
+                with open(caminho_temporario, 'w', encoding='utf-8') as f:
+                    json.dump(conteudo, f, ensure_ascii=False, indent=4)
+
+            try:
+                os.makedirs(self.diretorio, exist_ok=True)
+                escrever_atomico(self.caminho_indice, escrever)
+                self.previsoes = previsoes
+                self._alteradas.clear()
+                logger.info(f"Índice de previsões salvo em {self.caminho_indice}")
+                return True
+            except OSError as e:
+                logger.error(f"Erro ao salvar o índice de previsões {self.caminho_indice}: {e}")
+                return False
+
+    def obter(self, indicador: str, parametros: Dict[str, Any], hash_dados: str,
+              periodos: int) -> Optional[Dict[str, Any]]:
+        """
+        Obtém uma previsão armazenada, recortada para o horizonte pedido.
+
+        Args:
+            indicador: Identificador do indicador.
+            parametros: Parâmetros do previsor.
+            hash_dados: Hash dos dados atuais do indicador; previsões treinadas
+                com outros dados não são usadas.
+            periodos: Número de períodos futuros desejado.
+
+        Returns:
+            Dicionário com 'previsao' (DataFrame), 'componentes' (Figure ou None,
+            recortado para o mesmo horizonte) e 'gerado_em', ou None se não
+            houver previsão compatível.
+        """
+        entrada = self.obter_entrada(indicador, parametros)
+        if entrada is None or entrada.get("hash_dados") != hash_dados or entrada.get("horizonte", 0) < periodos:
+            return None
+
+        diretorio_indicador = os.path.join(self.diretorio, indicador)
+        try:
+            caminho = os.path.join(diretorio_indicador, entrada["arquivo"])
+            if caminho.endswith(".parquet"):
+                previsao = pd.read_parquet(caminho)
+            else:
+                previsao = pd.read_json(caminho, orient="records", convert_dates=False)
+            previsao["ds"] = pd.to_datetime(previsao["ds"])
+
+            componentes = None
+            if entrada.get("arquivo_componentes"):
+                with open(os.path.join(diretorio_indicador, entrada["arquivo_componentes"]), 'r', encoding='utf-8') as f:
+                    componentes = pio.from_json(f.read())
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Erro ao ler a previsão armazenada de {indicador}: {e}")
+            return None
+
+        # A previsão armazenada cobre o horizonte máximo; horizontes menores são um recorte
+        linhas = len(previsao) - (entrada["horizonte"] - periodos)
+        if componentes is not None:
+            componentes = recortar_componentes(componentes, len(previsao), linhas)
+        return {
+            "previsao": previsao.iloc[:linhas],
+            "componentes": componentes,
+            "gerado_em": entrada.get("gerado_em")
+        }
@@ -0,0 +1,277 @@
+"""
+Módulo de acesso ao banco de dados PostgreSQL para o Termômetro da Economia.
+
+Este módulo contém o pool de conexões compartilhado pelo processo do
+dashboard. As conexões são validadas antes do empréstimo, e as que ficam
+ociosas por tempo demais (acima do mínimo do pool) são fechadas tanto na
+devolução quanto por uma thread de manutenção, de modo que o número de
+conexões abertas no servidor diminui mesmo com o dashboard parado. O modo do pool
+(CONFIGURACAO_BD["pool_mode"]) define se cada consulta usa uma conexão
+própria ("transaction") ou se um carregamento inteiro usa uma só ("session").
+"""
+
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, Optional
+
+try:
+    import psycopg2
+    from psycopg2 import pool as psycopg2_pool
+except ImportError:  # Dependência opcional: sem ela, o dashboard usa apenas os arquivos de dados
+    psycopg2 = None
+    psycopg2_pool = None
+
+from src.utils.configuracao import obter_configuracao
+
+# Configurar logger
+logger = logging.getLogger(__name__)
+
+# Modos de pool suportados
+MODOS_POOL = ("transaction", "session")
+
+
+class PoolConexoes:
+    """
+    Pool de conexões PostgreSQL seguro para uso entre threads.
+
+    Quando todas as conexões estão em uso, quem pede uma conexão aguarda até
+    pool_tempo_espera segundos em vez de abrir conexões adicionais.
+
+    Attributes:
+        modo (str): Modo do pool ("transaction" ou "session").
+        minimo (int): Número de conexões mantidas abertas mesmo quando ociosas.
+        maximo (int): Número máximo de conexões simultâneas.
+        tempo_ocioso (float): Segundos de ociosidade após os quais a conexão é fechada.
+        intervalo_verificacao (float): Segundos de ociosidade após os quais a conexão
+            é validada com SELECT 1 antes do empréstimo; também é o intervalo
+            entre as passagens da thread que fecha as conexões ociosas.
+        tempo_espera (float): Segundos aguardando uma conexão livre.
+    """
+
+    def __init__(self, parametros_conexao: Dict[str, Any], minimo: int = 1, maximo: int = 10,
+                 modo: str = "transaction", tempo_ocioso: float = 300.0,
+                 intervalo_verificacao: float = 30.0, tempo_espera: float = 10.0):
+        """
+        Inicializa o pool e abre as conexões mínimas.
+
+        Args:
+            parametros_conexao: Parâmetros de psycopg2.connect (host, port, database etc.).
+            minimo: Número de conexões mantidas abertas.
+            maximo: Número máximo de conexões simultâneas.
+            modo: Modo do pool ("transaction" ou "session").
+            tempo_ocioso: Segundos de ociosidade até descartar uma conexão.
+            intervalo_verificacao: Segundos de ociosidade até validar uma conexão.
+            tempo_espera: Segundos aguardando uma conexão livre.
+
+        Raises:
+            ImportError: Se o pacote psycopg2 não estiver instalado.
+            psycopg2.Error: Se não for possível abrir as conexões iniciais.
+        """
+        if psycopg2 is None:
+            raise ImportError("O pacote psycopg2 é necessário para acessar o banco de dados.")
+
+        if modo not in MODOS_POOL:
+            logger.warning(f"Modo de pool desconhecido '{modo}'; usando 'transaction'.")
+            modo = "transaction"
+
+        maximo = max(1, maximo)
+        self.modo = modo
+        self.minimo = min(max(0, minimo), maximo)
+        self.maximo = maximo
+        self.tempo_ocioso = tempo_ocioso
+        self.intervalo_verificacao = intervalo_verificacao
+        self.tempo_espera = tempo_espera
+        self._pool = psycopg2_pool.ThreadedConnectionPool(self.minimo, maximo, **parametros_conexao)
+        # O psycopg2 fecha na devolução toda conexão acima de minconn, e minconn também é o
+        # número aberto na criação. Depois de abrir as mínimas, o pool passa a guardar até
+        # `maximo` conexões livres, e descartar_ociosas fecha as que excedem `minimo` após tempo_ocioso
+        self._pool.minconn = maximo
+        self._vagas = threading.BoundedSemaphore(maximo)
+        self._ultimo_uso: Dict[int, float] = {}
+        self._trava = threading.Lock()
+
+        # Fecha periodicamente as conexões ociosas, mesmo sem empréstimos
+        self._encerrado = threading.Event()
+        if tempo_ocioso > 0:
+            threading.Thread(target=self._manter, name="manutencao_pool_bd", daemon=True).start()
+
+    @classmethod
+    def da_configuracao(cls) -> "PoolConexoes":
+        """Cria um pool com os parâmetros de CONFIGURACAO_BD."""
+        config = obter_configuracao()["bd"]
+        parametros = {
+            "host": config["host"],
+            "port": config["port"],
+            "database": config["database"],
+            "user": config["user"],
+            "password": config["password"],
+            "connect_timeout": config["connect_timeout"]
+        }
+        return cls(
+            parametros,
+            minimo=config["pool_min"],
+            maximo=config["pool_max"],
+            modo=config["pool_mode"],
+            tempo_ocioso=config["pool_tempo_ocioso"],
+            intervalo_verificacao=config["pool_intervalo_verificacao"],
+            tempo_espera=config["pool_tempo_espera"]
+        )
+
+    def _conexao_valida(self, conexao) -> bool:
+        """
+        Verifica se uma conexão do pool pode ser emprestada.
+
+        Conexões fechadas ou ociosas além de tempo_ocioso são recusadas;
+        conexões ociosas além de intervalo_verificacao são testadas com SELECT 1.
+        """
+        if conexao.closed:
+            return False
+
+        with self._trava:
+            ultimo_uso = self._ultimo_uso.get(id(conexao))
+        if ultimo_uso is None:
+            return True
+
+        ociosa = time.monotonic() - ultimo_uso
+        if ociosa > self.tempo_ocioso:
+            return False
+        if ociosa > self.intervalo_verificacao:
+            try:
+                with conexao.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+                conexao.rollback()
+            except psycopg2.Error:
+                return False
+        return True
+
+    def descartar_ociosas(self) -> int:
+        """
+        Fecha as conexões livres ociosas há mais de tempo_ocioso segundos.
+
+        As conexões mínimas do pool são preservadas. As mais antigas são
+        fechadas primeiro.
+
+        Returns:
+            Número de conexões fechadas.
+        """
+        agora = time.monotonic()
+        fechadas = []
+        # O psycopg2 não expõe as conexões livres: a lista interna _pool é
+        # acessada sob a trava do próprio ThreadedConnectionPool
+        with self._pool._lock:
+            if self._pool.closed:
+                return 0
+            livres = self._pool._pool
+            abertas = len(livres) + len(self._pool._used)
+            with self._trava:
+                # As conexões livres são emprestadas do fim da lista; o início tem as mais antigas
+                for conexao in list(livres):
+                    if abertas <= self.minimo:
+                        break
+                    ultimo_uso = self._ultimo_uso.get(id(conexao))
+                    if conexao.closed or (ultimo_uso is not None and agora - ultimo_uso > self.tempo_ocioso):
+                        livres.remove(conexao)
+                        self._ultimo_uso.pop(id(conexao), None)
+                        fechadas.append(conexao)
+                        abertas -= 1
+
+        for conexao in fechadas:
+            try:
+                conexao.close()
+            except psycopg2.Error:
+                pass
+        if fechadas:
+            logger.info(f"{len(fechadas)} conexão(ões) ociosa(s) do pool fechada(s).")
+        return len(fechadas)
+
+    def _manter(self) -> None:
+        """Laço da thread de manutenção: fecha as conexões ociosas a cada intervalo_verificacao segundos."""
+        intervalo = max(1.0, min(self.intervalo_verificacao, self.tempo_ocioso))
+        while not self._encerrado.wait(intervalo):
+            try:
+                self.descartar_ociosas()
+            except Exception as e:
+                logger.warning(f"Erro ao fechar conexões ociosas do pool: {e}")
+
+    def _descartar(self, conexao) -> None:
+        """Fecha uma conexão e a remove do pool."""
+        with self._trava:
+            self._ultimo_uso.pop(id(conexao), None)
+        try:
+            self._pool.putconn(conexao, close=True)
+        except psycopg2_pool.PoolError:
+            pass
+
+    @contextmanager
+    def conexao(self) -> Iterator[Any]:
+        """
+        Empresta uma conexão do pool pelo tempo do bloco with.
+
+        Ao final do bloco, transações pendentes são desfeitas e a conexão volta ao pool.
+
+        Yields:
+            Conexão psycopg2 validada.
+
+        Raises:
+            psycopg2.pool.PoolError: Se nenhuma conexão ficar livre em tempo_espera segundos.
+        """
+        if not self._vagas.acquire(timeout=self.tempo_espera):
+            raise psycopg2_pool.PoolError(f"Nenhuma conexão livre no pool após {self.tempo_espera}s")
+
+        conexao = None
+        try:
+            conexao = self._pool.getconn()
+            # Substitui conexões fechadas, expiradas ou que falharam na verificação
+            while not self._conexao_valida(conexao):
+                logger.info("Conexão do pool expirada ou inválida; abrindo uma nova.")
+                self._descartar(conexao)
+                conexao = None
+                conexao = self._pool.getconn()
+
+            yield conexao
+        finally:
+            if conexao is not None:
+                self._devolver(conexao)
+            self._vagas.release()
+
+    def _devolver(self, conexao) -> None:
+        """Devolve uma conexão ao pool, desfazendo transações pendentes."""
+        if conexao.closed:
+            self._descartar(conexao)
+            return
+        try:
+            conexao.rollback()
+        except psycopg2.Error:
+            self._descartar(conexao)
+            return
+        with self._trava:
+            self._ultimo_uso[id(conexao)] = time.monotonic()
+        self._pool.putconn(conexao)
+        self.descartar_ociosas()
+
+    @contextmanager
+    def sessao(self) -> Iterator[Optional[Any]]:
+        """
+        Delimita um carregamento de dados conforme o modo do pool.
+
+        No modo "session", uma única conexão é emprestada para todo o bloco;
+        no modo "transaction", nenhuma conexão é emprestada aqui e cada consulta
+        deve usar conexao() individualmente.
+
+        Yields:
+            Conexão emprestada (modo "session") ou None (modo "transaction").
+        """
+        if self.modo == "session":
+            with self.conexao() as conexao:
+                yield conexao
+        else:
+            yield None
+
+    def fechar(self) -> None:
+        """Fecha todas as conexões do pool e encerra a thread de manutenção."""
+        self._encerrado.set()
+        self._pool.closeall()
+        with self._trava:
+            self._ultimo_uso.clear()
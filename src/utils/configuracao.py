@@ -9,6 +9,7 @@ Este módulo centraliza todas as configurações do projeto, incluindo:
 """
 
 import os
+import json
 import base64
 import logging
 from typing import Dict, Any
@@ -45,7 +46,15 @@ CONFIGURACAO_BD = {
     "database": os.environ.get("DB_NAME", "economia"),
     "user": os.environ.get("DB_USER", "postgres"),
     "password": os.environ.get("DB_PASSWORD", "projetobi_123"),
-    "pool_mode": os.environ.get("DB_POOL_MODE", "transaction")
+    # "transaction": uma conexão do pool por consulta; "session": uma conexão por carregamento da página
+    "pool_mode": os.environ.get("DB_POOL_MODE", "transaction"),
+    "pool_min": int(os.environ.get("DB_POOL_MIN", "1")),
+    "pool_max": int(os.environ.get("DB_POOL_MAX", "10")),
+    "pool_tempo_ocioso": float(os.environ.get("DB_POOL_TEMPO_OCIOSO", "300")),  # segundos até fechar uma conexão ociosa acima de pool_min
+    "pool_intervalo_verificacao": 30.0,  # segundos ociosa antes de validar a conexão com SELECT 1
+    "pool_tempo_espera": 10.0,  # segundos aguardando uma conexão livre quando o pool está esgotado
+    "connect_timeout": int(os.environ.get("DB_CONNECT_TIMEOUT", "5")),  # segundos
+    "timeout_consulta": float(os.environ.get("DB_TIMEOUT_CONSULTA", "10"))  # segundos por consulta de indicador
 }
 
 # Configuração de extração de dados
@@ -59,7 +68,25 @@ CONFIGURACAO_EXTRACAO = {
             "7414": "arrecadacao_iof",
             "7415": "deficit_primario"
         },
-        "dias_retroativos": 5 * 365  # 5 anos
+        "dias_retroativos": 5 * 365,  # 5 anos
+        "max_concorrencia": int(os.environ.get("BCB_MAX_CONCORRENCIA", "8")),  # Séries extraídas em paralelo
+        # Extração incremental (opcional): busca apenas a partir da última observação armazenada
+        "incremental": os.environ.get("BCB_INCREMENTAL", "false").lower() == "true",
+        "dias_sobreposicao": int(os.environ.get("BCB_DIAS_SOBREPOSICAO", "7")),  # Janela para capturar revisões
+        # Períodos longos são divididos em janelas buscadas em paralelo (o SGS limita o intervalo por consulta)
+        "dias_por_janela": 10 * 365,
+        "max_janelas_simultaneas": 4,
+        # Tempo limite total da extração assíncrona (--async), em segundos
+        "timeout_total": float(os.environ.get("BCB_TIMEOUT_TOTAL", "600"))
+    },
+    # Cliente HTTP compartilhado pelos extratores
+    "http": {
+        "timeout": 60,  # segundos por requisição
+        "max_tentativas": 4,
+        "backoff_base": 1.0,  # segundos
+        "backoff_maximo": 30.0,  # segundos
+        "requisicoes_por_segundo": float(os.environ.get("HTTP_REQUISICOES_POR_SEGUNDO", "10")),  # por host
+        "tamanho_pool": 16  # conexões mantidas por host
     },
     # IBGE
     "ibge": {
@@ -68,9 +95,116 @@ CONFIGURACAO_EXTRACAO = {
                 "id": 6381,
                 "variavel": 4099,
                 "nivel_geografico": "n1",
-                "localidade": "1"
+                "localidade": "1",
+                "tipo_periodo": "trimestre_movel"  # Código AAAAMM: último mês do trimestre móvel
+            },
+            "pib": {
+                "id": 1846,
+                "variavel": 585,  # Valores a preços correntes (R$ milhões)
+                "classificacao": "11255[90707]",  # Setores e subsetores: PIB a preços de mercado
+                "nivel_geografico": "n1",
+                "localidade": "1",
+                "tipo_periodo": "trimestre"  # Código AAAATT
             }
-        }
+        },
+        "dias_retroativos": 5 * 365,  # 5 anos
+        "max_concorrencia": int(os.environ.get("IBGE_MAX_CONCORRENCIA", "4")),  # Agregados extraídos em paralelo
+        "incremental": os.environ.get("IBGE_INCREMENTAL", "true").lower() == "true",
+        "periodos_sobreposicao": 4  # Períodos rebuscados para capturar revisões
+    }
+}
+
+# Configuração de armazenamento das séries extraídas
+CONFIGURACAO_ARMAZENAMENTO = {
+    # Formato principal: "parquet" (colunar, compacto), "binario" (mapeado em memória) ou "json"
+    "formato": os.environ.get("FORMATO_ARMAZENAMENTO", "parquet"),
+    # Mantém também os arquivos JSON, versionados no repositório
+    "exportar_json": os.environ.get("EXPORTAR_JSON", "true").lower() == "true",
+    # Grava também o formato binário, lido pelo dashboard via mmap sem cópia
+    "cache_binario": os.environ.get("CACHE_BINARIO", "true").lower() == "true"
+}
+
+# Configuração da carga das séries extraídas no PostgreSQL (tabelas stg_* lidas pelo dashboard)
+CONFIGURACAO_CARGA = {
+    "esquema": "public",
+    "criar_tabelas": os.environ.get("CARGA_CRIAR_TABELAS", "true").lower() == "true",
+    # Série armazenada -> tabela de staging e coluna de valor
+    "tabelas": {
+        "selic": {"tabela": "stg_selic", "coluna_valor": "taxa_selic_percentual"},
+        "ipca": {"tabela": "stg_ipca", "coluna_valor": "indice_ipca"},
+        "cambio_ptax_venda": {"tabela": "stg_cambio_ptax_venda", "coluna_valor": "cambio_ptax_venda_brl_usd"},
+        "desemprego": {"tabela": "stg_desemprego", "coluna_valor": "taxa_desemprego_percentual"},
+        "pib": {"tabela": "stg_pib_trimestral", "coluna_valor": "pib_valor_corrente_brl_milhoes"},
+        "deficit_primario": {"tabela": "stg_deficit_primario", "coluna_valor": "valor_deficit_primario"},
+        "arrecadacao_iof": {"tabela": "stg_arrecadacao_iof", "coluna_valor": "valor_arrecadacao_iof"}
+    }
+}
+
+# Configuração das previsões pré-calculadas pelo pipeline (python -m src.dados.processadores.previsao)
+CONFIGURACAO_PREVISAO = {
+    "diretorio": os.path.join(DATA_DIR, "previsoes"),
+    # Maior horizonte oferecido no dashboard; horizontes menores são recortes da mesma previsão
+    "horizonte_maximo": 24,
+    # Combinações de parâmetros pré-calculadas para cada indicador (produto cartesiano das listas)
+    "grade": {
+        "sazonalidade_anual": [True],
+        "sazonalidade_semanal": [False],
+        "sazonalidade_diaria": [False],
+        "modo_sazonalidade": ["multiplicative", "additive"],
+        "escala_prior_pontos_mudanca": [0.01, 0.05, 0.1, 0.5]
+    },
+    # Validação com origem móvel (python -m src.dados.processadores.backtest); tamanhos em observações
+    "backtest": {
+        "janela_inicial": 36,  # Observações mínimas de treinamento no primeiro corte
+        "passo": 1,  # Observações entre cortes consecutivos
+        "horizonte": 12,  # Observações previstas e avaliadas a partir de cada corte
+        "max_cortes": 24  # Número máximo de cortes (os mais recentes)
+    },
+    # Processos usados para treinar os modelos em lote (0 = todos os núcleos disponíveis)
+    "processos": int(os.environ.get("PREVISAO_PROCESSOS", "0")),
+    # Séries com gráficos HTML de previsão gravados no diretório de dados
+    # (previsao_<serie>.html e componentes_<serie>.html), treinados com os parâmetros padrão
+    "graficos": {
+        "deficit_primario": "Previsão do Déficit Primário",
+        "arrecadacao_iof": "Previsão da Arrecadação de IOF"
+    },
+    # Parâmetros padrão dos previsores (valores iniciais do dashboard para indicadores sem ajuste)
+    "parametros_padrao": {
+        "sazonalidade_anual": True,
+        "sazonalidade_semanal": False,  # Dados mensais não têm sazonalidade semanal
+        "sazonalidade_diaria": False,
+        "modo_sazonalidade": "multiplicative",
+        "escala_prior_pontos_mudanca": 0.05
+    },
+    # Parâmetros vencedores por indicador, gravados por python -m src.dados.processadores.ajuste_hiperparametros
+    "arquivo_parametros": os.path.join(DATA_DIR, "parametros_previsao.json"),
+    # Busca de hiperparâmetros: cada candidato é avaliado pelo backtest e os claramente
+    # piores são descartados após cada rodada de cortes
+    "ajuste": {
+        "espaco": {
+            "sazonalidade_anual": [True, False],
+            "sazonalidade_semanal": [False, True],
+            "sazonalidade_diaria": [False],
+            "modo_sazonalidade": ["multiplicative", "additive"],
+            "escala_prior_pontos_mudanca": [0.01, 0.05, 0.1, 0.3, 0.5]
+        },
+        "estrategia": "grade",  # "grade" (todas as combinações) ou "aleatoria"
+        "amostras": 20,  # Candidatos da busca aleatória
+        "metrica": "rmse",  # "mae", "rmse" ou "mape"
+        "rodadas": 3,  # Rodadas de cortes entre as podas
+        "fator_poda": 1.5,  # Descarta candidatos com métrica acima de fator_poda vezes a melhor
+        "semente": 42
+    },
+    # Cache das previsões treinadas sob demanda (parâmetros fora da grade)
+    "cache": {
+        "itens_memoria": int(os.environ.get("PREVISAO_CACHE_ITENS", "32")),
+        "diretorio": os.environ.get("PREVISAO_CACHE_DIR", os.path.join(BASE_DIR, "cache", "previsoes")),
+        "tamanho_maximo_disco_mb": int(os.environ.get("PREVISAO_CACHE_DISCO_MB", "256"))  # 0 desabilita o cache em disco
+    },
+    # Registro dos modelos ajustados, reutilizados enquanto os dados de treinamento não mudam
+    "registro_modelos": {
+        "diretorio": os.environ.get("PREVISAO_REGISTRO_DIR", os.path.join(BASE_DIR, "cache", "modelos")),
+        "max_modelos": int(os.environ.get("PREVISAO_REGISTRO_MAX_MODELOS", "200"))
     }
 }
 
@@ -117,14 +251,21 @@ CONFIGURACAO_VISUALIZACAO = {
         "titulo_pagina": "Termômetro da Economia",
         "layout": "wide",
         "caminho_banner": os.path.join(ASSETS_DIR, "banner.png"),
-        "largura_banner": 600
+        "largura_banner": 600,
+        # Tempo máximo (segundos) que os dados carregados ficam em cache entre reexecuções do dashboard;
+        # o cache também é invalidado quando a versão dos dados (hashes do catálogo, tabelas) muda
+        "ttl_cache_dados": int(os.environ.get("DASHBOARD_TTL_CACHE", "600")),
+        "intervalo_versao_dados": 30  # segundos entre verificações da versão dos dados
     },
+    # As consultas recebem a janela de datas pelos parâmetros %(data_inicio)s e %(data_fim)s
     "indicadores": {
         "selic": {
             "nome": "Selic",
             "icone": "selic.png",
-            "consulta": "SELECT data_referencia, taxa_selic_percentual AS selic FROM public.stg_selic ORDER BY data_referencia ASC;",
+            "consulta": "SELECT data_referencia, taxa_selic_percentual AS selic FROM public.stg_selic WHERE data_referencia BETWEEN %(data_inicio)s AND %(data_fim)s ORDER BY data_referencia ASC;",
+            "tabela": "public.stg_selic",
             "coluna_valor": "selic",
+            "serie_armazenada": "selic",
             "rotulo": "Selic (% a.a.)",
             "formato": "{:.2f}%",
             "titulo_grafico": "Taxa Selic (% a.a.)",
@@ -134,8 +275,10 @@ CONFIGURACAO_VISUALIZACAO = {
         "ipca": {
             "nome": "IPCA",
             "icone": "inflacao.png",
-            "consulta": "SELECT data_referencia, indice_ipca AS ipca FROM public.stg_ipca ORDER BY data_referencia ASC;",
+            "consulta": "SELECT data_referencia, indice_ipca AS ipca FROM public.stg_ipca WHERE data_referencia BETWEEN %(data_inicio)s AND %(data_fim)s ORDER BY data_referencia ASC;",
+            "tabela": "public.stg_ipca",
             "coluna_valor": "ipca",
+            "serie_armazenada": "ipca",
             "rotulo": "IPCA (Índice)",
             "formato": "{:.2f}",
             "titulo_grafico": "IPCA (Índice)",
@@ -145,8 +288,10 @@ CONFIGURACAO_VISUALIZACAO = {
         "cambio": {
             "nome": "Câmbio",
             "icone": "cambio.png",
-            "consulta": "SELECT data_referencia, cambio_ptax_venda_brl_usd AS cambio FROM public.stg_cambio_ptax_venda ORDER BY data_referencia ASC;",
+            "consulta": "SELECT data_referencia, cambio_ptax_venda_brl_usd AS cambio FROM public.stg_cambio_ptax_venda WHERE data_referencia BETWEEN %(data_inicio)s AND %(data_fim)s ORDER BY data_referencia ASC;",
+            "tabela": "public.stg_cambio_ptax_venda",
             "coluna_valor": "cambio",
+            "serie_armazenada": "cambio_ptax_venda",
             "rotulo": "Câmbio (R$/US$)",
             "formato": "R$ {:.2f}",
             "titulo_grafico": "Câmbio (R$/US$ - PTAX Venda)",
@@ -157,8 +302,10 @@ CONFIGURACAO_VISUALIZACAO = {
         "desemprego": {
             "nome": "Desemprego",
             "icone": "desemprego.png",
-            "consulta": "SELECT data_referencia, taxa_desemprego_percentual AS desemprego FROM public.stg_desemprego ORDER BY data_referencia ASC;",
+            "consulta": "SELECT data_referencia, taxa_desemprego_percentual AS desemprego FROM public.stg_desemprego WHERE data_referencia BETWEEN %(data_inicio)s AND %(data_fim)s ORDER BY data_referencia ASC;",
+            "tabela": "public.stg_desemprego",
             "coluna_valor": "desemprego",
+            "serie_armazenada": "desemprego",
             "rotulo": "Desemprego (%)",
             "formato": "{:.1f}%",
             "titulo_grafico": "Taxa de Desocupação (% - PNAD Contínua)",
@@ -168,8 +315,10 @@ CONFIGURACAO_VISUALIZACAO = {
         "pib": {
             "nome": "PIB",
             "icone": "pib.png",
-            "consulta": "SELECT data_referencia, pib_valor_corrente_brl_milhoes AS pib FROM public.stg_pib_trimestral ORDER BY data_referencia ASC;",
+            "consulta": "SELECT data_referencia, pib_valor_corrente_brl_milhoes AS pib FROM public.stg_pib_trimestral WHERE data_referencia BETWEEN %(data_inicio)s AND %(data_fim)s ORDER BY data_referencia ASC;",
+            "tabela": "public.stg_pib_trimestral",
             "coluna_valor": "pib",
+            "serie_armazenada": "pib",
             "rotulo": "PIB (R$ Bilhões)",
             "formato": "R$ {:.2f} Bi",
             "transformacao_valor": lambda x: x / 1e3,  # Converter de milhões para bilhões
@@ -181,6 +330,7 @@ CONFIGURACAO_VISUALIZACAO = {
             "nome": "Déficit Primário",
             "icone": "deficit.png",
             "coluna_valor": "deficit",
+            "serie_armazenada": "deficit_primario",
             "rotulo": "Déficit Primário (R$ bi)",
             "formato": "{:.2f} bi",
             "titulo_grafico": "Déficit Primário (R$ bilhões)",
@@ -191,6 +341,7 @@ CONFIGURACAO_VISUALIZACAO = {
             "nome": "Arrecadação IOF",
             "icone": "iof.png",
             "coluna_valor": "iof",
+            "serie_armazenada": "arrecadacao_iof",
             "rotulo": "Arrecadação IOF (R$ bi)",
             "formato": "{:.2f} bi",
             "titulo_grafico": "Arrecadação de IOF (R$ bilhões)",
@@ -229,12 +380,41 @@ def configurar_logging():
     logging.config.dictConfig(CONFIGURACAO_LOGGING)
     logging.info("Sistema de logging inicializado.")
 
+# Função para obter os parâmetros de previsão de um indicador
+def obter_parametros_previsao(id_indicador: str) -> Dict[str, Any]:
+    """
+    Retorna os parâmetros de previsão de um indicador.
+
+    Os parâmetros ajustados pela busca de hiperparâmetros (arquivo_parametros)
+    prevalecem sobre os parâmetros padrão.
+
+    Args:
+        id_indicador: Identificador do indicador.
+
+    Returns:
+        Parâmetros do previsor (ver PrevisorSeriesTemporal.parametros).
+    """
+    parametros = dict(CONFIGURACAO_PREVISAO["parametros_padrao"])
+    try:
+        with open(CONFIGURACAO_PREVISAO["arquivo_parametros"], 'r', encoding='utf-8') as f:
+            ajustados = json.load(f).get("indicadores", {}).get(id_indicador, {}).get("parametros", {})
+    except FileNotFoundError:
+        ajustados = {}
+    except (OSError, ValueError) as e:
+        logging.warning(f"Erro ao ler os parâmetros de previsão ajustados: {e}")
+        ajustados = {}
+    parametros.update({nome: valor for nome, valor in ajustados.items() if nome in parametros})
+    return parametros
+
 # Função para obter configuração completa
 def obter_configuracao() -> Dict[str, Any]:
     """Retorna a configuração completa do projeto."""
     return {
         "bd": CONFIGURACAO_BD,
         "extracao": CONFIGURACAO_EXTRACAO,
+        "armazenamento": CONFIGURACAO_ARMAZENAMENTO,
+        "carga": CONFIGURACAO_CARGA,
+        "previsao": CONFIGURACAO_PREVISAO,
         "logging": CONFIGURACAO_LOGGING,
         "visualizacao": CONFIGURACAO_VISUALIZACAO,
         "caminhos": {
@@ -0,0 +1,205 @@
+"""
+Módulo do conjunto de indicadores compartilhado pelos componentes do dashboard.
+
+Este módulo implementa a classe ConjuntoIndicadores, que mantém cada série
+ordenada por data, com o índice de datas pré-calculado, e fornece recortes
+por período ou por anos com busca binária (searchsorted). Os recortes são
+fatias posicionais (iloc) dos DataFrames armazenados, sem cópia dos dados.
+"""
+
+import logging
+import datetime
+import pandas as pd
+from typing import Dict, List, Optional, Any, Iterable, Iterator, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Colunas de valor procuradas quando o indicador não configura 'coluna_valor'
+COLUNAS_VALOR_PADRAO = ['valor', 'deficit', 'iof']
+
+
+def agrupar_anos_consecutivos(anos: Iterable[int]) -> List[Tuple[int, int]]:
+    """
+    Agrupa anos em intervalos de anos consecutivos.
+
+    Args:
+        anos: Anos selecionados (em qualquer ordem, com ou sem repetições)
+
+    Returns:
+        Lista de tuplas (primeiro ano, último ano), em ordem crescente
+    """
+    intervalos = []
+    for ano in sorted(set(anos)):
+        if intervalos and ano == intervalos[-1][1] + 1:
+            intervalos[-1] = (intervalos[-1][0], ano)
+        else:
+            intervalos.append((ano, ano))
+    return intervalos
+
+
+class ConjuntoIndicadores:
+    """
+    Conjunto de séries de indicadores ordenadas por data, com recorte por período.
+
+    Os DataFrames armazenados são tratados como somente leitura: os recortes
+    compartilham os dados com eles, e o conjunto pode ser mantido em cache e
+    reutilizado entre reexecuções do dashboard.
+
+    Attributes:
+        config_indicadores (Dict[str, Dict[str, Any]]): Configuração dos indicadores
+    """
+
+    def __init__(self, dados_indicadores: Dict[str, pd.DataFrame],
+                 config_indicadores: Dict[str, Dict[str, Any]] = None):
+        """
+        Inicializa o conjunto, ordenando as séries e pré-calculando os índices de datas.
+
+        Séries vazias ou sem coluna de valor identificável são descartadas.
+
+        Args:
+            dados_indicadores: Dicionário com DataFrames dos indicadores (coluna 'data')
+            config_indicadores: Configuração dos indicadores
+        """
+        self.config_indicadores = config_indicadores or {}
+        self._series: Dict[str, pd.DataFrame] = {}
+        self._indices: Dict[str, pd.DatetimeIndex] = {}
+        self._colunas_valor: Dict[str, str] = {}
+
+        for id_indicador, df in dados_indicadores.items():
+            if df is None or df.empty:
+                continue
+
+            coluna_valor = self._identificar_coluna_valor(df, self.config_indicadores.get(id_indicador, {}))
+            if coluna_valor is None:
+                logger.warning(f"Não foi possível encontrar uma coluna de valor para {id_indicador}")
+                continue
+
+            # Só ordena (e copia) se a série ainda não estiver em ordem de data
+            if not df['data'].is_monotonic_increasing:
+                df = df.sort_values('data', kind='stable').reset_index(drop=True)
+
+            self._series[id_indicador] = df
+            self._indices[id_indicador] = pd.DatetimeIndex(df['data'])
+            self._colunas_valor[id_indicador] = coluna_valor
+
+    @classmethod
+    def de(cls, dados_indicadores: Any, config_indicadores: Dict[str, Dict[str, Any]] = None) -> "ConjuntoIndicadores":
+        """
+        Retorna o próprio conjunto ou cria um a partir de um dicionário de DataFrames.
+
+        Args:
+            dados_indicadores: ConjuntoIndicadores ou dicionário com DataFrames dos indicadores
+            config_indicadores: Configuração dos indicadores (usada apenas ao criar o conjunto)
+
+        Returns:
+            Conjunto de indicadores
+        """
+        if isinstance(dados_indicadores, cls):
+            return dados_indicadores
+        return cls(dados_indicadores, config_indicadores)
+
+    @staticmethod
+    def _identificar_coluna_valor(df: pd.DataFrame, config: Dict[str, Any]) -> Optional[str]:
+        """
+        Identifica a coluna de valor de uma série.
+
+        Args:
+            df: DataFrame da série
+            config: Configuração do indicador
+
+        Returns:
+            Nome da coluna de valor ou None se não encontrada
+        """
+        coluna_valor = config.get('coluna_valor')
+        if coluna_valor and coluna_valor in df.columns:
+            return coluna_valor
+
+        for nome_coluna in COLUNAS_VALOR_PADRAO:
+            if nome_coluna in df.columns:
+                return nome_coluna
+
+        # Primeira coluna numérica que não seja 'data'
+        colunas_numericas = [col for col in df.columns if col != 'data' and pd.api.types.is_numeric_dtype(df[col])]
+        return colunas_numericas[0] if colunas_numericas else None
+
+    def __contains__(self, id_indicador: str) -> bool:
+        return id_indicador in self._series
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._series)
+
+    def __len__(self) -> int:
+        return len(self._series)
+
+    def __getitem__(self, id_indicador: str) -> pd.DataFrame:
+        return self._series[id_indicador]
+
+    def coluna_valor(self, id_indicador: str) -> str:
+        """Retorna a coluna de valor do indicador."""
+        return self._colunas_valor[id_indicador]
+
+    def nome(self, id_indicador: str) -> str:
+        """Retorna o nome de exibição do indicador."""
+        return self.config_indicadores.get(id_indicador, {}).get('nome', id_indicador)
+
+    def periodo(self, id_indicador: str) -> Tuple[pd.Timestamp, pd.Timestamp]:
+        """Retorna a primeira e a última data do indicador."""
+        indice = self._indices[id_indicador]
+        return indice[0], indice[-1]
+
+    def _posicoes(self, id_indicador: str, inicio: Optional[pd.Timestamp],
+                  fim_exclusivo: Optional[pd.Timestamp]) -> Tuple[int, int]:
+        """Localiza por busca binária as posições do intervalo [inicio, fim_exclusivo)."""
+        indice = self._indices[id_indicador]
+        posicao_inicio = indice.searchsorted(inicio, side='left') if inicio is not None else 0
+        posicao_fim = indice.searchsorted(fim_exclusivo, side='left') if fim_exclusivo is not None else len(indice)
+        return posicao_inicio, max(posicao_inicio, posicao_fim)
+
+    def recortar(self, id_indicador: str, data_inicio: Optional[datetime.date] = None,
+                 data_fim: Optional[datetime.date] = None) -> pd.DataFrame:
+        """
+        Recorta o indicador pelo período indicado (extremos inclusivos), sem copiar os dados.
+
+        Args:
+            id_indicador: Identificador do indicador
+            data_inicio: Data inicial (None para não limitar)
+            data_fim: Data final (None para não limitar)
+
+        Returns:
+            Fatia do DataFrame do indicador
+        """
+        inicio = pd.Timestamp(data_inicio) if data_inicio is not None else None
+        fim_exclusivo = pd.Timestamp(data_fim) + pd.Timedelta(days=1) if data_fim is not None else None
+        posicao_inicio, posicao_fim = self._posicoes(id_indicador, inicio, fim_exclusivo)
+        return self._series[id_indicador].iloc[posicao_inicio:posicao_fim]
+
+    def recortar_anos(self, id_indicador: str, anos: Optional[Iterable[int]] = None) -> pd.DataFrame:
+        """
+        Recorta o indicador pelos anos selecionados.
+
+        Anos consecutivos formam um único recorte, sem cópia; apenas seleções
+        com lacunas (ex.: 2019 e 2022) concatenam mais de um recorte.
+
+        Args:
+            id_indicador: Identificador do indicador
+            anos: Anos selecionados (None ou vazio para a série inteira)
+
+        Returns:
+            DataFrame do indicador nos anos selecionados
+        """
+        if not anos:
+            return self._series[id_indicador]
+
+        recortes = []
+        for primeiro_ano, ultimo_ano in agrupar_anos_consecutivos(anos):
+            posicao_inicio, posicao_fim = self._posicoes(
+                id_indicador, pd.Timestamp(primeiro_ano, 1, 1), pd.Timestamp(ultimo_ano + 1, 1, 1)
+            )
+            if posicao_fim > posicao_inicio:
+                recortes.append(self._series[id_indicador].iloc[posicao_inicio:posicao_fim])
+
+        if not recortes:
+            return self._series[id_indicador].iloc[0:0]
+        if len(recortes) == 1:
+            return recortes[0]
+        return pd.concat(recortes)
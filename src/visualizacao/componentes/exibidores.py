@@ -15,6 +15,8 @@ import plotly.graph_objects as go
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Union, Any, Tuple
 
+from src.visualizacao.componentes.conjunto_indicadores import ConjuntoIndicadores
+
 logger = logging.getLogger(__name__)
 
 class ExibidorMetricas:
@@ -178,19 +180,18 @@ class ExibidorGraficos:
         """Inicializa o componente de exibição de gráficos."""
         logger.info("ExibidorGraficos inicializado")
     
-    def exibir_graficos(self, dados_indicadores: Dict[str, pd.DataFrame], 
+    def exibir_graficos(self, dados_indicadores: Union[ConjuntoIndicadores, Dict[str, pd.DataFrame]], 
                       config_indicadores: Dict[str, Dict[str, Any]],
                       anos_selecionados: List[int] = None) -> None:
         """
         Exibe gráficos para os indicadores selecionados.
         
         Args:
-            dados_indicadores: Dicionário com DataFrames dos indicadores
+            dados_indicadores: Conjunto de indicadores (ou dicionário com DataFrames dos indicadores)
             config_indicadores: Configuração dos indicadores
             anos_selecionados: Lista de anos selecionados para filtro
         """
-        # Filtrar apenas indicadores com dados disponíveis
-        indicadores_disponiveis = {k: v for k, v in dados_indicadores.items() if not v.empty}
+        indicadores_disponiveis = ConjuntoIndicadores.de(dados_indicadores, config_indicadores)
         
         if not indicadores_disponiveis:
             st.warning("Nenhum dado disponível para exibição de gráficos.")
@@ -208,38 +209,17 @@ class ExibidorGraficos:
         )
         
         if indicador_selecionado and indicador_selecionado in indicadores_disponiveis:
-            df = indicadores_disponiveis[indicador_selecionado].copy()
             config = config_indicadores[indicador_selecionado]
             
-            # Adicionar coluna de ano para filtro
-            df['ano'] = df['data'].dt.year
-            
-            # Filtrar por anos selecionados
-            if anos_selecionados:
-                df = df[df['ano'].isin(anos_selecionados)]
+            # Recorte por anos selecionados (busca binária, sem cópia)
+            df = indicadores_disponiveis.recortar_anos(indicador_selecionado, anos_selecionados)
             
             if not df.empty:
                 # Obter configurações do gráfico
                 titulo_grafico = config.get('titulo_grafico', f"Evolução de {config.get('nome', indicador_selecionado)}")
                 
                 # Obter a coluna de valor
-                coluna_valor = config.get('coluna_valor')
-                if coluna_valor and coluna_valor in df.columns:
-                    pass  # Usar a coluna configurada
-                elif 'valor' in df.columns:
-                    coluna_valor = 'valor'
-                elif 'deficit' in df.columns:
-                    coluna_valor = 'deficit'
-                elif 'iof' in df.columns:
-                    coluna_valor = 'iof'
-                else:
-                    # Encontrar a primeira coluna numérica que não seja 'data', 'ano'
-                    colunas_numericas = [col for col in df.columns if col not in ['data', 'ano'] and pd.api.types.is_numeric_dtype(df[col])]
-                    if colunas_numericas:
-                        coluna_valor = colunas_numericas[0]
-                    else:
-                        st.error(f"Não foi possível encontrar uma coluna de valor para {config.get('nome', indicador_selecionado)}")
-                        return
+                coluna_valor = indicadores_disponiveis.coluna_valor(indicador_selecionado)
                 
                 # Obter labels para o gráfico
                 labels_grafico = config.get('labels_grafico', {'data': 'Data', coluna_valor: 'Valor'})
@@ -262,19 +242,18 @@ class ExibidorGraficos:
             else:
                 st.warning(f"Não há dados disponíveis para {config.get('nome', indicador_selecionado)} nos anos selecionados.")
     
-    def exibir_correlacao(self, dados_indicadores: Dict[str, pd.DataFrame], 
+    def exibir_correlacao(self, dados_indicadores: Union[ConjuntoIndicadores, Dict[str, pd.DataFrame]], 
                          config_indicadores: Dict[str, Dict[str, Any]],
                          anos_selecionados: List[int] = None) -> None:
         """
         Exibe análise de correlação entre dois indicadores.
         
         Args:
-            dados_indicadores: Dicionário com DataFrames dos indicadores
+            dados_indicadores: Conjunto de indicadores (ou dicionário com DataFrames dos indicadores)
             config_indicadores: Configuração dos indicadores
             anos_selecionados: Lista de anos selecionados para filtro
         """
-        # Filtrar apenas indicadores com dados disponíveis
-        indicadores_disponiveis = {k: v for k, v in dados_indicadores.items() if not v.empty}
+        indicadores_disponiveis = ConjuntoIndicadores.de(dados_indicadores, config_indicadores)
         
         if len(indicadores_disponiveis) < 2:
             st.warning("São necessários pelo menos dois indicadores com dados para análise de correlação.")
@@ -306,20 +285,12 @@ class ExibidorGraficos:
             )
         
         if indicador_selecionado1 and indicador_selecionado2:
-            df1 = indicadores_disponiveis[indicador_selecionado1].copy()
-            df2 = indicadores_disponiveis[indicador_selecionado2].copy()
-            
             config1 = config_indicadores[indicador_selecionado1]
             config2 = config_indicadores[indicador_selecionado2]
             
-            # Adicionar coluna de ano para filtro
-            df1['ano'] = df1['data'].dt.year
-            df2['ano'] = df2['data'].dt.year
-            
-            # Filtrar por anos selecionados
-            if anos_selecionados:
-                df1 = df1[df1['ano'].isin(anos_selecionados)]
-                df2 = df2[df2['ano'].isin(anos_selecionados)]
+            # Recortes por anos selecionados (busca binária, sem cópia)
+            df1 = indicadores_disponiveis.recortar_anos(indicador_selecionado1, anos_selecionados)
+            df2 = indicadores_disponiveis.recortar_anos(indicador_selecionado2, anos_selecionados)
             
             if not df1.empty and not df2.empty:
                 # Mesclar os DataFrames pela data
@@ -427,19 +398,18 @@ class ExibidorGraficos:
         
         return None
     
-    def exibir_comparativo(self, dados_indicadores: Dict[str, pd.DataFrame],
+    def exibir_comparativo(self, dados_indicadores: Union[ConjuntoIndicadores, Dict[str, pd.DataFrame]],
                           config_indicadores: Dict[str, Dict[str, Any]],
                           anos_selecionados: List[int] = None) -> None:
         """
         Exibe comparativo entre múltiplos indicadores.
         
         Args:
-            dados_indicadores: Dicionário com DataFrames dos indicadores
+            dados_indicadores: Conjunto de indicadores (ou dicionário com DataFrames dos indicadores)
             config_indicadores: Configuração dos indicadores
             anos_selecionados: Lista de anos selecionados para filtro
         """
-        # Filtrar apenas indicadores com dados disponíveis
-        indicadores_disponiveis = {k: v for k, v in dados_indicadores.items() if not v.empty}
+        indicadores_disponiveis = ConjuntoIndicadores.de(dados_indicadores, config_indicadores)
         
         if len(indicadores_disponiveis) < 1:
             st.warning("Não há indicadores disponíveis para comparação.")
@@ -464,39 +434,17 @@ class ExibidorGraficos:
         dados_comparativo = {}
         for id_indicador in indicadores_selecionados:
             if id_indicador in indicadores_disponiveis:
-                df = indicadores_disponiveis[id_indicador].copy()
                 config = config_indicadores[id_indicador]
                 
-                # Adicionar coluna de ano para filtro
-                df['ano'] = df['data'].dt.year
-                
-                # Filtrar por anos selecionados
-                if anos_selecionados:
-                    df = df[df['ano'].isin(anos_selecionados)]
+                # Recorte por anos selecionados (busca binária, sem cópia)
+                df = indicadores_disponiveis.recortar_anos(id_indicador, anos_selecionados)
                 
                 if not df.empty:
                     # Obter a coluna de valor
-                    coluna_valor = config.get('coluna_valor')
-                    if coluna_valor and coluna_valor in df.columns:
-                        pass  # Usar a coluna configurada
-                    elif 'valor' in df.columns:
-                        coluna_valor = 'valor'
-                    elif 'deficit' in df.columns:
-                        coluna_valor = 'deficit'
-                    elif 'iof' in df.columns:
-                        coluna_valor = 'iof'
-                    else:
-                        # Encontrar a primeira coluna numérica que não seja 'data', 'ano'
-                        colunas_numericas = [col for col in df.columns if col not in ['data', 'ano'] and pd.api.types.is_numeric_dtype(df[col])]
-                        if colunas_numericas:
-                            coluna_valor = colunas_numericas[0]
-                        else:
-                            st.error(f"Não foi possível encontrar uma coluna de valor para {config.get('nome', id_indicador)}")
-                            continue
+                    coluna_valor = indicadores_disponiveis.coluna_valor(id_indicador)
                     
-                    # Normalizar os dados para comparação
-                    df_norm = df[['data', coluna_valor]].copy()
-                    df_norm.rename(columns={coluna_valor: config.get('nome', id_indicador)}, inplace=True)
+                    # Seleciona as colunas com o nome de exibição (novo DataFrame; a série do conjunto não é alterada)
+                    df_norm = df[['data', coluna_valor]].rename(columns={coluna_valor: config.get('nome', id_indicador)})
                     
                     dados_comparativo[id_indicador] = df_norm
         
@@ -8,10 +8,13 @@ de indicadores econômicos e previsões.
 import os
 import sys
 import json
+import time
+import hashlib
 import logging
 import datetime
 import pandas as pd
 import streamlit as st
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from typing import Dict, List, Optional, Union, Any, Tuple
 
 # Adicionar diretório raiz ao path para importações relativas
@@ -21,81 +24,426 @@ if diretorio_raiz not in sys.path:
     sys.path.insert(0, diretorio_raiz)
 
 # Importar módulos do projeto
-from src.utils.configuracao import obter_configuracao, configurar_logging
+from src.utils.configuracao import obter_configuracao, obter_parametros_previsao, configurar_logging
 from src.visualizacao.componentes.exibidores import ExibidorMetricas, ExibidorGraficos
-from src.dados.processadores.previsao import PrevisorSeriesTemporal, processar_dados_deficit, processar_dados_iof
+from src.visualizacao.componentes.conjunto_indicadores import ConjuntoIndicadores
+from src.dados.processadores.previsao import PrevisorSeriesTemporal, criar_figura_previsao
+from src.dados.processadores.repositorio_previsoes import RepositorioPrevisoes, calcular_hash_dados
+from src.dados.processadores.cache_previsoes import CachePrevisoes
+from src.dados.processadores.registro_modelos import RegistroModelos
+from src.dados.armazenamento import carregar_serie, carregar_catalogo, assinatura_arquivos_serie
+from src.utils.banco_dados import PoolConexoes
 
 # Configurar logging
 configurar_logging()
 logger = logging.getLogger(__name__)
 
-def carregar_dados_json(nome_arquivo: str, possiveis_diretorios: List[str]) -> List[Dict[str, Any]]:
+# Tempo de vida do cache de dados e intervalo entre verificações da versão dos dados (segundos)
+TTL_CACHE_DADOS = obter_configuracao()["visualizacao"]["dashboard"]["ttl_cache_dados"]
+INTERVALO_VERSAO_DADOS = obter_configuracao()["visualizacao"]["dashboard"]["intervalo_versao_dados"]
+
+def carregar_dados_serie(nome_serie: str, possiveis_diretorios: List[str]) -> pd.DataFrame:
     """
-    Carrega dados de um arquivo JSON, tentando vários diretórios possíveis.
+    Carrega uma série armazenada (binário, Parquet ou JSON), tentando vários diretórios possíveis.
     
     Args:
-        nome_arquivo: Nome do arquivo JSON a ser carregado
-        possiveis_diretorios: Lista de diretórios onde procurar o arquivo
+        nome_serie: Nome da série armazenada (ex.: "deficit_primario")
+        possiveis_diretorios: Lista de diretórios onde procurar a série
         
     Returns:
-        Lista de dicionários com os dados carregados ou lista vazia em caso de erro
+        DataFrame com as colunas 'data' e 'valor' ou DataFrame vazio em caso de erro
     """
-    for diretorio in possiveis_diretorios:
-        caminho_arquivo = os.path.join(diretorio, nome_arquivo)
-        try:
-            if os.path.exists(caminho_arquivo):
-                with open(caminho_arquivo, 'r', encoding='utf-8') as f:
-                    dados = json.load(f)
-                logger.info(f"Arquivo {caminho_arquivo} carregado com sucesso.")
-                return dados
-        except Exception as e:
-            logger.warning(f"Erro ao carregar arquivo {caminho_arquivo}: {e}")
-    
-    logger.warning(f"Arquivo {nome_arquivo} não encontrado em nenhum diretório.")
-    return []
+    return carregar_serie(nome_serie, possiveis_diretorios)
+
+@st.cache_resource(show_spinner=False)
+def _criar_pool_bd() -> PoolConexoes:
+    """
+    Cria o pool de conexões compartilhado por todas as sessões do dashboard.
+    
+    O pool é mantido entre reexecuções do script; exceções não são
+    armazenadas em cache, então uma falha de conexão é tentada de novo
+    no carregamento seguinte.
+    """
+    pool = PoolConexoes.da_configuracao()
+    logger.info("Pool de conexões com o banco de dados criado com sucesso.")
+    return pool
 
-def conectar_bd():
+def obter_pool_bd() -> Optional[PoolConexoes]:
     """
-    Tenta estabelecer conexão com o banco de dados.
+    Obtém o pool de conexões com o banco de dados.
     
     Returns:
-        Conexão com o banco de dados ou None em caso de erro
+        Pool de conexões ou None em caso de erro
     """
     try:
-        import psycopg2
-        config = obter_configuracao()
-        conn = psycopg2.connect(
-            host=config["bd"]["host"],
-            port=config["bd"]["port"],
-            database=config["bd"]["database"],
-            user=config["bd"]["user"],
-            password=config["bd"]["password"]
-        )
-        logger.info("Conexão com o banco de dados estabelecida com sucesso.")
-        return conn
+        return _criar_pool_bd()
     except Exception as e:
         st.error(f"Erro ao conectar ao banco de dados: {e}")
         logger.error(f"Erro ao conectar ao banco de dados: {e}")
         return None
 
-def carregar_dados_indicador(conn, consulta: str) -> pd.DataFrame:
+def carregar_dados_indicador(pool: PoolConexoes, consulta: str, conn=None,
+                             timeout_consulta: Optional[float] = None,
+                             parametros: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
     """
     Carrega dados de um indicador do banco de dados.
     
     Args:
-        conn: Conexão com o banco de dados
+        pool: Pool de conexões com o banco de dados
         consulta: Consulta SQL para obter os dados
+        conn: Conexão da sessão corrente (modo "session"); se None, uma
+            conexão é emprestada do pool apenas para esta consulta
+        timeout_consulta: Tempo limite da consulta no servidor, em segundos
+        parametros: Parâmetros da consulta (por exemplo, data_inicio e data_fim)
         
     Returns:
         DataFrame com os dados do indicador ou DataFrame vazio em caso de erro
     """
+    def executar_consulta(conexao) -> pd.DataFrame:
+        if timeout_consulta:
+            # SET LOCAL vale só até o fim da transação corrente
+            with conexao.cursor() as cursor:
+                cursor.execute("SET LOCAL statement_timeout = %s", (int(timeout_consulta * 1000),))
+        return pd.read_sql_query(consulta, conexao, params=parametros)
+    
     try:
-        df = pd.read_sql_query(consulta, conn)
-        return df
+        if conn is not None:
+            return executar_consulta(conn)
+        with pool.conexao() as conn_consulta:
+            return executar_consulta(conn_consulta)
     except Exception as e:
         logger.error(f"Erro ao executar consulta: {e}")
+        if conn is not None:
+            # Uma consulta com erro invalida a transação da sessão para as seguintes
+            try:
+                conn.rollback()
+            except Exception:
+                pass
         return pd.DataFrame()
 
+def carregar_indicadores_bd(pool: PoolConexoes, indicadores: Dict[str, Dict[str, Any]],
+                            janelas: Dict[str, Tuple[Optional[datetime.date], Optional[datetime.date]]]) -> Dict[str, pd.DataFrame]:
+    """
+    Executa as consultas dos indicadores no banco de dados, cada uma restrita a uma janela de datas.
+    
+    No modo "transaction", as consultas rodam em paralelo, cada uma com uma
+    conexão do pool; no modo "session", rodam em sequência na conexão da
+    sessão. Em ambos os casos, cada consulta tem um tempo limite no servidor
+    (statement_timeout), e consultas que não terminam no prazo são ignoradas
+    para não bloquear a página.
+    
+    Args:
+        pool: Pool de conexões com o banco de dados
+        indicadores: Configuração dos indicadores
+        janelas: Janela (data inicial, data final) de cada indicador a consultar;
+            None em um dos extremos deixa a janela aberta
+        
+    Returns:
+        Dicionário com os dados de cada indicador obtido do banco de dados
+    """
+    timeout_consulta = obter_configuracao()["bd"]["timeout_consulta"]
+    consultas = {}
+    for id_indicador, (data_inicio, data_fim) in janelas.items():
+        config_indicador = indicadores.get(id_indicador, {})
+        if "consulta" in config_indicador:
+            consultas[id_indicador] = (config_indicador["consulta"], {
+                "data_inicio": data_inicio or datetime.date.min,
+                "data_fim": data_fim or datetime.date.max
+            })
+    resultados = {}
+    
+    if not consultas:
+        return resultados
+    
+    if pool.modo == "session":
+        # Modo "session": uma conexão para todo o carregamento
+        with pool.sessao() as conn:
+            for id_indicador, (consulta, parametros) in consultas.items():
+                resultados[id_indicador] = carregar_dados_indicador(pool, consulta, conn, timeout_consulta, parametros)
+    else:
+        # Modo "transaction": uma conexão do pool por consulta, todas em paralelo
+        num_workers = min(len(consultas), pool.maximo)
+        rodadas = -(-len(consultas) // num_workers)
+        prazo = time.monotonic() + timeout_consulta * rodadas + pool.tempo_espera
+        executor = ThreadPoolExecutor(max_workers=num_workers, thread_name_prefix="consulta_indicador")
+        try:
+            futuros = {
+                id_indicador: executor.submit(carregar_dados_indicador, pool, consulta, None, timeout_consulta, parametros)
+                for id_indicador, (consulta, parametros) in consultas.items()
+            }
+            for id_indicador, futuro in futuros.items():
+                try:
+                    resultados[id_indicador] = futuro.result(timeout=max(0.0, prazo - time.monotonic()))
+                except FuturesTimeoutError:
+                    logger.error(f"Consulta do indicador {id_indicador} excedeu o tempo limite; ignorada.")
+        finally:
+            # Não espera consultas atrasadas: o statement_timeout as encerra no servidor
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    dados = {}
+    for id_indicador, df in resultados.items():
+        if not df.empty:
+            # Renomear colunas para padrão
+            if "data_referencia" in df.columns:
+                df.rename(columns={"data_referencia": "data"}, inplace=True)
+            if "data" in df.columns:
+                df["data"] = pd.to_datetime(df["data"])
+            dados[id_indicador] = df
+    return dados
+
+def consultar_versao_tabelas(pool: PoolConexoes, tabelas: List[str]) -> Dict[str, Optional[Tuple[str, str, int]]]:
+    """
+    Resume o conteúdo das tabelas dos indicadores (data mínima, máxima e contagem).
+    
+    Todas as tabelas são consultadas em uma única ida ao banco; se alguma não
+    existir, as tabelas são consultadas individualmente.
+    
+    Args:
+        pool: Pool de conexões com o banco de dados
+        tabelas: Tabelas a resumir
+        
+    Returns:
+        Dicionário com (data mínima, data máxima, contagem) de cada tabela,
+        ou None para as tabelas que não puderam ser consultadas
+    """
+    def consulta_tabela(tabela: str) -> str:
+        return (f"SELECT '{tabela}', min(data_referencia)::text, max(data_referencia)::text, count(*) "
+                f"FROM {tabela}")
+    
+    try:
+        with pool.conexao() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(" UNION ALL ".join(consulta_tabela(tabela) for tabela in tabelas))
+                return {linha[0]: tuple(linha[1:]) for linha in cursor.fetchall()}
+    except Exception as e:
+        logger.warning(f"Erro ao consultar a versão das tabelas em conjunto: {e}")
+    
+    versoes = {}
+    for tabela in tabelas:
+        try:
+            with pool.conexao() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(consulta_tabela(tabela))
+                    versoes[tabela] = tuple(cursor.fetchone()[1:])
+        except Exception:
+            versoes[tabela] = None
+    return versoes
+
+@st.cache_data(ttl=INTERVALO_VERSAO_DADOS, show_spinner=False)
+def obter_versao_dados(_pool: Optional[PoolConexoes], banco_disponivel: bool, diretorios_series: List[str],
+                       catalogo: Dict[str, Dict[str, Any]]) -> Tuple[str, Dict[str, Tuple[datetime.date, datetime.date]]]:
+    """
+    Calcula a versão dos dados dos indicadores e o período disponível no banco.
+    
+    A versão combina o resumo das tabelas do banco, os hashes de conteúdo do
+    catálogo e o estado dos arquivos das séries. É recalculada no máximo a
+    cada INTERVALO_VERSAO_DADOS segundos (ou quando o catálogo ou a
+    disponibilidade do banco mudam).
+    
+    Args:
+        _pool: Pool de conexões com o banco de dados (None se indisponível)
+        banco_disponivel: Se o pool existe; como _pool não entra na chave do
+            cache, é este argumento que separa as versões com e sem banco
+        diretorios_series: Diretórios onde procurar as séries armazenadas
+        catalogo: Entradas do catálogo de séries
+        
+    Returns:
+        Tupla (hash que identifica a versão dos dados, período (data mínima,
+        data máxima) de cada indicador com dados no banco)
+    """
+    indicadores = obter_configuracao()["visualizacao"]["indicadores"]
+    
+    partes = []
+    limites_bd = {}
+    tabelas = sorted({c["tabela"] for c in indicadores.values() if "consulta" in c and c.get("tabela")})
+    if banco_disponivel and tabelas:
+        versoes_tabelas = consultar_versao_tabelas(_pool, tabelas)
+        partes.append(sorted(versoes_tabelas.items()))
+        for id_indicador, config_indicador in indicadores.items():
+            versao_tabela = versoes_tabelas.get(config_indicador.get("tabela")) if "consulta" in config_indicador else None
+            if versao_tabela and versao_tabela[2]:
+                limites_bd[id_indicador] = (datetime.date.fromisoformat(versao_tabela[0]),
+                                            datetime.date.fromisoformat(versao_tabela[1]))
+    else:
+        partes.append("sem_banco_de_dados")
+    
+    for config_indicador in indicadores.values():
+        nome_serie = config_indicador.get("serie_armazenada")
+        if nome_serie:
+            partes.append((
+                nome_serie,
+                catalogo.get(nome_serie, {}).get("hash"),
+                assinatura_arquivos_serie(nome_serie, diretorios_series)
+            ))
+    
+    return hashlib.sha256(repr(partes).encode("utf-8")).hexdigest(), limites_bd
+
+@st.cache_data(ttl=TTL_CACHE_DADOS, show_spinner=False)
+def carregar_dados_bd(versao_dados: str, _pool: PoolConexoes,
+                      janelas: Tuple[Tuple[str, Optional[datetime.date], Optional[datetime.date]], ...]) -> Dict[str, pd.DataFrame]:
+    """
+    Carrega do banco de dados os indicadores nas janelas de datas indicadas.
+    
+    O resultado fica em cache entre reexecuções e sessões para cada conjunto
+    de janelas; uma nova versão dos dados (ou o fim do TTL) força um novo
+    carregamento.
+    
+    Args:
+        versao_dados: Versão dos dados (ver obter_versao_dados); usada como chave do cache
+        _pool: Pool de conexões com o banco de dados
+        janelas: Tuplas (indicador, data inicial, data final)
+        
+    Returns:
+        Dicionário com os dados de cada indicador
+    """
+    config = obter_configuracao()
+    try:
+        return carregar_indicadores_bd(
+            _pool, config["visualizacao"]["indicadores"],
+            {id_indicador: (data_inicio, data_fim) for id_indicador, data_inicio, data_fim in janelas}
+        )
+    except Exception as e:
+        logger.error(f"Erro ao carregar dados do banco de dados: {e}")
+        return {}
+
+@st.cache_resource(ttl=TTL_CACHE_DADOS, max_entries=4, show_spinner=False)
+def carregar_series_arquivo(versao_dados: str, diretorios_series: List[str], series_catalogadas: Tuple[str, ...],
+                            indicadores_bd: Tuple[str, ...]) -> Tuple[Dict[str, pd.DataFrame], Dict[str, str]]:
+    """
+    Carrega dos arquivos de dados os indicadores que não estão no banco de dados.
+    
+    As séries armazenadas são pequenas o bastante para ficarem inteiras em
+    cache; as janelas de datas são aplicadas depois, em memória.
+    
+    Os DataFrames são compartilhados (st.cache_resource, sem cópia) por todas
+    as reexecuções e sessões do processo, e os lidos do cache binário
+    continuam apontando para o arquivo mapeado em memória, de modo que os
+    processos do Streamlit compartilham a mesma cópia no cache de páginas.
+    Devem ser tratados como somente leitura (filtrar_periodo e
+    ConjuntoIndicadores apenas recortam).
+    
+    Args:
+        versao_dados: Versão dos dados (ver obter_versao_dados); usada como chave do cache
+        diretorios_series: Diretórios onde procurar as séries armazenadas
+        series_catalogadas: Séries presentes no catálogo (vazio se não houver catálogo)
+        indicadores_bd: Indicadores com dados no banco de dados (não são lidos de arquivo)
+        
+    Returns:
+        Tupla (dados por indicador, série armazenada de cada indicador)
+    """
+    config = obter_configuracao()
+    dados_indicadores = {}
+    series_de_arquivo = {}
+    
+    for id_indicador, config_indicador in config["visualizacao"]["indicadores"].items():
+        nome_serie = config_indicador.get("serie_armazenada")
+        if not nome_serie or id_indicador in indicadores_bd:
+            continue
+        if series_catalogadas and nome_serie not in series_catalogadas:
+            continue
+        
+        df = carregar_dados_serie(nome_serie, diretorios_series)
+        if not df.empty:
+            # As séries gravadas pelo extrator já vêm ordenadas e sem nulos; só copia se necessário
+            if df["valor"].isna().any():
+                df = df.dropna(subset=["valor"])
+            if not df["data"].is_monotonic_increasing:
+                df = df.sort_values("data").reset_index(drop=True)
+            # Renomear coluna de valor para o nome configurado do indicador
+            df.rename(columns={"valor": config_indicador["coluna_valor"]}, inplace=True)
+            dados_indicadores[id_indicador] = df
+            series_de_arquivo[id_indicador] = nome_serie
+    
+    logger.info(f"Séries armazenadas carregadas (versão {versao_dados[:12]}).")
+    return dados_indicadores, series_de_arquivo
+
+def filtrar_periodo(df: pd.DataFrame, data_inicio: Optional[datetime.date],
+                    data_fim: Optional[datetime.date]) -> pd.DataFrame:
+    """
+    Filtra em memória um DataFrame pelo período indicado (extremos inclusivos).
+    
+    Args:
+        df: DataFrame com a coluna 'data'
+        data_inicio: Data inicial (None para não limitar)
+        data_fim: Data final (None para não limitar)
+        
+    Returns:
+        DataFrame filtrado
+    """
+    if data_inicio is None and data_fim is None:
+        return df
+    mascara = pd.Series(True, index=df.index)
+    if data_inicio is not None:
+        mascara &= df["data"] >= pd.Timestamp(data_inicio)
+    if data_fim is not None:
+        mascara &= df["data"] <= pd.Timestamp(data_fim)
+    return df[mascara]
+
+def carregar_janelas(versao_dados: str, pool: Optional[PoolConexoes], dados_arquivo: Dict[str, pd.DataFrame],
+                     janelas: Dict[str, Tuple[Optional[datetime.date], Optional[datetime.date]]]) -> Dict[str, pd.DataFrame]:
+    """
+    Obtém os dados de cada indicador na janela de datas pedida.
+    
+    Indicadores do banco de dados são consultados apenas na janela (com
+    cache); indicadores lidos de arquivo são filtrados em memória.
+    
+    Args:
+        versao_dados: Versão dos dados (chave do cache)
+        pool: Pool de conexões com o banco de dados (None se indisponível)
+        dados_arquivo: Indicadores lidos dos arquivos de dados
+        janelas: Janela (data inicial, data final) de cada indicador
+        
+    Returns:
+        Dicionário com os dados de cada indicador disponível
+    """
+    janelas_bd = tuple(sorted(
+        (id_indicador, data_inicio, data_fim)
+        for id_indicador, (data_inicio, data_fim) in janelas.items() if id_indicador not in dados_arquivo
+    ))
+    dados = carregar_dados_bd(versao_dados, pool, janelas_bd) if pool and janelas_bd else {}
+    
+    for id_indicador, (data_inicio, data_fim) in janelas.items():
+        if id_indicador in dados_arquivo:
+            dados[id_indicador] = filtrar_periodo(dados_arquivo[id_indicador], data_inicio, data_fim)
+    
+    # Mantém a ordem de configuração dos indicadores
+    return {id_indicador: dados[id_indicador] for id_indicador in janelas if id_indicador in dados}
+
+@st.cache_resource(show_spinner=False)
+def obter_cache_previsoes() -> CachePrevisoes:
+    """Retorna o cache de previsões compartilhado entre reexecuções e sessões."""
+    return CachePrevisoes.da_configuracao()
+
+@st.cache_resource(show_spinner=False)
+def obter_registro_modelos() -> RegistroModelos:
+    """Retorna o registro de modelos ajustados compartilhado entre reexecuções e sessões."""
+    return RegistroModelos.da_configuracao()
+
+@st.cache_resource(ttl=TTL_CACHE_DADOS, max_entries=16, show_spinner=False)
+def obter_conjunto_indicadores(versao_dados: str, janela: Tuple[Optional[datetime.date], Optional[datetime.date]],
+                               ids_indicadores: Tuple[str, ...], _pool: Optional[PoolConexoes],
+                               _dados_arquivo: Dict[str, pd.DataFrame]) -> ConjuntoIndicadores:
+    """
+    Monta o conjunto de indicadores de uma janela de datas.
+    
+    O conjunto é compartilhado (sem cópia) entre reexecuções e sessões
+    enquanto a versão dos dados e a janela não mudam; os componentes apenas
+    recortam as séries, sem alterá-las.
+    
+    Args:
+        versao_dados: Versão dos dados (chave do cache)
+        janela: Janela (data inicial, data final) comum aos indicadores
+        ids_indicadores: Indicadores a incluir
+        _pool: Pool de conexões com o banco de dados (None se indisponível)
+        _dados_arquivo: Indicadores lidos dos arquivos de dados (da mesma versão)
+        
+    Returns:
+        Conjunto de indicadores ordenados e indexados por data
+    """
+    dados = carregar_janelas(versao_dados, _pool, _dados_arquivo,
+                             {id_indicador: janela for id_indicador in ids_indicadores})
+    return ConjuntoIndicadores(dados, obter_configuracao()["visualizacao"]["indicadores"])
+
 def main():
     """Função principal do dashboard."""
     # Obter configuração
@@ -116,8 +464,8 @@ def main():
     agora = datetime.datetime.now()
     st.caption(f"Dashboard carregado em: {agora.strftime('%d/%m/%Y %H:%M:%S')} (Horário de Brasília). Dados atualizados conforme fontes originais.")
     
-    # Tentar conectar ao banco de dados
-    conn = conectar_bd()
+    # Pool de conexões com o banco de dados (compartilhado entre reexecuções e sessões)
+    pool = obter_pool_bd()
     
     # Diretórios possíveis para dados
     diretorio_atual = os.path.dirname(os.path.abspath(__file__))
@@ -130,43 +478,24 @@ def main():
         "/app/data"
     ]
     
-    # Carregar dados dos indicadores
-    dados_indicadores = {}
+    # Catálogo das séries armazenadas: localiza o diretório de dados uma única vez
+    diretorio_catalogo, catalogo = carregar_catalogo(possiveis_diretorios_dados)
+    diretorios_series = [diretorio_catalogo] if diretorio_catalogo else possiveis_diretorios_dados
     
-    # Tentar carregar do banco de dados primeiro
-    if conn:
-        try:
-            for id_indicador, config_indicador in config["visualizacao"]["indicadores"].items():
-                if "consulta" in config_indicador:
-                    df = carregar_dados_indicador(conn, config_indicador["consulta"])
-                    if not df.empty:
-                        # Renomear colunas para padrão
-                        if "data_referencia" in df.columns:
-                            df.rename(columns={"data_referencia": "data"}, inplace=True)
-                        
-                        dados_indicadores[id_indicador] = df
-            
-            conn.close()
-            logger.info("Conexão com o banco de dados fechada.")
-        except Exception as e:
-            logger.error(f"Erro ao carregar dados do banco de dados: {e}")
-    
-    # Carregar dados de déficit primário e IOF de arquivos JSON
-    # Déficit Primário
-    if "deficit_primario" not in dados_indicadores or dados_indicadores["deficit_primario"].empty:
-        dados_deficit = carregar_dados_json("deficit_primario.json", possiveis_diretorios_dados)
-        if dados_deficit:
-            df_deficit = processar_dados_deficit(dados_deficit)
-            if not df_deficit.empty:
-                dados_indicadores["deficit_primario"] = df_deficit
-    
-    # Arrecadação de IOF
-    if "iof" not in dados_indicadores or dados_indicadores["iof"].empty:
-        dados_iof = carregar_dados_json("arrecadacao_iof.json", possiveis_diretorios_dados)
-        if dados_iof:
-            df_iof = processar_dados_iof(dados_iof)
-            if not df_iof.empty:
-                dados_indicadores["iof"] = df_iof
+    # Versão dos dados e período de cada indicador do banco (o conteúdo é carregado por janela, com cache)
+    versao_dados, limites_bd = obter_versao_dados(pool, pool is not None, diretorios_series, catalogo)
+    dados_arquivo, series_de_arquivo = carregar_series_arquivo(
+        versao_dados, diretorios_series, tuple(sorted(catalogo)), tuple(sorted(limites_bd))
+    )
+    
+    # Período disponível de cada indicador, na ordem de configuração
+    limites_indicadores = {}
+    for id_indicador in config["visualizacao"]["indicadores"]:
+        if id_indicador in dados_arquivo:
+            datas = dados_arquivo[id_indicador]["data"]
+            limites_indicadores[id_indicador] = (datas.iloc[0].date(), datas.iloc[-1].date())
+        elif id_indicador in limites_bd:
+            limites_indicadores[id_indicador] = limites_bd[id_indicador]
     
     # Diretório de assets
     assets_dir = config["caminhos"]["diretorio_assets"]
@@ -183,14 +512,20 @@ def main():
         config["visualizacao"]["secoes"]["metricas"]["icone"]
     )
     
-    exibidor_metricas.exibir_metricas(dados_indicadores, config["visualizacao"]["indicadores"])
+    # As métricas usam apenas a observação mais recente de cada indicador
+    dados_metricas = carregar_janelas(versao_dados, pool, dados_arquivo, {
+        id_indicador: (data_max, data_max) for id_indicador, (_, data_max) in limites_indicadores.items()
+    })
+    exibidor_metricas.exibir_metricas(dados_metricas, config["visualizacao"]["indicadores"])
     
-    # Seletor de anos para filtro
+    # Seletor de anos para filtro (a partir dos períodos disponíveis, sem percorrer os dados)
     anos_disponiveis = set()
-    for df in dados_indicadores.values():
-        if not df.empty and "data" in df.columns:
-            anos = df["data"].dt.year.unique()
-            anos_disponiveis.update(anos)
+    for id_indicador, (data_min, data_max) in limites_indicadores.items():
+        entrada = catalogo.get(series_de_arquivo.get(id_indicador), {})
+        if entrada.get("data_min") and entrada.get("data_max"):
+            anos_disponiveis.update(range(int(entrada["data_min"][:4]), int(entrada["data_max"][:4]) + 1))
+        else:
+            anos_disponiveis.update(range(data_min.year, data_max.year + 1))
     
     anos_disponiveis = sorted(list(anos_disponiveis))
     
@@ -206,6 +541,14 @@ def main():
     else:
         anos_selecionados = []
     
+    # Gráficos, correlação e comparativo usam apenas a janela dos anos selecionados
+    if anos_selecionados:
+        janela_anos = (datetime.date(min(anos_selecionados), 1, 1), datetime.date(max(anos_selecionados), 12, 31))
+    else:
+        janela_anos = (None, None)
+    dados_indicadores = obter_conjunto_indicadores(versao_dados, janela_anos, tuple(limites_indicadores),
+                                                   pool, dados_arquivo)
+    
     # Seção de gráficos
     exibidor_metricas.exibir_cabecalho_secao(
         f"{config['visualizacao']['secoes']['graficos']['titulo']} ({', '.join(map(str, anos_selecionados))})",
@@ -231,7 +574,7 @@ def main():
     # Seletor de indicador para previsão
     opcoes_indicadores = [(id_indicador, config_indicador.get("nome", id_indicador)) 
                         for id_indicador, config_indicador in config["visualizacao"]["indicadores"].items() 
-                        if id_indicador in dados_indicadores and not dados_indicadores[id_indicador].empty]
+                        if id_indicador in limites_indicadores]
     
     if opcoes_indicadores:
         indicador_selecionado = st.selectbox(
@@ -248,33 +591,38 @@ def main():
             value=12
         )
         
-        # Configurações avançadas de previsão
+        # Configurações avançadas de previsão (valores iniciais: parâmetros ajustados do indicador)
+        parametros_padrao = obter_parametros_previsao(indicador_selecionado)
+        modos_sazonalidade = ["multiplicative", "additive"]
         with st.expander("Configurações avançadas de previsão"):
             col1, col2 = st.columns(2)
             
             with col1:
-                sazonalidade_anual = st.checkbox("Sazonalidade anual", value=True)
-                sazonalidade_semanal = st.checkbox("Sazonalidade semanal", value=False)
-                sazonalidade_diaria = st.checkbox("Sazonalidade diária", value=False)
+                sazonalidade_anual = st.checkbox("Sazonalidade anual", value=bool(parametros_padrao["sazonalidade_anual"]))
+                sazonalidade_semanal = st.checkbox("Sazonalidade semanal", value=bool(parametros_padrao["sazonalidade_semanal"]))
+                sazonalidade_diaria = st.checkbox("Sazonalidade diária", value=bool(parametros_padrao["sazonalidade_diaria"]))
             
             with col2:
                 modo_sazonalidade = st.selectbox(
                     "Modo de sazonalidade:",
-                    ["multiplicative", "additive"],
-                    index=0
+                    modos_sazonalidade,
+                    index=modos_sazonalidade.index(parametros_padrao["modo_sazonalidade"])
+                    if parametros_padrao["modo_sazonalidade"] in modos_sazonalidade else 0
                 )
                 escala_prior = st.slider(
                     "Escala do prior para pontos de mudança:",
                     min_value=0.01,
                     max_value=0.5,
-                    value=0.05,
+                    value=min(max(round(float(parametros_padrao["escala_prior_pontos_mudanca"]), 2), 0.01), 0.5),
                     step=0.01
                 )
         
         # Botão para gerar previsão
         if st.button("Gerar Previsão"):
-            if indicador_selecionado in dados_indicadores:
-                df = dados_indicadores[indicador_selecionado]
+            # A previsão usa o histórico completo, carregado apenas quando solicitada
+            dados_previsao = carregar_janelas(versao_dados, pool, dados_arquivo, {indicador_selecionado: (None, None)})
+            if indicador_selecionado in dados_previsao and not dados_previsao[indicador_selecionado].empty:
+                df = dados_previsao[indicador_selecionado]
                 config_indicador = config["visualizacao"]["indicadores"][indicador_selecionado]
                 
                 # Obter a coluna de valor
@@ -297,64 +645,72 @@ def main():
                         coluna_valor = None
                 
                 if coluna_valor:
-                    with st.spinner("Gerando previsão..."):
-                        # Criar e treinar modelo
-                        previsor = PrevisorSeriesTemporal(
-                            sazonalidade_anual=sazonalidade_anual,
-                            sazonalidade_semanal=sazonalidade_semanal,
-                            sazonalidade_diaria=sazonalidade_diaria,
-                            modo_sazonalidade=modo_sazonalidade,
-                            escala_prior_pontos_mudanca=escala_prior
+                    previsor = PrevisorSeriesTemporal(
+                        sazonalidade_anual=sazonalidade_anual,
+                        sazonalidade_semanal=sazonalidade_semanal,
+                        sazonalidade_diaria=sazonalidade_diaria,
+                        modo_sazonalidade=modo_sazonalidade,
+                        escala_prior_pontos_mudanca=escala_prior,
+                        cache=obter_cache_previsoes(),
+                        registro=obter_registro_modelos()
+                    )
+                    df_preparado = previsor.preparar_dados(df, "data", coluna_valor)
+                    titulo_previsao = f"Previsão de {config_indicador.get('nome', indicador_selecionado)} para {periodo_previsao} meses"
+                    
+                    # Previsão pré-calculada pelo pipeline, se os parâmetros e os dados coincidirem
+                    armazenada = None
+                    if not df_preparado.empty:
+                        armazenada = RepositorioPrevisoes().obter(
+                            indicador_selecionado, previsor.parametros, calcular_hash_dados(df_preparado), periodo_previsao
                         )
+                    
+                    previsao = None
+                    if armazenada is not None:
+                        previsao = armazenada["previsao"]
+                        fig_previsao = criar_figura_previsao(df_preparado, previsao, titulo_previsao)
+                        fig_componentes = armazenada["componentes"]
+                        st.caption(f"Previsão pré-calculada em {armazenada['gerado_em']}.")
+                    else:
+                        # Parâmetros personalizados (ou dados mais recentes): treina o modelo, se não estiver em cache
+                        with st.spinner("Gerando previsão..."):
+                            resultado = previsor.gerar_previsao(df_preparado, periodo_previsao, titulo_previsao)
+                        if resultado is None:
+                            st.error("Erro ao gerar previsão.")
+                        else:
+                            previsao = resultado["previsao"]
+                            fig_previsao = resultado["fig_previsao"]
+                            fig_componentes = resultado["fig_componentes"]
+                    
+                    if previsao is not None:
+                        # Exibir gráficos
+                        if fig_previsao:
+                            st.plotly_chart(fig_previsao, use_container_width=True)
                         
-                        df_preparado = previsor.preparar_dados(df, "data", coluna_valor)
+                        if fig_componentes:
+                            st.plotly_chart(fig_componentes, use_container_width=True)
                         
-                        if previsor.treinar(df_preparado):
-                            # Gerar previsão
-                            previsao = previsor.prever(periodo_previsao)
+                        # Exibir tabela de previsão
+                        with st.expander("Ver tabela de previsão"):
+                            # Filtrar apenas as colunas relevantes
+                            colunas_exibir = ["ds", "yhat", "yhat_lower", "yhat_upper"]
+                            df_exibir = previsao[colunas_exibir].copy()
                             
-                            if previsao is not None:
-                                # Criar gráficos
-                                fig_previsao = previsor.plotar_previsao(
-                                    previsao, 
-                                    f"Previsão de {config_indicador.get('nome', indicador_selecionado)} para {periodo_previsao} meses"
-                                )
-                                
-                                fig_componentes = previsor.plotar_componentes(previsao)
-                                
-                                # Exibir gráficos
-                                if fig_previsao:
-                                    st.plotly_chart(fig_previsao, use_container_width=True)
-                                
-                                if fig_componentes:
-                                    st.plotly_chart(fig_componentes, use_container_width=True)
-                                
-                                # Exibir tabela de previsão
-                                with st.expander("Ver tabela de previsão"):
-                                    # Filtrar apenas as colunas relevantes
-                                    colunas_exibir = ["ds", "yhat", "yhat_lower", "yhat_upper"]
-                                    df_exibir = previsao[colunas_exibir].copy()
-                                    
-                                    # Renomear colunas para melhor compreensão
-                                    df_exibir.rename(columns={
-                                        "ds": "Data",
-                                        "yhat": "Previsão",
-                                        "yhat_lower": "Limite Inferior",
-                                        "yhat_upper": "Limite Superior"
-                                    }, inplace=True)
-                                    
-                                    # Formatar datas
-                                    df_exibir["Data"] = df_exibir["Data"].dt.strftime("%d/%m/%Y")
-                                    
-                                    # Exibir apenas dados futuros
-                                    hoje = datetime.datetime.now().strftime("%d/%m/%Y")
-                                    df_futuro = df_exibir[df_exibir["Data"] >= hoje]
-                                    
-                                    st.dataframe(df_futuro)
-                            else:
-                                st.error("Erro ao gerar previsão.")
-                        else:
-                            st.error("Erro ao treinar modelo de previsão.")
+                            # Renomear colunas para melhor compreensão
+                            df_exibir.rename(columns={
+                                "ds": "Data",
+                                "yhat": "Previsão",
+                                "yhat_lower": "Limite Inferior",
+                                "yhat_upper": "Limite Superior"
+                            }, inplace=True)
+                            
+                            # Formatar datas
+                            df_exibir["Data"] = df_exibir["Data"].dt.strftime("%d/%m/%Y")
+                            
+                            # Exibir apenas dados futuros
+                            hoje = datetime.datetime.now().strftime("%d/%m/%Y")
+                            df_futuro = df_exibir[df_exibir["Data"] >= hoje]
+                            
+                            st.dataframe(df_futuro)
     else:
         st.warning("Não há indicadores disponíveis para previsão.")
     
@@ -0,0 +1,9 @@
+"""Configuração comum dos testes."""
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "integracao: testes que dependem de serviços externos (PostgreSQL); "
+        "use -m 'not integracao' para executar apenas os testes locais"
+    )
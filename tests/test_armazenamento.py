@@ -0,0 +1,157 @@
+"""
+Testes do armazenamento das séries (formatos de arquivo e manifesto).
+"""
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.dados.armazenamento import ArmazenamentoBinario, ManifestoSeries, calcular_hash_serie, criar_serie_vazia
+from src.dados.extratores.base import ExtratorSeries
+
+
+def criar_serie(linhas=1000, inicio="2020-01-01", deslocamento=0.0):
+    return pd.DataFrame({
+        "data": pd.date_range(inicio, periods=linhas, freq="D").astype("datetime64[ns]"),
+        "valor": np.arange(linhas, dtype="float64") / 7 + deslocamento
+    })
+
+
+def memmap_de_origem(array):
+    """Percorre a cadeia de bases de um array até o np.memmap de onde ele veio (ou None)."""
+    base = array
+    while base is not None and not isinstance(base, np.memmap):
+        base = base.base
+    return base
+
+
+def test_binario_ida_e_volta(tmp_path):
+    armazenamento = ArmazenamentoBinario(str(tmp_path))
+    df = criar_serie()
+
+    assert armazenamento.salvar("serie", df)
+    pd.testing.assert_frame_equal(armazenamento.carregar("serie"), df)
+
+
+def test_binario_serie_vazia(tmp_path):
+    armazenamento = ArmazenamentoBinario(str(tmp_path))
+
+    assert armazenamento.salvar("vazia", criar_serie_vazia())
+    pd.testing.assert_frame_equal(armazenamento.carregar("vazia"), criar_serie_vazia())
+
+
+@pytest.mark.parametrize("coluna", ["data", "valor"])
+def test_binario_carrega_sem_copia(tmp_path, coluna):
+    armazenamento = ArmazenamentoBinario(str(tmp_path))
+    armazenamento.salvar("serie", criar_serie())
+
+    array = armazenamento.carregar("serie")[coluna].to_numpy()
+    mapa = memmap_de_origem(array)
+
+    # A coluna é uma visão somente leitura das páginas do arquivo mapeado
+    assert mapa is not None
+    assert mapa.filename == str(tmp_path / "serie.serie")
+    assert np.shares_memory(array, mapa)
+    assert not array.flags.writeable
+
+
+def test_binario_arquivo_corrompido_devolve_serie_vazia(tmp_path):
+    armazenamento = ArmazenamentoBinario(str(tmp_path))
+    armazenamento.salvar("serie", criar_serie())
+    with open(armazenamento.caminho("serie"), "r+b") as f:
+        f.truncate(100)
+
+    assert armazenamento.carregar("serie").empty
+
+
+def arquivos_da_serie(extrator, nome_serie):
+    return [a.caminho(nome_serie) for a in [extrator.armazenamento] + extrator.armazenamentos_adicionais]
+
+
+def envelhecer(caminhos, segundos=3600):
+    """Recua o mtime dos arquivos, para que uma regravação seja detectável."""
+    for caminho in caminhos:
+        estado = os.stat(caminho)
+        os.utime(caminho, ns=(estado.st_atime_ns - segundos * 10**9, estado.st_mtime_ns - segundos * 10**9))
+    return {caminho: os.stat(caminho).st_mtime_ns for caminho in caminhos}
+
+
+def test_serie_inalterada_nao_e_regravada(tmp_path):
+    extrator = ExtratorSeries(str(tmp_path))
+    assert extrator._salvar_serie("serie", criar_serie())
+    extrator.manifesto.salvar()
+
+    caminhos = arquivos_da_serie(extrator, "serie") + [extrator.manifesto.caminho]
+    mtimes = envelhecer(caminhos)
+    with open(extrator.manifesto.caminho, encoding="utf-8") as f:
+        manifesto_antes = f.read()
+
+    # Mesmo conteúdo, em outra instância (como em uma nova execução do extrator)
+    extrator = ExtratorSeries(str(tmp_path))
+    assert extrator._salvar_serie("serie", criar_serie())
+    assert extrator.manifesto.salvar()
+
+    assert extrator.series_alteradas == []
+    assert {caminho: os.stat(caminho).st_mtime_ns for caminho in caminhos} == mtimes
+    with open(extrator.manifesto.caminho, encoding="utf-8") as f:
+        assert f.read() == manifesto_antes
+
+
+def test_serie_inalterada_regrava_apenas_formato_faltante(tmp_path):
+    extrator = ExtratorSeries(str(tmp_path))
+    extrator._salvar_serie("serie", criar_serie())
+    principal, *adicionais = arquivos_da_serie(extrator, "serie")
+    if not adicionais:
+        pytest.skip("Sem formatos adicionais configurados")
+
+    mtimes = envelhecer([principal] + adicionais)
+    os.remove(adicionais[0])
+    assert extrator._salvar_serie("serie", criar_serie())
+
+    assert os.path.exists(adicionais[0])
+    assert os.stat(principal).st_mtime_ns == mtimes[principal]
+    assert extrator.series_alteradas == ["serie"]  # Apenas o primeiro salvamento
+
+
+def test_serie_alterada_atualiza_o_manifesto(tmp_path):
+    extrator = ExtratorSeries(str(tmp_path))
+    extrator._salvar_serie("serie", criar_serie(linhas=100))
+    extrator.manifesto.salvar()
+    mtimes = envelhecer(arquivos_da_serie(extrator, "serie"))
+
+    extrator = ExtratorSeries(str(tmp_path))
+    nova = criar_serie(linhas=120)
+    assert extrator._salvar_serie("serie", nova)
+    assert extrator.manifesto.salvar()
+
+    assert extrator.series_alteradas == ["serie"]
+    assert all(os.stat(caminho).st_mtime_ns > mtime for caminho, mtime in mtimes.items())
+
+    entrada = ManifestoSeries(str(tmp_path)).obter("serie")
+    assert entrada["hash"] == calcular_hash_serie(nova)
+    assert entrada["linhas"] == 120
+    assert entrada["data_max"] == "2020-04-29"
+    pd.testing.assert_frame_equal(extrator._carregar_dados_existentes("serie"), nova)
+
+
+def test_manifestos_salvos_em_sequencia_preservam_as_entradas(tmp_path):
+    # Duas instâncias abertas ao mesmo tempo, como os extratores do BCB e do IBGE
+    primeiro = ManifestoSeries(str(tmp_path))
+    segundo = ManifestoSeries(str(tmp_path))
+
+    primeiro.registrar("selic", "hash_selic", linhas=1)
+    segundo.registrar("pib", "hash_pib", linhas=2)
+    assert primeiro.salvar()
+    assert segundo.salvar()
+
+    # Uma nova alteração da primeira instância não apaga a entrada da segunda
+    primeiro.registrar("selic", "hash_selic_2", linhas=3)
+    assert primeiro.salvar()
+
+    with open(os.path.join(tmp_path, ManifestoSeries.NOME_ARQUIVO), encoding="utf-8") as f:
+        series = json.load(f)["series"]
+    assert {nome: entrada["hash"] for nome, entrada in series.items()} == {"pib": "hash_pib", "selic": "hash_selic_2"}
+    assert series["selic"]["linhas"] == 3
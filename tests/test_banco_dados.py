@@ -0,0 +1,131 @@
+"""
+Testes do pool de conexões do dashboard.
+
+Os testes locais substituem psycopg2.connect por conexões falsas; o teste
+marcado com `integracao` confere, no PostgreSQL, que as conexões ociosas
+são fechadas no servidor (ver tests/test_carregador_postgres.py).
+"""
+
+import os
+import time
+from types import SimpleNamespace
+
+import pytest
+
+psycopg2 = pytest.importorskip("psycopg2")
+from psycopg2 import extensions
+
+from src.utils.banco_dados import PoolConexoes
+from src.utils.configuracao import obter_configuracao
+
+
+class ConexaoFalsa:
+    """Conexão com a interface usada pelo pool do psycopg2 e por PoolConexoes."""
+
+    def __init__(self):
+        self.closed = 0
+        self.info = SimpleNamespace(transaction_status=extensions.TRANSACTION_STATUS_IDLE)
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        self.closed = 1
+
+
+@pytest.fixture
+def conexoes(monkeypatch):
+    abertas = []
+
+    def conectar(*args, **kwargs):
+        abertas.append(ConexaoFalsa())
+        return abertas[-1]
+
+    monkeypatch.setattr(psycopg2, "connect", conectar)
+    return abertas
+
+
+def emprestar_simultaneamente(pool, quantidade):
+    """Empresta `quantidade` conexões ao mesmo tempo e as devolve."""
+    blocos = [pool.conexao() for _ in range(quantidade)]
+    for bloco in blocos:
+        bloco.__enter__()
+    for bloco in reversed(blocos):
+        bloco.__exit__(None, None, None)
+
+
+def abertas_no_servidor(conexoes):
+    return sum(1 for conexao in conexoes if not conexao.closed)
+
+
+def test_devolucao_fecha_ociosas_acima_do_minimo(conexoes):
+    pool = PoolConexoes({}, minimo=1, maximo=5, tempo_ocioso=0.05, intervalo_verificacao=60)
+    emprestar_simultaneamente(pool, 4)
+    assert abertas_no_servidor(conexoes) == 4
+
+    time.sleep(0.1)
+    emprestar_simultaneamente(pool, 1)
+
+    # A conexão recém-devolvida e a mínima ficam; as ociosas há mais de tempo_ocioso são fechadas
+    assert abertas_no_servidor(conexoes) <= 2
+    pool.fechar()
+
+
+def test_descartar_ociosas_preserva_o_minimo(conexoes):
+    pool = PoolConexoes({}, minimo=2, maximo=5, tempo_ocioso=0.05, intervalo_verificacao=60)
+    emprestar_simultaneamente(pool, 5)
+    time.sleep(0.1)
+
+    assert pool.descartar_ociosas() == 3
+    assert abertas_no_servidor(conexoes) == 2
+    assert pool.descartar_ociosas() == 0
+    pool.fechar()
+
+
+def test_conexoes_recentes_nao_sao_fechadas(conexoes):
+    pool = PoolConexoes({}, minimo=0, maximo=3, tempo_ocioso=60, intervalo_verificacao=60)
+    emprestar_simultaneamente(pool, 3)
+
+    assert pool.descartar_ociosas() == 0
+    assert abertas_no_servidor(conexoes) == 3
+    pool.fechar()
+
+
+def test_thread_de_manutencao_fecha_ociosas_sem_emprestimos(conexoes):
+    pool = PoolConexoes({}, minimo=1, maximo=4, tempo_ocioso=0.5, intervalo_verificacao=0.5)
+    emprestar_simultaneamente(pool, 4)
+    assert abertas_no_servidor(conexoes) == 4
+
+    prazo = time.monotonic() + 5
+    while abertas_no_servidor(conexoes) > 1 and time.monotonic() < prazo:
+        time.sleep(0.1)
+    assert abertas_no_servidor(conexoes) == 1
+    pool.fechar()
+    assert abertas_no_servidor(conexoes) == 0
+
+
+@pytest.mark.integracao
+def test_conexoes_ociosas_fechadas_no_servidor():
+    config = obter_configuracao()["bd"]
+    parametros = {"host": config["host"], "port": config["port"], "database": config["database"],
+                  "user": config["user"], "password": config["password"], "connect_timeout": 3,
+                  "application_name": "teste_pool_ocioso"}
+    try:
+        pool = PoolConexoes(parametros, minimo=1, maximo=4, tempo_ocioso=0.5, intervalo_verificacao=0.5)
+    except psycopg2.OperationalError as e:
+        if os.getenv("TESTES_EXIGIR_BANCO"):
+            raise
+        pytest.skip(f"PostgreSQL indisponível: {e}")
+
+    def contar_no_servidor():
+        with pool.conexao() as conexao, conexao.cursor() as cursor:
+            cursor.execute("SELECT count(*) FROM pg_stat_activity WHERE application_name = 'teste_pool_ocioso'")
+            return cursor.fetchone()[0]
+
+    try:
+        emprestar_simultaneamente(pool, 4)
+        assert contar_no_servidor() == 4
+        time.sleep(2)
+        assert contar_no_servidor() == 1
+    finally:
+        pool.fechar()
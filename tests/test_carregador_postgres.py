@@ -0,0 +1,168 @@
+"""
+Testes do carregador das tabelas stg_* no PostgreSQL.
+
+A serialização para o COPY é testada sem banco. Os testes marcados com
+`integracao` usam o banco configurado em CONFIGURACAO_BD (o contêiner
+postgres do docker-compose, com DB_HOST=localhost) e são ignorados quando o
+banco não está acessível, a menos que TESTES_EXIGIR_BANCO esteja definido
+(como no CI, que sobe um contêiner do PostgreSQL). Cada teste de integração
+trabalha em um esquema próprio, removido ao fim.
+
+    docker-compose up -d postgres
+    DB_HOST=localhost python -m pytest tests/test_carregador_postgres.py
+"""
+
+import os
+import uuid
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.utils.configuracao import obter_configuracao
+from src.dados.carregadores.postgres import CarregadorPostgres, serializar_para_copy
+
+TABELAS = {"serie_teste": {"tabela": "stg_serie_teste", "coluna_valor": "valor_teste"}}
+
+
+@pytest.fixture(scope="module")
+def conexao():
+    psycopg2 = pytest.importorskip("psycopg2")
+    config = obter_configuracao()["bd"]
+    try:
+        conexao = psycopg2.connect(
+            host=config["host"], port=config["port"], database=config["database"],
+            user=config["user"], password=config["password"], connect_timeout=3
+        )
+    except psycopg2.OperationalError as e:
+        if os.getenv("TESTES_EXIGIR_BANCO"):
+            raise
+        pytest.skip(f"PostgreSQL indisponível: {e}")
+    yield conexao
+    conexao.close()
+
+
+@pytest.fixture
+def esquema(conexao):
+    nome = f"teste_carga_{uuid.uuid4().hex[:8]}"
+    with conexao, conexao.cursor() as cursor:
+        cursor.execute(f"CREATE SCHEMA {nome}")
+    yield nome
+    with conexao, conexao.cursor() as cursor:
+        cursor.execute(f"DROP SCHEMA {nome} CASCADE")
+
+
+def criar_serie(valores, inicio="2024-01-01"):
+    return pd.DataFrame({"data": pd.date_range(inicio, periods=len(valores), freq="D"), "valor": valores})
+
+
+def consultar(conexao, consulta):
+    with conexao, conexao.cursor() as cursor:
+        cursor.execute(consulta)
+        return cursor.fetchall()
+
+
+def test_serializar_para_copy_formata_data_e_valor():
+    df = pd.DataFrame({"data": pd.to_datetime(["2024-01-31", "2024-02-29"]), "valor": [10.5, -0.25]})
+    assert serializar_para_copy(df).getvalue() == "2024-01-31\t10.5\n2024-02-29\t-0.25\n"
+
+
+def test_serializar_para_copy_preserva_precisao():
+    valores = [0.1 + 0.2, 1 / 3, 1e-300, 123456789.123456789]
+    df = pd.DataFrame({"data": pd.date_range("2024-01-01", periods=len(valores), freq="D"), "valor": valores})
+    linhas = serializar_para_copy(df).read().splitlines()
+    assert [float(linha.split("\t")[1]) for linha in linhas] == valores
+
+
+def test_serializar_para_copy_descarta_linhas_incompletas():
+    df = pd.DataFrame({
+        "data": pd.to_datetime(["2024-01-01", None, "2024-01-03"]),
+        "valor": [1.0, 2.0, np.nan]
+    })
+    assert serializar_para_copy(df).getvalue() == "2024-01-01\t1.0\n"
+
+
+def test_serializar_para_copy_ignora_horario_e_resolucao():
+    datas = pd.Series(pd.to_datetime(["2024-03-01 23:59:59", "1900-01-01 00:00:00"])).astype("datetime64[s]")
+    df = pd.DataFrame({"data": datas, "valor": [1.0, 2.0]})
+    assert serializar_para_copy(df).getvalue() == "2024-03-01\t1.0\n1900-01-01\t2.0\n"
+
+
+def test_serializar_para_copy_serie_vazia():
+    df = pd.DataFrame({"data": pd.Series(dtype="datetime64[ns]"), "valor": pd.Series(dtype="float64")})
+    buffer = serializar_para_copy(df)
+    assert buffer.getvalue() == ""
+    assert buffer.tell() == 0
+
+
+@pytest.mark.integracao
+def test_cria_tabela_e_faz_upsert(conexao, esquema):
+    carregador = CarregadorPostgres(conexao, TABELAS, esquema, criar_tabelas=True)
+
+    assert carregador.carregar("serie_teste", criar_serie([1.0, 2.0, 3.0])) == 3
+    # Recarga sem mudanças não reescreve linhas
+    assert carregador.carregar("serie_teste", criar_serie([1.0, 2.0, 3.0])) == 0
+    # Um valor alterado e uma data nova
+    assert carregador.carregar("serie_teste", criar_serie([1.0, 2.5, 3.0, 4.0])) == 2
+
+    linhas = consultar(conexao, f"SELECT valor_teste FROM {esquema}.stg_serie_teste ORDER BY data_referencia")
+    assert [valor for (valor,) in linhas] == [1.0, 2.5, 3.0, 4.0]
+
+
+@pytest.mark.integracao
+def test_ajusta_tabela_existente_sem_restricao_nem_atualizado_em(conexao, esquema):
+    with conexao, conexao.cursor() as cursor:
+        cursor.execute(f"CREATE TABLE {esquema}.stg_serie_teste (data_referencia DATE, valor_teste DOUBLE PRECISION)")
+        cursor.execute(f"INSERT INTO {esquema}.stg_serie_teste VALUES ('2024-01-01', 10.0)")
+
+    carregador = CarregadorPostgres(conexao, TABELAS, esquema, criar_tabelas=True)
+    assert carregador.carregar("serie_teste", criar_serie([1.0, 2.0])) == 2
+
+    linhas = consultar(conexao, f"SELECT valor_teste, atualizado_em IS NOT NULL FROM {esquema}.stg_serie_teste "
+                                f"ORDER BY data_referencia")
+    assert linhas == [(1.0, True), (2.0, True)]
+
+
+@pytest.mark.integracao
+def test_rejeita_tabela_com_datas_duplicadas(conexao, esquema):
+    with conexao, conexao.cursor() as cursor:
+        cursor.execute(f"CREATE TABLE {esquema}.stg_serie_teste (data_referencia DATE, valor_teste DOUBLE PRECISION)")
+        cursor.execute(f"INSERT INTO {esquema}.stg_serie_teste VALUES ('2024-01-01', 1.0), ('2024-01-01', 2.0)")
+
+    carregador = CarregadorPostgres(conexao, TABELAS, esquema, criar_tabelas=True)
+    with pytest.raises(RuntimeError, match="datas duplicadas"):
+        carregador.carregar("serie_teste", criar_serie([1.0]))
+
+    # A transação foi desfeita: a tabela continua como estava
+    assert consultar(conexao, f"SELECT count(*) FROM {esquema}.stg_serie_teste") == [(2,)]
+
+
+@pytest.mark.integracao
+def test_sem_criar_tabelas_falha_com_mensagem_clara(conexao, esquema):
+    carregador = CarregadorPostgres(conexao, TABELAS, esquema, criar_tabelas=False)
+    with pytest.raises(RuntimeError, match="não existe"):
+        carregador.carregar("serie_teste", criar_serie([1.0]))
+
+    with conexao, conexao.cursor() as cursor:
+        cursor.execute(f"CREATE TABLE {esquema}.stg_serie_teste (data_referencia DATE, valor_teste DOUBLE PRECISION)")
+    with pytest.raises(RuntimeError, match="restrição única em data_referencia e coluna atualizado_em"):
+        carregador.carregar("serie_teste", criar_serie([1.0]))
+
+
+@pytest.mark.integracao
+def test_rejeita_tabela_sem_coluna_de_valor(conexao, esquema):
+    with conexao, conexao.cursor() as cursor:
+        cursor.execute(f"CREATE TABLE {esquema}.stg_serie_teste (data_referencia DATE PRIMARY KEY, outro DOUBLE PRECISION)")
+
+    carregador = CarregadorPostgres(conexao, TABELAS, esquema, criar_tabelas=True)
+    with pytest.raises(RuntimeError, match="valor_teste"):
+        carregador.carregar("serie_teste", criar_serie([1.0]))
+
+
+@pytest.mark.integracao
+def test_carga_volumosa(conexao, esquema):
+    carregador = CarregadorPostgres(conexao, TABELAS, esquema, criar_tabelas=True)
+    serie = criar_serie([float(i) for i in range(200_000)], inicio="1900-01-01")
+
+    assert carregador.carregar("serie_teste", serie) == 200_000
+    assert consultar(conexao, f"SELECT count(*), max(valor_teste) FROM {esquema}.stg_serie_teste") == [(200_000, 199_999.0)]
@@ -0,0 +1,179 @@
+"""
+Testes do extrator do SGS (BCB).
+
+O processamento em bloco (converter_datas_sgs, converter_valores_sgs e
+ExtratorBCB._processar_dados_colunar) deve produzir o mesmo resultado que a
+versão original item a item, reproduzida em processar_item_a_item. A busca
+em janelas usa um cliente HTTP de teste, sem acesso à internet.
+"""
+
+import datetime
+import random
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+import requests
+
+from src.dados.extratores.bcb import DATA_MAXIMA, DATA_MINIMA, ExtratorBCB, converter_datas_sgs, converter_valores_sgs
+from src.utils.configuracao import CONFIGURACAO_EXTRACAO
+
+DATAS = [
+    '01/02/2024', '1/2/2024', '01/2/2024', '1/02/2024', ' 1/2/2024', '31/12/1999', '29/02/2024',
+    '31/02/2024', '29/02/2023', '00/01/2024', '15/13/2024', '2024-01-01', '01/02/24', '01-02-2024',
+    '01/02/2024 ', 'abc', '', '//', '1/1/1678', '11/04/2262'
+]
+VALORES = ['1,5', '1.5', '-0,001', '10', '1e3', ' 2,5 ', 'nan', 'NaN', '-nan', 'inf', '', 'abc', '1.234,5', ',']
+
+
+def processar_item_a_item(dados):
+    """Versão original (item a item) de ExtratorBCB._processar_dados."""
+    dados_processados = []
+    for item in dados:
+        try:
+            data_str = item.get('data')
+            data_obj = datetime.datetime.strptime(data_str, '%d/%m/%Y')
+            data_iso = data_obj.strftime('%Y-%m-%d')
+            valor_str = item.get('valor', '0').replace(',', '.')
+            valor = float(valor_str)
+            dados_processados.append({'data': data_iso, 'valor': valor})
+        except (ValueError, KeyError):
+            continue
+    return dados_processados
+
+
+def como_dataframe(dados_processados):
+    return pd.DataFrame({
+        'data': pd.to_datetime([item['data'] for item in dados_processados], format='%Y-%m-%d').astype('datetime64[ns]'),
+        'valor': pd.Series([item['valor'] for item in dados_processados], dtype='float64')
+    })
+
+
+@pytest.fixture
+def extrator(tmp_path):
+    return ExtratorBCB(str(tmp_path))
+
+
+def combinacoes():
+    dados = [{'data': data, 'valor': valor} for data in DATAS for valor in VALORES]
+    # Valor ausente vale '0'
+    dados += [{'data': data} for data in DATAS]
+    return dados
+
+
+def test_colunar_igual_ao_item_a_item(extrator):
+    dados = combinacoes()
+    pd.testing.assert_frame_equal(
+        extrator._processar_dados_colunar(dados, 'teste'),
+        como_dataframe(processar_item_a_item(dados))
+    )
+
+
+def test_lista_igual_ao_item_a_item(extrator):
+    dados = combinacoes()
+    esperado = processar_item_a_item(dados)
+    obtido = extrator._processar_dados(dados, 'teste')
+
+    assert [item['data'] for item in obtido] == [item['data'] for item in esperado]
+    np.testing.assert_array_equal([item['valor'] for item in obtido], [item['valor'] for item in esperado])
+
+
+def test_serie_longa_igual_ao_item_a_item(extrator):
+    # Caminho rápido (todas as datas com dois dígitos) em uma série diária longa
+    datas = pd.date_range('1700-01-01', '2262-04-11', freq='D')
+    rng = np.random.default_rng(0)
+    dados = [{'data': data, 'valor': f"{valor:.4f}".replace('.', ',')}
+             for data, valor in zip(datas.strftime('%d/%m/%Y'), rng.normal(size=len(datas)))]
+
+    pd.testing.assert_frame_equal(
+        extrator._processar_dados_colunar(dados, 'teste'),
+        como_dataframe(processar_item_a_item(dados))
+    )
+
+
+def test_datas_aleatorias_iguais_ao_strptime():
+    # Strings próximas do formato, para exercitar a remontagem por fatiamento de caracteres
+    aleatorio = random.Random(0)
+    datas = [''.join(aleatorio.choice('0123456789/ ') for _ in range(aleatorio.randint(6, 11))) for _ in range(20000)]
+    datas += [f"{aleatorio.randint(0, 32):02d}/{aleatorio.randint(0, 13):02d}/{aleatorio.randint(1700, 2200)}"
+              for _ in range(20000)]
+
+    esperado = []
+    for data in datas:
+        try:
+            convertida = np.datetime64(datetime.datetime.strptime(data, '%d/%m/%Y').date(), 'D')
+        except ValueError:
+            convertida = np.datetime64('NaT')
+        # Fora do intervalo de datetime64[ns], ver test_datas_fora_do_intervalo_de_datetime64_ns_viram_nat
+        esperado.append(convertida if DATA_MINIMA <= convertida <= DATA_MAXIMA else np.datetime64('NaT'))
+
+    np.testing.assert_array_equal(converter_datas_sgs(datas), np.array(esperado, dtype='datetime64[D]'))
+
+
+def test_datas_fora_do_intervalo_de_datetime64_ns_viram_nat():
+    # A versão item a item devolvia essas datas como texto; o DataFrame da série não as representa
+    convertidas = converter_datas_sgs(['01/01/0024', '21/09/1677', '22/09/1677', '11/04/2262', '12/04/2262'])
+    assert np.isnat(convertidas).tolist() == [True, True, False, False, True]
+
+
+def test_itens_nao_textuais_sao_invalidos():
+    assert np.isnat(converter_datas_sgs([None, 20240101])).all()
+    assert np.isnan(converter_valores_sgs([None, '1,5'])[0])
+    assert converter_valores_sgs([None, '1,5'])[1] == 1.5
+
+
+def test_listas_vazias():
+    assert converter_datas_sgs([]).dtype == np.dtype('datetime64[D]')
+    assert converter_valores_sgs([]).dtype == np.dtype('float64')
+
+
+class ClienteConcorrencia:
+    """Cliente HTTP de teste: responde 404 (sem dados) após uma pausa e registra o pico de requisições simultâneas."""
+
+    def __init__(self, pausa=0.02):
+        self.pausa = pausa
+        self.trava = threading.Lock()
+        self.em_andamento = 0
+        self.pico = 0
+        self.requisicoes = 0
+
+    def obter(self, url, params=None, timeout=None):
+        with self.trava:
+            self.em_andamento += 1
+            self.requisicoes += 1
+            self.pico = max(self.pico, self.em_andamento)
+        time.sleep(self.pausa)
+        with self.trava:
+            self.em_andamento -= 1
+        resposta = requests.Response()
+        resposta.status_code = 404
+        return resposta
+
+
+def test_janelas_de_todas_as_series_dividem_um_unico_pool(tmp_path, monkeypatch):
+    monkeypatch.setitem(CONFIGURACAO_EXTRACAO["bcb"], "dias_por_janela", 30)
+    monkeypatch.setitem(CONFIGURACAO_EXTRACAO["bcb"], "max_janelas_simultaneas", 3)
+    cliente = ClienteConcorrencia()
+    extrator = ExtratorBCB(str(tmp_path), cliente_http=cliente)
+    extrator.series = {str(codigo): f"serie_{codigo}" for codigo in range(6)}
+
+    extrator.extrair_todas_series(dias_retroativos=300, max_concorrencia=6, incremental=False)
+
+    # 6 séries x 11 janelas, com no máximo 3 requisições simultâneas (e não 6 x 3)
+    assert cliente.requisicoes == 6 * 11
+    assert cliente.pico <= 3
+    assert extrator._executor_janelas is None
+
+
+def test_busca_avulsa_usa_pool_proprio(tmp_path, monkeypatch):
+    monkeypatch.setitem(CONFIGURACAO_EXTRACAO["bcb"], "dias_por_janela", 30)
+    monkeypatch.setitem(CONFIGURACAO_EXTRACAO["bcb"], "max_janelas_simultaneas", 2)
+    cliente = ClienteConcorrencia()
+
+    dados = ExtratorBCB(str(tmp_path), cliente_http=cliente).buscar_dados_serie("1", "01/01/2024", "31/12/2024")
+
+    assert dados == []
+    assert cliente.requisicoes == 13
+    assert cliente.pico <= 2
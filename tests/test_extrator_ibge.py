@@ -0,0 +1,173 @@
+"""
+Testes do extrator de agregados do SIDRA (IBGE), sem acesso à internet.
+
+As respostas da API ficam em tests/fixtures/sidra (no formato da API de
+agregados v3) e são servidas por um cliente HTTP de teste; a extração
+completa também é exercitada contra o servidor simulado de benchmarks/.
+"""
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+import requests
+
+from benchmarks.servidor_simulado import ServidorSimulado
+from src.dados.armazenamento import ManifestoSeries, carregar_serie
+from src.dados.extratores.cliente_http import ClienteHTTP
+from src.dados.extratores.ibge import (
+    ExtratorIBGE, converter_periodos_sidra, converter_valores_sidra, formatar_periodo_sidra
+)
+
+DIRETORIO_FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures", "sidra")
+
+DESEMPREGO = {"id": 6381, "variavel": 4099, "nivel_geografico": "n1", "localidade": "1",
+              "tipo_periodo": "trimestre_movel"}
+PIB = {"id": 1846, "variavel": 585, "classificacao": "11255[90707]", "nivel_geografico": "n1",
+       "localidade": "1", "tipo_periodo": "trimestre"}
+
+
+def ler_fixture(nome):
+    with open(os.path.join(DIRETORIO_FIXTURES, nome), "rb") as f:
+        return f.read()
+
+
+class ClienteFixture:
+    """Cliente HTTP de teste: responde com o conteúdo de uma fixture e registra as requisições."""
+
+    def __init__(self, status=200, fixture=None):
+        self.status = status
+        self.conteudo = ler_fixture(fixture) if fixture else b"{}"
+        self.requisicoes = []
+
+    def obter(self, url, params=None, timeout=None):
+        self.requisicoes.append((url, params))
+        resposta = requests.Response()
+        resposta.status_code = self.status
+        resposta.url = url
+        resposta._content = self.conteudo
+        return resposta
+
+
+def extrator_com(tmp_path, cliente):
+    return ExtratorIBGE(str(tmp_path), cliente_http=cliente)
+
+
+def test_periodos_mensais_e_trimestre_movel_usam_o_mes():
+    codigos = ["202301", "202312", "202313", "202300", "2023", "abcdef", ""]
+    esperado = np.array(["2023-01-01", "2023-12-01", "NaT", "NaT", "NaT", "NaT", "NaT"], dtype="datetime64[D]")
+    np.testing.assert_array_equal(converter_periodos_sidra(codigos, "mensal"), esperado)
+    np.testing.assert_array_equal(converter_periodos_sidra(codigos, "trimestre_movel"), esperado)
+
+
+def test_periodos_trimestrais_usam_o_primeiro_mes_do_trimestre():
+    codigos = ["202301", "202302", "202303", "202304", "202305", "202312"]
+    esperado = np.array(["2023-01-01", "2023-04-01", "2023-07-01", "2023-10-01", "NaT", "NaT"],
+                        dtype="datetime64[D]")
+    np.testing.assert_array_equal(converter_periodos_sidra(codigos, "trimestre"), esperado)
+
+
+def test_tipo_de_periodo_desconhecido():
+    with pytest.raises(ValueError):
+        converter_periodos_sidra(["202301"], "anual")
+
+
+def test_formatar_periodo_inverte_a_conversao():
+    data = pd.Timestamp("2023-08-15").date()
+    assert formatar_periodo_sidra(data, "trimestre") == "202303"
+    assert formatar_periodo_sidra(data, "trimestre_movel") == "202308"
+    assert formatar_periodo_sidra(data, "mensal") == "202308"
+
+
+def test_marcadores_de_valor_indisponivel_viram_nan():
+    valores = converter_valores_sidra(["7.4", "-", "..", "...", "X", "", None, "2560940"])
+    np.testing.assert_array_equal(np.isnan(valores), [False, True, True, True, True, True, True, False])
+    assert valores[0] == 7.4 and valores[-1] == 2560940.0
+
+
+def test_busca_le_a_serie_aninhada_da_resposta(tmp_path):
+    cliente = ClienteFixture(fixture="pib_1846.json")
+    serie = extrator_com(tmp_path, cliente).buscar_dados_agregado(PIB, "202201", "202304")
+
+    esperado = json.loads(ler_fixture("pib_1846.json"))[0]["resultados"][0]["series"][0]["serie"]
+    assert serie == esperado
+
+    url, params = cliente.requisicoes[0]
+    assert url.endswith("/agregados/1846/periodos/202201-202304/variaveis/585")
+    assert params == {"localidades": "N1[1]", "classificacao": "11255[90707]"}
+
+
+def test_busca_sem_classificacao_nao_envia_o_parametro(tmp_path):
+    cliente = ClienteFixture(fixture="desemprego_6381.json")
+    extrator_com(tmp_path, cliente).buscar_dados_agregado(DESEMPREGO, "202301", "202312")
+    assert cliente.requisicoes[0][1] == {"localidades": "N1[1]"}
+
+
+def test_busca_404_devolve_serie_vazia(tmp_path):
+    assert extrator_com(tmp_path, ClienteFixture(status=404)).buscar_dados_agregado(PIB, "202301", "202304") == {}
+
+
+def test_busca_sem_resultados_devolve_serie_vazia(tmp_path):
+    cliente = ClienteFixture(fixture="sem_resultados.json")
+    assert extrator_com(tmp_path, cliente).buscar_dados_agregado(DESEMPREGO, "202301", "202312") == {}
+
+
+@pytest.mark.parametrize("cliente", [
+    ClienteFixture(status=500, fixture="pib_1846.json"),
+    ClienteFixture(fixture="inesperada.json")
+], ids=["erro_http", "resposta_inesperada"])
+def test_busca_com_erro_devolve_none(tmp_path, cliente):
+    assert extrator_com(tmp_path, cliente).buscar_dados_agregado(PIB, "202301", "202304") is None
+
+
+def test_extracao_do_trimestre_movel_descarta_marcadores(tmp_path):
+    extrator = extrator_com(tmp_path, ClienteFixture(fixture="desemprego_6381.json"))
+    assert extrator._extrair_agregado("desemprego", DESEMPREGO, pd.Timestamp("2023-01-01").date(),
+                                      pd.Timestamp("2023-12-31").date())
+
+    df = carregar_serie("desemprego", [str(tmp_path)])
+    meses = [f"2023-{mes:02d}-01" for mes in range(1, 13) if mes not in (10, 11)]
+    pd.testing.assert_series_equal(df["data"], pd.Series(pd.to_datetime(meses), name="data"), check_dtype=False)
+    assert df["valor"].iloc[-1] == 7.4
+
+
+def test_extracao_trimestral_descarta_marcadores(tmp_path):
+    extrator = extrator_com(tmp_path, ClienteFixture(fixture="pib_1846.json"))
+    assert extrator._extrair_agregado("pib", PIB, pd.Timestamp("2022-01-01").date(),
+                                      pd.Timestamp("2023-12-31").date())
+
+    df = carregar_serie("pib", [str(tmp_path)])
+    datas = ["2022-01-01", "2022-04-01", "2022-07-01", "2022-10-01", "2023-01-01", "2023-04-01"]
+    assert df["data"].dt.strftime("%Y-%m-%d").tolist() == datas
+    assert df["valor"].tolist() == [2313450.0, 2470712.0, 2543993.0, 2525519.0, 2560940.0, 2651460.0]
+
+
+def test_extracao_404_sem_dados_armazenados_falha(tmp_path):
+    extrator = extrator_com(tmp_path, ClienteFixture(status=404))
+    assert not extrator._extrair_agregado("pib", PIB, pd.Timestamp("2023-01-01").date(),
+                                          pd.Timestamp("2023-12-31").date())
+
+
+def test_extracao_completa_contra_o_servidor_simulado(tmp_path):
+    with ServidorSimulado(latencia=0) as servidor, ClienteHTTP(requisicoes_por_segundo=0) as cliente:
+        extrator = ExtratorIBGE(str(tmp_path), cliente_http=cliente)
+        extrator.url_base = servidor.url_sidra
+        extrator.agregados = {"desemprego": DESEMPREGO, "pib": PIB}
+
+        resultados = extrator.extrair_todos_agregados(dias_retroativos=3 * 365, incremental=False)
+        assert resultados == {"desemprego": True, "pib": True}
+        assert sorted(extrator.series_alteradas) == ["desemprego", "pib"]
+
+        pib = carregar_serie("pib", [str(tmp_path)])
+        assert set(pib["data"].dt.month) <= {1, 4, 7, 10}
+        desemprego = carregar_serie("desemprego", [str(tmp_path)])
+        assert desemprego["data"].diff().dropna().dt.days.between(28, 31).all()
+
+        manifesto = ManifestoSeries(str(tmp_path))
+        assert manifesto.obter("pib")["linhas"] == len(pib)
+
+        # Repetir a extração não altera nenhuma série
+        assert extrator.extrair_todos_agregados(dias_retroativos=3 * 365, incremental=True) == resultados
+        assert extrator.series_alteradas == []
@@ -0,0 +1,80 @@
+"""
+Testes do repositório de previsões pré-calculadas.
+"""
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from src.dados.processadores.repositorio_previsoes import RepositorioPrevisoes, recortar_componentes
+
+PARAMETROS = {"sazonalidade_anual": True, "modo_sazonalidade": "additive", "escala_prior_pontos_mudanca": 0.05}
+HISTORICO = 48
+HORIZONTE = 24
+
+
+def criar_previsao():
+    ds = pd.date_range("2020-01-01", periods=HISTORICO + HORIZONTE, freq="MS").astype("datetime64[ns]")
+    yhat = np.linspace(10, 20, len(ds))
+    return pd.DataFrame({"ds": ds, "yhat": yhat, "yhat_lower": yhat - 1, "yhat_upper": yhat + 1})
+
+
+def criar_componentes(previsao):
+    """Gráfico com a estrutura de plot_components_plotly: tendência por data e perfil anual."""
+    fig = make_subplots(rows=2, cols=1)
+    fig.add_trace(go.Scatter(x=previsao["ds"], y=previsao["yhat"], name="trend"), row=1, col=1)
+    ano = pd.date_range("2017-01-01", periods=365, freq="D")
+    fig.add_trace(go.Scatter(x=ano, y=np.sin(np.arange(365) / 58), name="yearly"), row=2, col=1)
+    margem = (previsao["ds"].max() - previsao["ds"].min()) * 0.05
+    fig.update_xaxes(range=[previsao["ds"].min() - margem, previsao["ds"].max() + margem], row=1, col=1)
+    return fig
+
+
+def test_recorte_da_tendencia_igual_ao_grafico_do_horizonte_menor():
+    completa = criar_previsao()
+    linhas = HISTORICO + 6
+
+    recortado = recortar_componentes(criar_componentes(completa), len(completa), linhas)
+    esperado = criar_componentes(completa.iloc[:linhas])
+
+    tendencia, anual = recortado.data
+    assert len(tendencia.x) == linhas
+    np.testing.assert_array_equal(tendencia.y, esperado.data[0].y)
+    assert pd.Timestamp(tendencia.x[-1]) == completa["ds"].iloc[linhas - 1]
+    assert [pd.Timestamp(limite) for limite in recortado.layout.xaxis.range] == \
+        [pd.Timestamp(limite) for limite in esperado.layout.xaxis.range]
+    # O perfil sazonal não depende do horizonte
+    assert len(anual.x) == 365
+
+
+def test_recorte_nao_altera_o_grafico_original():
+    completa = criar_previsao()
+    original = criar_componentes(completa)
+
+    recortar_componentes(original, len(completa), HISTORICO + 6)
+    assert len(original.data[0].x) == len(completa)
+    assert recortar_componentes(original, len(completa), len(completa)) is original
+
+
+def test_obter_recorta_previsao_e_componentes(tmp_path):
+    repositorio = RepositorioPrevisoes(str(tmp_path))
+    completa = criar_previsao()
+    assert repositorio.salvar("ipca", PARAMETROS, "hash", completa, HORIZONTE, criar_componentes(completa))
+
+    resultado = repositorio.obter("ipca", PARAMETROS, "hash", 6)
+
+    assert len(resultado["previsao"]) == HISTORICO + 6
+    tendencia = resultado["componentes"].data[0]
+    assert len(tendencia.x) == HISTORICO + 6
+    assert pd.Timestamp(tendencia.x[-1]) == resultado["previsao"]["ds"].iloc[-1]
+
+
+def test_obter_rejeita_dados_diferentes_ou_horizonte_maior(tmp_path):
+    repositorio = RepositorioPrevisoes(str(tmp_path))
+    completa = criar_previsao()
+    repositorio.salvar("ipca", PARAMETROS, "hash", completa, HORIZONTE)
+
+    assert repositorio.obter("ipca", PARAMETROS, "outro_hash", 6) is None
+    assert repositorio.obter("ipca", PARAMETROS, "hash", HORIZONTE + 1) is None
+    assert repositorio.obter("ipca", PARAMETROS, "hash", HORIZONTE)["componentes"] is None